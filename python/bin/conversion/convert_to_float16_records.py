@@ -0,0 +1,60 @@
+import os
+import argparse
+import time
+import numpy as np
+import tensorflow as tf
+
+
+parser = argparse.ArgumentParser(description='Convert the data feature of tfrecords files to half precision raw bytes. '
+                                             'Other features are copied as they are.')
+parser.add_argument('input',
+                    help="Path to file which should contain full paths of all the tfrecords files on separate lines")
+parser.add_argument('output', help="Path where to produce output files")
+parser.add_argument('--num_data_dims', default=9, type=int, help="Number of features of every row")
+parser.add_argument('--seeds_in_last_row', default=False, action='store_true',
+                    help="The last row of data holds the seed indices (fixed_num_entries_reader_seeds* formats). "
+                         "They are written to a separate int64 seed_indices feature since they aren't exact in "
+                         "half precision.")
+args = parser.parse_args()
+
+with open(args.input) as f:
+    content = f.readlines()
+file_paths = [x.strip() for x in content]
+
+gzip_options = tf.python_io.TFRecordOptions(tf.python_io.TFRecordCompressionType.GZIP)
+
+
+def _convert_entry(serialized, writer):
+    example = tf.train.Example.FromString(serialized)
+    data = np.array(example.features.feature['data'].float_list.value, dtype=np.float32)
+
+    if args.seeds_in_last_row:
+        seed_indices = data.reshape((-1, args.num_data_dims))[-1, 0:2].astype(np.int64)
+        example.features.feature['seed_indices'].CopyFrom(
+            tf.train.Feature(int64_list=tf.train.Int64List(value=seed_indices)))
+
+    example.features.feature['data'].CopyFrom(
+        tf.train.Feature(bytes_list=tf.train.BytesList(value=[data.astype(np.float16).tobytes()])))
+    writer.write(example.SerializeToString())
+
+
+def convert_file(input_file):
+    just_file_name = os.path.splitext(os.path.split(input_file)[1])[0]
+    output_file = os.path.join(args.output, just_file_name + '_float16.tfrecords')
+    writer = tf.python_io.TFRecordWriter(output_file, options=gzip_options)
+
+    num_events = 0
+    for serialized in tf.python_io.tf_record_iterator(input_file, options=gzip_options):
+        _convert_entry(serialized, writer)
+        num_events += 1
+
+    writer.close()
+    print("Written", num_events, "events to", output_file)
+
+
+start = time.time()
+for item in file_paths:
+    convert_file(item)
+end = time.time()
+
+print("It took", end - start, "seconds")
@@ -0,0 +1,121 @@
+import os
+import argparse
+import time
+import numpy as np
+import tensorflow as tf
+from readers.geometry_registry import load_cell_columns, save_cell_columns
+
+
+parser = argparse.ArgumentParser(description='Convert dense clustering tfrecords to the ragged format, which stores only '
+                                             'the active rows of every event')
+parser.add_argument('input',
+                    help="Path to file which should contain full paths of all the tfrecords files on separate lines")
+parser.add_argument('output', help="Path where to produce output files")
+parser.add_argument('--max_entries', default=2102, type=int, help="Max entries of the input format")
+parser.add_argument('--num_data_dims', default=9, type=int, help="Number of features of every row")
+parser.add_argument('--input_format', default='fixed_num_entries_seeds',
+                    choices=['fixed_num_entries_seeds', 'data_and_num_entries'],
+                    help="fixed_num_entries_seeds: (max_entries+1) rows with the seed indices in the last row. "
+                         "data_and_num_entries: max_entries rows and a num_entries feature")
+parser.add_argument('--energy_index', default=0, type=int,
+                    help="Column which is checked for zero to find inactive rows (fixed_num_entries_seeds only)")
+parser.add_argument('--geometry', default=None,
+                    help="Name of the geometry of the input, e.g. beta_calo. The columns of the cells which don't "
+                         "depend on the event are stored under this name in the geometry registry, so that the "
+                         "reader can restore the inactive rows (fixed_num_entries_seeds only)")
+parser.add_argument('--cell_columns', default='1,2,3,4,5,6',
+                    help="Comma separated columns which only depend on the cell, e.g. layer, position and size")
+parser.add_argument('--geometry_directory', default=None,
+                    help="Directory of the geometry registry, by default readers/geometry_tables")
+args = parser.parse_args()
+
+if args.input_format == 'fixed_num_entries_seeds' and args.geometry is None:
+    parser.error("--geometry is needed for fixed_num_entries_seeds, the reader restores the inactive rows from it")
+cell_columns = [int(x) for x in args.cell_columns.split(',')]
+
+with open(args.input) as f:
+    content = f.readlines()
+file_paths = [x.strip() for x in content]
+
+gzip_options = tf.python_io.TFRecordOptions(tf.python_io.TFRecordCompressionType.GZIP)
+
+
+def _write_entry(data, cell_indices, seed_indices, writer):
+    feature = dict()
+    feature['data'] = tf.train.Feature(float_list=tf.train.FloatList(value=data.astype(np.float32).flatten()))
+    feature['num_entries'] = tf.train.Feature(int64_list=tf.train.Int64List(value=[len(data)]))
+    if cell_indices is not None:
+        feature['cell_indices'] = tf.train.Feature(
+            int64_list=tf.train.Int64List(value=cell_indices.astype(np.int64).flatten()))
+    if seed_indices is not None:
+        feature['seed_indices'] = tf.train.Feature(
+            int64_list=tf.train.Int64List(value=seed_indices.astype(np.int64).flatten()))
+
+    example = tf.train.Example(features=tf.train.Features(feature=feature))
+    writer.write(example.SerializeToString())
+
+
+def _read_dense_entry(serialized):
+    example = tf.train.Example.FromString(serialized)
+    data = np.array(example.features.feature['data'].float_list.value, dtype=np.float32)
+    data = data.reshape((-1, args.num_data_dims))
+
+    if args.input_format == 'fixed_num_entries_seeds':
+        seed_indices = data[-1, 0:2].astype(np.int64)
+        data = data[0:-1]
+        cell_indices = np.nonzero(data[:, args.energy_index])[0]
+        return data[cell_indices], cell_indices, seed_indices
+    else:
+        num_entries = int(example.features.feature['num_entries'].int64_list.value[0])
+        return data[0:num_entries], None, None
+
+
+def _store_cell_columns(input_file):
+    """
+    Stores the cell columns of the first event of the file in the geometry registry, or checks them against the stored
+    ones if another file already stored them
+    """
+    for serialized in tf.python_io.tf_record_iterator(input_file, options=gzip_options):
+        example = tf.train.Example.FromString(serialized)
+        data = np.array(example.features.feature['data'].float_list.value, dtype=np.float32)
+        values = data.reshape((-1, args.num_data_dims))[0:-1, cell_columns]
+        try:
+            columns, stored_values = load_cell_columns(args.geometry, args.geometry_directory)
+        except IOError:
+            print("Storing cell columns", cell_columns, "of", args.geometry, "from", input_file)
+            save_cell_columns(args.geometry, cell_columns, values, args.geometry_directory)
+            return
+        if list(columns) != cell_columns or stored_values.shape != values.shape or \
+                not np.allclose(stored_values, values):
+            raise ValueError("The cell columns of %s don't match the ones stored for %s" % (input_file, args.geometry))
+        return
+
+
+def convert_file(input_file):
+    just_file_name = os.path.splitext(os.path.split(input_file)[1])[0]
+    output_file = os.path.join(args.output, just_file_name + '_ragged.tfrecords')
+    writer = tf.python_io.TFRecordWriter(output_file, options=gzip_options)
+    if args.input_format == 'fixed_num_entries_seeds':
+        _store_cell_columns(input_file)
+
+    num_events = 0
+    num_rows_in = 0
+    num_rows_out = 0
+    for serialized in tf.python_io.tf_record_iterator(input_file, options=gzip_options):
+        data, cell_indices, seed_indices = _read_dense_entry(serialized)
+        _write_entry(data, cell_indices, seed_indices, writer)
+        num_events += 1
+        num_rows_in += args.max_entries
+        num_rows_out += len(data)
+
+    writer.close()
+    print("Written", num_events, "events to", output_file, "- kept %.2f%% of the rows" %
+          (100. * num_rows_out / max(num_rows_in, 1)))
+
+
+start = time.time()
+for item in file_paths:
+    convert_file(item)
+end = time.time()
+
+print("It took", end - start, "seconds")
@@ -36,6 +36,7 @@ import gzip
 import pickle
 import configparser as cp
 from libs.plots import plot_clustering, plot_clustering_4
+from models.clustering_loss import permutation_losses_numpy, shower_permutations
 from matplotlib import cm
 from matplotlib.colors import LogNorm
 import matplotlib.backends.backend_pdf
@@ -48,6 +49,7 @@ spatial_features_indices = tuple([int(x) for x in (config['input_spatial_feature
 spatial_features_local_indices = tuple([int(x) for x in (config['input_spatial_features_local_indices']).split(',')])
 other_features_indices = tuple([int(x) for x in (config['input_other_features_indices']).split(',')])
 target_indices = tuple([int(x) for x in (config['target_indices']).split(',')])
+permutations = shower_permutations(2)
 
 
 def get_mean_variance_histograms(energy_values, histogram_values_resolution):
@@ -285,8 +287,11 @@ def do_plots(swap=True):
 
                     num_entries = float(np.asscalar(num_entries))
 
-                    loss_1 = float(np.sum((output[:,0] - targets[:,0])**2 * np.sqrt(energy*targets[:,0])) / np.sum(np.sqrt(energy*targets[:,0])) + np.sum((output[:, 1] - targets[:, 1]) ** 2 * np.sqrt(energy * targets[:, 1])) / np.sum(np.sqrt(energy * targets[:, 1])))
-                    loss_2 = float(np.sum((output[:,0] - targets[:,1])**2 * np.sqrt(energy*targets[:,1])) / np.sum(np.sqrt(energy*targets[:,1])) + np.sum((output[:, 1] - targets[:, 0]) ** 2 * np.sqrt(energy * targets[:, 0])) / np.sum(np.sqrt(energy * targets[:, 0])))
+                    # Loss of every assignment of output to target showers, the identity first
+                    losses = permutation_losses_numpy(output, targets, np.ones_like(energy),
+                                                      np.sqrt(energy[:, np.newaxis] * targets),
+                                                      per_shower_normalisation=True)
+                    best_permutation = int(np.argmin(losses))
 
                     truth_energy_sum_1 = np.sum(targets[:, 0] * energy)
                     truth_energy_sum_2 = np.sum(targets[:, 1] * energy)
@@ -295,10 +300,8 @@ def do_plots(swap=True):
                     if max(truth_energy_sum_2, truth_energy_sum_1) < 70000:
                         total_events += 1
                         if swap:
-                            if loss_1 < loss_2:
-                                sorted_target = targets
-                            else:
-                                sorted_target = 1 - targets
+                            sorted_target = targets[:, permutations[best_permutation]]
+                            if best_permutation != 0:
                                 swapped_events += 1
                         else:
                             sorted_target = targets
@@ -322,9 +325,9 @@ def do_plots(swap=True):
                         position_values.append(position_shower_2)
 
                         if swap:
-                            loss_values.append(min(loss_1, loss_2))
+                            loss_values.append(float(losses[best_permutation]))
                         else:
-                            loss_values.append(loss_1)
+                            loss_values.append(float(losses[0]))
 
                         # a = plt.figure(0)
                         # a.suptitle('Output')
@@ -332,7 +335,7 @@ def do_plots(swap=True):
                         # b.suptitle('GT')
                         # plot_clustering(spatial=spatial, energy=energy, prediction=output, fig=a)
                         # plot_clustering(spatial=spatial, energy=energy, prediction=sorted_target, fig=b)
-                        # print("%05.5f %05.5f %05.5f %05.5f" % (loss_1, loss_2, perf1, perf2))
+                        # print("%05.5f %05.5f %05.5f %05.5f" % (losses[0], losses[1], perf1, perf2))
                         # plt.show()
                         if show_3d_figures:
                             print(vv)
@@ -0,0 +1,42 @@
+import argparse
+from readers.geometry_registry import compute_binning, synthetic_geometry, save_binning
+
+
+parser = argparse.ArgumentParser(description='Compute the binning of a calorimeter geometry, i.e. the (x bin, y bin, '
+                                             'layer, index in bin) of every cell, and store it in the geometry '
+                                             'registry (readers/geometry_tables) so that the binning models can use '
+                                             'it by name')
+parser.add_argument('name', help="Name of the binning, e.g. beta_calo_16")
+parser.add_argument('--input', default=None, help="Path to a root file to take the cell positions from")
+parser.add_argument('--max_entries', default=2102, type=int, help="Number of cells in the root file")
+parser.add_argument('--synthetic', default=None,
+                    help="Comma separated number of cells in x, in y, number of layers and cell width of a "
+                         "synthetic geometry to use instead of a root file, e.g. 16,16,20,1.5")
+parser.add_argument('--shape', default='16,16,20,4',
+                    help="Comma separated number of x bins, y bins, layers and entries per bin")
+parser.add_argument('--half_x', default=150., type=float, help="Half of the width of the binned range in x")
+parser.add_argument('--half_y', default=150., type=float, help="Half of the width of the binned range in y")
+parser.add_argument('--output', default=None, help="Directory of the binnings, by default readers/geometry_tables")
+args = parser.parse_args()
+
+if (args.input is None) == (args.synthetic is None):
+    raise ValueError("Give either --input or --synthetic")
+
+if args.input is not None:
+    import sparse_hgcal
+
+    branches = ['rechit_x', 'rechit_y', 'rechit_layer']
+    types = ['float64', 'float64', 'float64']
+    max_size = [args.max_entries for _ in branches]
+
+    # The cells are in the same order in every event, so the first one is enough
+    nparray, _ = sparse_hgcal.read_np_array(args.input, 'B4', branches, types, max_size)
+    cell_x, cell_y, cell_layer = nparray[0][0], nparray[1][0], nparray[2][0]
+else:
+    n_x, n_y, n_layers, cell_size = args.synthetic.split(',')
+    cell_x, cell_y, cell_layer = synthetic_geometry(int(n_x), int(n_y), int(n_layers), float(cell_size))
+
+shape = tuple([int(x) for x in args.shape.split(',')])
+table = compute_binning(cell_x, cell_y, cell_layer, shape, args.half_x, args.half_y)
+
+print("Written", save_binning(args.name, table, shape, args.output))
@@ -0,0 +1,51 @@
+import argparse
+import numpy as np
+from readers.geometry_registry import compute_neighbor_table, save_neighbor_table, load_cell_columns
+
+
+parser = argparse.ArgumentParser(description='Compute the k nearest neighbours tables of a calorimeter geometry and '
+                                             'store them next to its binning in the geometry registry '
+                                             '(readers/geometry_tables), so that models can use them instead of '
+                                             'computing distances in the raw sensor space')
+parser.add_argument('geometry', help="Name of the geometry, e.g. beta_calo")
+parser.add_argument('--input', default=None,
+                    help="Path to a tfrecords file of the fixed sensor order format to take the cell positions from. "
+                         "By default they're taken from the cell columns of the geometry in the registry, see "
+                         "bin/conversion/convert_to_ragged_records.py")
+parser.add_argument('--max_entries', default=2102, type=int, help="Number of cells (--input only)")
+parser.add_argument('--num_data_dims', default=9, type=int, help="Number of features of every row (--input only)")
+parser.add_argument('--seeds_in_last_row', default=True, type=lambda x: x.lower() in ('1', 'true'),
+                    help="Whether the records have an extra last row with the seed indices (--input only)")
+parser.add_argument('--spatial_indices', default='1,2,3',
+                    help="Columns of the input data which the distances are computed in, same as "
+                         "input_spatial_features_indices of the models which use the tables")
+parser.add_argument('--k', default='10,16,18,24,32,40', help="Comma separated numbers of neighbours")
+parser.add_argument('--directory', default=None,
+                    help="Directory of the geometry registry, by default readers/geometry_tables")
+args = parser.parse_args()
+
+spatial_indices = [int(x) for x in args.spatial_indices.split(',')]
+
+if args.input is None:
+    columns, values = load_cell_columns(args.geometry, args.directory)
+    missing = [x for x in spatial_indices if x not in columns]
+    if len(missing) != 0:
+        raise ValueError("The cell columns of %s don't have the columns %s" % (args.geometry, str(missing)))
+    cell_positions = values[:, [columns.index(x) for x in spatial_indices]]
+else:
+    import tensorflow as tf
+
+    gzip_options = tf.python_io.TFRecordOptions(tf.python_io.TFRecordCompressionType.GZIP)
+    serialized = next(tf.python_io.tf_record_iterator(args.input, options=gzip_options))
+    example = tf.train.Example.FromString(serialized)
+    data = np.array(example.features.feature['data'].float_list.value, dtype=np.float32)
+    data = data.reshape((-1, args.num_data_dims))
+    if args.seeds_in_last_row:
+        data = data[0:-1]
+    assert len(data) == args.max_entries
+    cell_positions = data[:, spatial_indices]
+
+for k in [int(x) for x in args.k.split(',')]:
+    path = save_neighbor_table(args.geometry, compute_neighbor_table(cell_positions, k), spatial_indices,
+                               args.directory)
+    print("Written", path)
@@ -0,0 +1,65 @@
+import argparse
+import time
+import numpy as np
+import tensorflow as tf
+from ops.neighbors import nearest_neighbor_matrix_2, nearest_neighbor_matrix_grid
+
+
+parser = argparse.ArgumentParser(description='Compare the brute force and the grid k nearest neighbours search for '
+                                             'increasing number of vertices to find the crossover point')
+parser.add_argument('--batch_size', default=20, type=int, help="Batch size")
+parser.add_argument('--num_spatial', default=3, type=int, help="Number of spatial dimensions (at most 4)")
+parser.add_argument('--k', default=10, type=int, help="Number of neighbours")
+parser.add_argument('--cell_capacity', default=32, type=int, help="Cell capacity of the grid search")
+parser.add_argument('--num_vertices', default='250,500,1000,2102,4000,8000',
+                    help="Comma separated numbers of vertices to try")
+parser.add_argument('--distribution', default='uniform', choices=['uniform', 'showers'],
+                    help="uniform: vertices spread over a box, showers: a few gaussian blobs with a uniform "
+                         "background (more cells are cut to the capacity, so the fallback is taken more often)")
+parser.add_argument('--repetitions', default=10, type=int, help="Number of timed runs per configuration")
+args = parser.parse_args()
+
+
+def make_vertices(num_vertices):
+    shape = (args.batch_size, num_vertices, args.num_spatial)
+    if args.distribution == 'uniform':
+        return np.random.uniform(-1, 1, size=shape).astype(np.float32)
+    vertices = np.random.uniform(-1, 1, size=shape)
+    centers = np.random.uniform(-0.5, 0.5, size=(args.batch_size, 3, args.num_spatial))
+    in_shower = np.random.randint(0, 4, size=(args.batch_size, num_vertices))
+    for i in range(3):
+        selected = in_shower == i
+        vertices[selected] = np.random.normal(0, 0.1, size=(np.sum(selected), args.num_spatial)) + \
+                             np.repeat(centers[:, i:i+1, :], num_vertices, axis=1)[selected]
+    return vertices.astype(np.float32)
+
+
+def time_op(sess, op, placeholder, vertices):
+    sess.run(op, feed_dict={placeholder: vertices})
+    start = time.time()
+    for _ in range(args.repetitions):
+        sess.run(op, feed_dict={placeholder: vertices})
+    return (time.time() - start) / args.repetitions
+
+
+crossover = None
+print("%10s %15s %15s %10s" % ("vertices", "brute force [s]", "grid [s]", "speedup"))
+for num_vertices in [int(x) for x in args.num_vertices.split(',')]:
+    tf.reset_default_graph()
+    placeholder = tf.placeholder(dtype=tf.float32, shape=[args.batch_size, num_vertices, args.num_spatial])
+    brute_force, _ = nearest_neighbor_matrix_2(placeholder, args.k)
+    grid, _ = nearest_neighbor_matrix_grid(placeholder, args.k, cell_capacity=args.cell_capacity)
+
+    vertices = make_vertices(num_vertices)
+    with tf.Session() as sess:
+        time_brute_force = time_op(sess, brute_force, placeholder, vertices)
+        time_grid = time_op(sess, grid, placeholder, vertices)
+
+    print("%10d %15.5f %15.5f %10.2f" % (num_vertices, time_brute_force, time_grid, time_brute_force / time_grid))
+    if crossover is None and time_grid < time_brute_force:
+        crossover = num_vertices
+
+if crossover is None:
+    print("The grid search wasn't faster for any of the tried numbers of vertices")
+else:
+    print("The grid search is faster from", crossover, "vertices on")
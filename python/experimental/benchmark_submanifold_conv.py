@@ -0,0 +1,72 @@
+import argparse
+import time
+import numpy as np
+import tensorflow as tf
+from ops.binning import bin_vertices, unbin_vertices, binned_conv3d, active_voxels
+from readers.geometry_registry import load_binning
+
+
+parser = argparse.ArgumentParser(description='Compare the dense 3-D convolutions of the binning models with the '
+                                             'submanifold convolutions on the active voxels of their binning')
+parser.add_argument('--batch_size', default=20, type=int, help="Batch size")
+parser.add_argument('--binnings', default='small_calo,beta_calo_16,beta_calo_20',
+                    help="Comma separated names of the binnings to try")
+parser.add_argument('--num_features', default=4, type=int, help="Number of features per cell")
+parser.add_argument('--backward', action='store_true', help="Time the gradients of the convolutions as well")
+parser.add_argument('--repetitions', default=10, type=int, help="Number of timed runs per configuration")
+args = parser.parse_args()
+
+
+# The stride 1 stack of binning_cluster_beta and binning_seed_finder_alpha, (filters, kernel size)
+layers = [(50, [1, 1, 1]), (50, [1, 1, 1]), (50, [1, 1, 1])] + [(32, [3, 3, 1]), (32, [1, 1, 5])] * 5 + \
+         [(32, [2, 2, 1]), (48, [1, 1, 3])]
+
+
+def build(vertices, binning, voxel_binning):
+    x = bin_vertices(vertices, binning, active_voxels_only=voxel_binning is not None)
+    for filters, kernel_size in layers:
+        x = binned_conv3d(x, filters, kernel_size, activation=tf.nn.relu, binning=voxel_binning)
+    output = unbin_vertices(x, binning, active_voxels_only=voxel_binning is not None)
+    if args.backward:
+        return tf.gradients(tf.reduce_sum(output), tf.trainable_variables())
+    return output
+
+
+def count_flops(num_sites, num_channels):
+    flops = 0
+    for filters, kernel_size in layers:
+        flops += 2 * args.batch_size * num_sites * int(np.prod(kernel_size)) * num_channels * filters
+        num_channels = filters
+    return flops
+
+
+def time_op(sess, op, placeholder, vertices):
+    sess.run(op, feed_dict={placeholder: vertices})
+    start = time.time()
+    for _ in range(args.repetitions):
+        sess.run(op, feed_dict={placeholder: vertices})
+    return (time.time() - start) / args.repetitions
+
+
+print("%15s %8s %8s %12s %12s %10s %10s %10s" % ("binning", "voxels", "active", "dense GFLOP", "sparse GFLOP",
+                                                 "dense [s]", "sparse [s]", "speedup"))
+for binning in args.binnings.split(','):
+    table, shape = load_binning(binning)
+    num_voxels = shape[0] * shape[1] * shape[2]
+    num_active = len(active_voxels(binning))
+    num_channels = shape[3] * args.num_features
+
+    times = []
+    for voxel_binning in [None, binning]:
+        tf.reset_default_graph()
+        placeholder = tf.placeholder(dtype=tf.float32, shape=[args.batch_size, len(table), args.num_features])
+        op = build(placeholder, binning, voxel_binning)
+
+        vertices = np.random.normal(size=(args.batch_size, len(table), args.num_features)).astype(np.float32)
+        with tf.Session() as sess:
+            sess.run(tf.global_variables_initializer())
+            times.append(time_op(sess, op, placeholder, vertices))
+
+    print("%15s %8d %8d %12.3f %12.3f %10.5f %10.5f %10.2f" % (
+        binning, num_voxels, num_active, count_flops(num_voxels, num_channels) / 1e9,
+        count_flops(num_active, num_channels) / 1e9, times[0], times[1], times[0] / times[1]))
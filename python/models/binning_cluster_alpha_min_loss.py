@@ -2,10 +2,13 @@ import tensorflow as tf
 from models.sparse_conv_clustering_base import SparseConvClusteringBase
 from ops.sparse_conv import *
 from models.switch_model import SwitchModel
-import readers.indices_calculated as ic
+from ops.binning import bin_vertices, unbin_vertices, binned_conv3d, voxel_binning
+from models.clustering_loss import masked_permutation_losses, sort_targets, shower_responses
 
 
 class BinningClusteringMinLoss(SparseConvClusteringBase):
+    # The cells are binned by their index in the fixed geometry
+    supports_hit_packing = False
 
     def __init__(self, n_space, n_space_local, n_others, n_target_dim, batch_size, max_entries, learning_rate=0.0001):
         super(BinningClusteringMinLoss, self).__init__(n_space, n_space_local, n_others, n_target_dim, batch_size, max_entries,
@@ -13,17 +16,11 @@ class BinningClusteringMinLoss(SparseConvClusteringBase):
         self.weight_weights = []
 
     def construct_conversion_ops(self):
-        batch_indices = np.arange(self.batch_size)
-        batch_indices = np.tile(batch_indices[..., np.newaxis], reps=(1, 2679))[..., np.newaxis]
-        indexing_array = \
-        np.concatenate((ic.x_bins[:, np.newaxis], ic.y_bins[:, np.newaxis], ic.l_bins[:, np.newaxis], ic.d_indices[:, np.newaxis]),
-                       axis=1)[np.newaxis, ...]
-        indexing_array = np.tile(indexing_array, reps=[self.batch_size, 1, 1])
-        self.indexing_array = np.concatenate((batch_indices, indexing_array), axis=2).astype(np.int64)
+        self.binning = 'small_calo'
+        self.voxel_binning = voxel_binning(self.binning)
 
         values = tf.concat((self._placeholder_other_features, self._placeholder_space_features_local), axis=-1)
-        result = tf.scatter_nd(self.indexing_array, values, shape=(self.batch_size, 8, 8, 25, 16, 4))
-        result = tf.reshape(result, [self.batch_size, 8, 8, 25, 16*4])
+        result = bin_vertices(values, self.binning, active_voxels_only=self.voxel_binning is not None)
 
         return result
 
@@ -44,34 +41,17 @@ class BinningClusteringMinLoss(SparseConvClusteringBase):
 
         energy = self._placeholder_other_features[:, :, 0]
 
-        diff_sq_1 = (self._graph_output[:,:,0:2] - self._placeholder_targets) ** 2 * tf.cast(
-            tf.sequence_mask(num_entries, maxlen=self.max_entries)[:, :,
-            tf.newaxis], tf.float32) * energy[:,:, tf.newaxis]
-        diff_sq_1 = tf.reduce_sum(diff_sq_1, axis=[-1, -2]) / tf.reduce_sum(energy, axis=-1)
-        loss_unreduced_1 = (diff_sq_1 / tf.cast(num_entries, tf.float32)) * tf.cast(
-            num_entries != 0, tf.float32)
+        losses = masked_permutation_losses(self._graph_output[:, :, 0:2], self._placeholder_targets, energy,
+                                           num_entries)
+        sorted_target = sort_targets(self._placeholder_targets, tf.argmin(losses, axis=1))
 
-        diff_sq_2 = (self._graph_output[:,:,0:2] - (1-self._placeholder_targets)) ** 2 * tf.cast(
-            tf.sequence_mask(num_entries, maxlen=self.max_entries)[:, :,
-            tf.newaxis], tf.float32) * energy[:,:, tf.newaxis]
-        diff_sq_2 = tf.reduce_sum(diff_sq_2, axis=[-1, -2]) / tf.reduce_sum(energy, axis=-1)
-        loss_unreduced_2 = (diff_sq_2 / tf.cast(num_entries, tf.float32)) * tf.cast(
-            num_entries != 0, tf.float32)
+        # Responses of the first showers of all events, then of the second ones
+        responses = tf.reshape(tf.transpose(shower_responses(self._graph_output[:, :, 0:2], sorted_target, energy)),
+                               [-1])
 
-        shower_indices = tf.argmin(tf.concat((loss_unreduced_1[:, tf.newaxis], loss_unreduced_2[:, tf.newaxis]), axis=-1), axis=-1)
+        self.mean_resolution, self.variance_resolution = tf.nn.moments(responses, axes=0)
 
-        condition_1 = tf.to_float(tf.equal((tf.to_float(shower_indices)[:, tf.newaxis, tf.newaxis]), 0.0))
-        condition_2 = tf.to_float(tf.equal((tf.to_float(shower_indices)[:, tf.newaxis, tf.newaxis]), 1.0))
-        sorted_target = self._placeholder_targets * condition_1 + (1-self._placeholder_targets) * condition_2
-
-        # + (1-self._placeholder_targets) * tf.cast(shower_indices[:,tf.newaxis,tf.newaxis]==1, tf.float32)
-
-        perf1 = tf.reduce_sum(self._graph_output[:,:,0] * energy, axis=[-1]) / tf.reduce_sum(sorted_target[:,:,0] * energy, axis=[-1])
-        perf2 = tf.reduce_sum(self._graph_output[:,:,1] * energy, axis=[-1]) / tf.reduce_sum(sorted_target[:,:,1] * energy, axis=[-1])
-
-        self.mean_resolution, self.variance_resolution = tf.nn.moments(tf.concat((perf1, perf2), axis=0), axes=0)
-
-        return tf.reduce_mean(tf.minimum(loss_unreduced_1, loss_unreduced_2))
+        return tf.reduce_mean(tf.reduce_min(losses, axis=1))
 
 
     def _compute_output(self):
@@ -90,25 +70,24 @@ class BinningClusteringMinLoss(SparseConvClusteringBase):
         # 8x8x25x64
         x = binned_input
 
-        x = tf.layers.conv3d(0.001 * x, 50, [1, 1, 1], activation=tf.nn.leaky_relu, padding='same')
-        x = tf.layers.conv3d(x, 50, [1, 1, 1], activation=tf.nn.leaky_relu, padding='same')
-        x = tf.layers.conv3d(x, 50, [1, 1, 1], activation=tf.nn.leaky_relu, padding='same')
-        x = tf.layers.conv3d(x, 32, [3, 3, 1], activation=tf.nn.relu, padding='same')
-        x = tf.layers.conv3d(x, 32, [1, 1, 5], activation=tf.nn.relu, padding='same')
-        x = tf.layers.conv3d(x, 32, [3, 3, 1], activation=tf.nn.relu, padding='same')
-        x = tf.layers.conv3d(x, 32, [1, 1, 5], activation=tf.nn.relu, padding='same')
-        x = tf.layers.conv3d(x, 32, [3, 3, 1], activation=tf.nn.relu, padding='same')
-        x = tf.layers.conv3d(x, 32, [1, 1, 5], strides=(1,1,1), activation=tf.nn.relu, padding='same')
-        x = tf.layers.conv3d(x, 32, [3, 3, 1], activation=tf.nn.relu, padding='same')
-        x = tf.layers.conv3d(x, 32, [1, 1, 5], strides=(1,1,1), activation=tf.nn.relu, padding='same')
-        x = tf.layers.conv3d(x, 32, [3, 3, 1], activation=tf.nn.relu, padding='same')
-        x = tf.layers.conv3d(x, 32, [1, 1, 5], strides=(1,1,1), activation=tf.nn.relu, padding='same')
-        x = tf.layers.conv3d(x, 32, [2, 2, 1], activation=tf.nn.relu, padding='same')
-        x = tf.layers.conv3d(x, 48, [1, 1, 3], activation=tf.nn.relu, padding='same')
-
-
-        x = tf.reshape(x, [self.batch_size, 8, 8, 25, 16, 3])
-        output = tf.gather_nd(x, self.indexing_array)
+        x = binned_conv3d(0.001 * x, 50, [1, 1, 1], activation=tf.nn.leaky_relu, binning=self.voxel_binning)
+        x = binned_conv3d(x, 50, [1, 1, 1], activation=tf.nn.leaky_relu, binning=self.voxel_binning)
+        x = binned_conv3d(x, 50, [1, 1, 1], activation=tf.nn.leaky_relu, binning=self.voxel_binning)
+        x = binned_conv3d(x, 32, [3, 3, 1], activation=tf.nn.relu, binning=self.voxel_binning)
+        x = binned_conv3d(x, 32, [1, 1, 5], activation=tf.nn.relu, binning=self.voxel_binning)
+        x = binned_conv3d(x, 32, [3, 3, 1], activation=tf.nn.relu, binning=self.voxel_binning)
+        x = binned_conv3d(x, 32, [1, 1, 5], activation=tf.nn.relu, binning=self.voxel_binning)
+        x = binned_conv3d(x, 32, [3, 3, 1], activation=tf.nn.relu, binning=self.voxel_binning)
+        x = binned_conv3d(x, 32, [1, 1, 5], activation=tf.nn.relu, binning=self.voxel_binning)
+        x = binned_conv3d(x, 32, [3, 3, 1], activation=tf.nn.relu, binning=self.voxel_binning)
+        x = binned_conv3d(x, 32, [1, 1, 5], activation=tf.nn.relu, binning=self.voxel_binning)
+        x = binned_conv3d(x, 32, [3, 3, 1], activation=tf.nn.relu, binning=self.voxel_binning)
+        x = binned_conv3d(x, 32, [1, 1, 5], activation=tf.nn.relu, binning=self.voxel_binning)
+        x = binned_conv3d(x, 32, [2, 2, 1], activation=tf.nn.relu, binning=self.voxel_binning)
+        x = binned_conv3d(x, 48, [1, 1, 3], activation=tf.nn.relu, binning=self.voxel_binning)
+
+
+        output = unbin_vertices(x, self.binning, active_voxels_only=self.voxel_binning is not None)
         output = tf.nn.softmax(output)
 
         self._graph_temp = output
@@ -132,7 +111,7 @@ class BinningClusteringMinLoss(SparseConvClusteringBase):
 
             self._graph_loss = self._get_loss()
 
-            self._graph_optimizer = tf.train.AdamOptimizer(learning_rate=self.learning_rate).minimize(self._graph_loss)
+            self._graph_optimizer = self.get_adam_optimizer().minimize(self._graph_loss)
 
             # Repeating, maybe there is a better way?
             self._graph_summary_loss = tf.summary.scalar('loss', self._graph_loss)
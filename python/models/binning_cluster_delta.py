@@ -2,10 +2,13 @@ import tensorflow as tf
 from models.sparse_conv_clustering_base import SparseConvClusteringBase
 from ops.sparse_conv import *
 from models.switch_model import SwitchModel
-import readers.indices_calculated as ic
+from ops.binning import bin_vertices, unbin_vertices
+from models.clustering_loss import masked_permutation_losses, sort_targets, shower_responses
 
 
 class BinningClusteringDelta(SparseConvClusteringBase):
+    # The cells are binned by their index in the fixed geometry
+    supports_hit_packing = False
 
     def __init__(self, n_space, n_space_local, n_others, n_target_dim, batch_size, max_entries, learning_rate=0.0001):
         super(BinningClusteringDelta, self).__init__(n_space, n_space_local, n_others, n_target_dim, batch_size,
@@ -18,26 +21,13 @@ class BinningClusteringDelta(SparseConvClusteringBase):
         self.homogeneous_calorimeter = homogeneous_calorimeter
 
     def construct_conversion_ops(self):
-        batch_indices = np.arange(self.batch_size)
-        batch_indices = np.tile(batch_indices[..., np.newaxis], reps=(1, 2679))[..., np.newaxis]
-
         if not self.homogeneous_calorimeter:
-            indexing_array = \
-                np.concatenate((ic.x_bins[:, np.newaxis], ic.y_bins[:, np.newaxis], ic.l_bins[:, np.newaxis],
-                                ic.d_indices[:, np.newaxis]),
-                               axis=1)[np.newaxis, ...]
+            self.binning = 'small_calo'
         else :
-            indexing_array = \
-                np.concatenate((ic.x_bins_homog[:, np.newaxis], ic.y_bins_homog[:, np.newaxis], ic.l_bins_homog[:, np.newaxis],
-                                ic.d_indices_homog[:, np.newaxis]),
-                               axis=1)[np.newaxis, ...]
-
-        indexing_array = np.tile(indexing_array, reps=[self.batch_size, 1, 1])
-        self.indexing_array = np.concatenate((batch_indices, indexing_array), axis=2).astype(np.int64)
+            self.binning = 'small_calo_homog'
 
         values = tf.concat((self._placeholder_other_features, self._placeholder_space_features_local), axis=-1)
-        result = tf.scatter_nd(self.indexing_array, values, shape=(self.batch_size, 8, 8, 25, 16, 4))
-        result = tf.reshape(result, [self.batch_size, 8, 8, 25, 16 * 4])
+        result = bin_vertices(values, self.binning)
 
         return result
 
@@ -63,44 +53,22 @@ class BinningClusteringDelta(SparseConvClusteringBase):
         #    energy=energy[:,0:-1]
         #    targets = targets[:,0:-1,:]
 
-        diff_sq_1 = (prediction[:, :, 0:2] - targets) ** 2 * tf.cast(
-            tf.sequence_mask(num_entries, maxlen=self.max_entries)[:, :,
-            tf.newaxis], tf.float32) * sqrt_energy[:, :, tf.newaxis]
-        diff_sq_1 = tf.reduce_sum(diff_sq_1, axis=[-1, -2]) / tf.reduce_sum(sqrt_energy, axis=-1)
-        loss_unreduced_1 = (diff_sq_1 / tf.cast(num_entries, tf.float32)) * tf.cast(
-            num_entries != 0, tf.float32)
-
-        diff_sq_2 = (prediction[:, :, 0:2] - (1 - targets)) ** 2 * tf.cast(
-            tf.sequence_mask(num_entries, maxlen=self.max_entries)[:, :,
-            tf.newaxis], tf.float32) * sqrt_energy[:, :, tf.newaxis]
-        diff_sq_2 = tf.reduce_sum(diff_sq_2, axis=[-1, -2]) / tf.reduce_sum(sqrt_energy, axis=-1)
-        loss_unreduced_2 = (diff_sq_2 / tf.cast(num_entries, tf.float32)) * tf.cast(
-            num_entries != 0, tf.float32)
-
-        shower_indices = tf.argmin(
-            tf.concat((loss_unreduced_1[:, tf.newaxis], loss_unreduced_2[:, tf.newaxis]), axis=-1), axis=-1)
-
-        condition_1 = tf.to_float(tf.equal((tf.to_float(shower_indices)[:, tf.newaxis, tf.newaxis]), 0.0))
-        condition_2 = tf.to_float(tf.equal((tf.to_float(shower_indices)[:, tf.newaxis, tf.newaxis]), 1.0))
-        sorted_target = targets * condition_1 + (1 - targets) * condition_2
-
-        # + (1-targets) * tf.cast(shower_indices[:,tf.newaxis,tf.newaxis]==1, tf.float32)
+        losses = masked_permutation_losses(prediction[:, :, 0:2], targets, sqrt_energy, num_entries)
+        sorted_target = sort_targets(targets, tf.argmin(losses, axis=1))
 
-        perf1 = tf.reduce_sum(prediction[:, :, 0] * energy, axis=[-1]) / tf.reduce_sum(sorted_target[:, :, 0] * energy,
-                                                                                       axis=[-1])
-        perf2 = tf.reduce_sum(prediction[:, :, 1] * energy, axis=[-1]) / tf.reduce_sum(sorted_target[:, :, 1] * energy,
-                                                                                       axis=[-1])
+        # Responses of the first showers of all events, then of the second ones
+        responses = tf.reshape(tf.transpose(shower_responses(prediction[:, :, 0:2], sorted_target, energy)), [-1])
 
         self._histogram_resolution = tf.summary.histogram("histogram_resolution_tboard",
-                                                          tf.concat((perf1, perf2), axis=0))
+                                                          responses)
 
-        mean_resolution, variance_resolution = tf.nn.moments(tf.concat((perf1, perf2), axis=0), axes=0)
+        mean_resolution, variance_resolution = tf.nn.moments(responses, axes=0)
 
         self.mean_resolution = tf.clip_by_value(mean_resolution, 0.2, 2)
         self.variance_resolution = tf.clip_by_value(variance_resolution, 0, 1) / tf.clip_by_value(mean_resolution, 0.2,
                                                                                                   2)
 
-        return tf.reduce_mean(loss_unreduced_1) * 1000.
+        return tf.reduce_mean(losses[:, 0]) * 1000.
 
     def _compute_output(self):
         # # nl_all = tf.layers.dense(tf.scalar_mul(0.001, self._placeholder_all_features), units=8, activation=tf.nn.relu)
@@ -150,8 +118,7 @@ class BinningClusteringDelta(SparseConvClusteringBase):
         x = tf.layers.conv3d(x, 32, [2, 2, 1], activation=tf.nn.relu, padding='same')
         x = tf.layers.conv3d(x, 48, [1, 1, 3], activation=tf.nn.relu, padding='same')
 
-        x = tf.reshape(x, [self.batch_size, 8, 8, 25, 16, 3])
-        output = tf.gather_nd(x, self.indexing_array)
+        output = unbin_vertices(x, self.binning)
         output = tf.nn.softmax(output)
 
         self._graph_temp = output
@@ -174,7 +141,7 @@ class BinningClusteringDelta(SparseConvClusteringBase):
 
             self._graph_loss = self._get_loss()
 
-            self._graph_optimizer = tf.train.AdamOptimizer(learning_rate=self.learning_rate).minimize(self._graph_loss)
+            self._graph_optimizer = self.get_adam_optimizer().minimize(self._graph_loss)
 
             # Repeating, maybe there is a better way?
             self._graph_summary_loss = tf.summary.scalar('loss', self._graph_loss)
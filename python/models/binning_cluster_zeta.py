@@ -1,7 +1,7 @@
 from models.binning_cluster_epsilon import BinningClusteringEpsilon
 import tensorflow as tf
 import numpy as np
-import readers.indices_calculated as ic
+from ops.binning import bin_vertices, unbin_vertices
 from ops.sparse_conv_2 import *
 
 
@@ -48,8 +48,7 @@ class BinningClusteringZeta(BinningClusteringEpsilon):
         x = tf.layers.conv3d_transpose(x, 64, [1, 1, 2], strides=[1, 1, 2], activation=tf.nn.relu, padding='same')  # 8x8x20x32
         x = tf.layers.conv3d(x, 48, [1, 1, 1], strides=[1, 1, 1], activation=tf.nn.relu, padding='same')  # 8x8x20x12
 
-        x = tf.reshape(x, [self.batch_size, 8, 8, 20, 16, 3])
-        output = tf.gather_nd(x, self.indexing_array2)
+        output = unbin_vertices(x, self.binning2)
         output = tf.nn.softmax(output)
 
         self._graph_temp = output
@@ -57,26 +56,8 @@ class BinningClusteringZeta(BinningClusteringEpsilon):
         return output
 
     def construct_conversion_ops(self):
-        batch_indices = np.arange(self.batch_size)
-        batch_indices = np.tile(batch_indices[..., np.newaxis], reps=(1, self.max_entries))[..., np.newaxis]
-
-
-        indexing_array = \
-            np.concatenate((ic.x_bins_beta_calo_16[:, np.newaxis], ic.y_bins_beta_calo_16[:, np.newaxis], ic.l_bins_beta_calo_16[:, np.newaxis],
-                            ic.d_indices_beta_calo_16[:, np.newaxis]),
-                           axis=1)[np.newaxis, ...]
-
-        indexing_array = np.tile(indexing_array, reps=[self.batch_size, 1, 1])
-        self.indexing_array = np.concatenate((batch_indices, indexing_array), axis=2).astype(np.int64)
-
-
-        indexing_array2 = \
-            np.concatenate((ic.x_bins_beta_calo[:, np.newaxis], ic.y_bins_beta_calo[:, np.newaxis], ic.l_bins_beta_calo[:, np.newaxis],
-                            ic.d_indices_beta_calo[:, np.newaxis]),
-                           axis=1)[np.newaxis, ...]
-
-        indexing_array2 = np.tile(indexing_array2, reps=[self.batch_size, 1, 1])
-        self.indexing_array2 = np.concatenate((batch_indices, indexing_array2), axis=2).astype(np.int64)
+        self.binning = 'beta_calo_16'
+        self.binning2 = 'beta_calo'
 
         net = construct_sparse_io_dict(self._placeholder_other_features, self._placeholder_space_features, self._placeholder_space_features_local,
                                           tf.squeeze(self._placeholder_num_entries))
@@ -84,7 +65,6 @@ class BinningClusteringZeta(BinningClusteringEpsilon):
         net = sparse_conv_normalise(net, log_energy=True)
 
         values = tf.concat((net['all_features'], net['spatial_features_local']), axis=-1)
-        result = tf.scatter_nd(self.indexing_array, values, shape=(self.batch_size, 16, 16, 20, 4, 4))
-        result = tf.reshape(result, [self.batch_size, 16, 16, 20, 4 * 4])
+        result = bin_vertices(values, self.binning)
 
         return result
@@ -2,10 +2,12 @@ import tensorflow as tf
 from models.sparse_conv_clustering_base import SparseConvClusteringBase
 from ops.sparse_conv_2 import *
 from models.switch_model import SwitchModel
-import readers.indices_calculated as ic
+from ops.binning import bin_vertices, unbin_vertices, binned_conv3d, voxel_binning
 
 
 class BinningSeedFinderAlpha(SparseConvClusteringBase):
+    # The cells are binned by their index in the fixed geometry
+    supports_hit_packing = False
 
     def __init__(self, n_space, n_space_local, n_others, n_target_dim, batch_size, max_entries, learning_rate=0.0001):
         super(BinningSeedFinderAlpha, self).__init__(n_space, n_space_local, n_others, n_target_dim, batch_size,
@@ -47,17 +49,8 @@ class BinningSeedFinderAlpha(SparseConvClusteringBase):
         self.seed_talk=seed_talk
 
     def make_placeholders(self):
-        self._placeholder_space_features = tf.placeholder(dtype=tf.float32,
-                                                          shape=[self.batch_size, self.max_entries, self.n_space])
-        self._placeholder_space_features_local = tf.placeholder(dtype=tf.float32,
-                                                                shape=[self.batch_size, self.max_entries,
-                                                                       self.n_space_local])
-        self._placeholder_other_features = tf.placeholder(dtype=tf.float32, shape=[self.batch_size, self.max_entries,
-                                                                                   self.n_other_features])
-        self._placeholder_targets = tf.placeholder(dtype=tf.float32,
-                                                   shape=[self.batch_size, self.max_entries, self.n_target_dim])
-        self._placeholder_num_entries = tf.placeholder(dtype=tf.int64, shape=[self.batch_size, 1])
-        self._placeholder_seed_indices = tf.placeholder(dtype=tf.int64, shape=[self.batch_size, 2])
+        super(BinningSeedFinderAlpha, self).make_placeholders()
+        self.make_seed_indices_placeholder()
 
     def get_placeholders(self):
         return self._placeholder_space_features, self._placeholder_space_features_local, self._placeholder_other_features, \
@@ -156,26 +149,26 @@ class BinningSeedFinderAlpha(SparseConvClusteringBase):
         # 8x8x25x64
         x = binned_input
 
-        x = tf.layers.conv3d(0.001 * x, 50, [1, 1, 1], activation=tf.nn.leaky_relu, padding='same')
-        x = tf.layers.conv3d(x, 50, [1, 1, 1], activation=tf.nn.leaky_relu, padding='same')
-        x = tf.layers.conv3d(x, 50, [1, 1, 1], activation=tf.nn.leaky_relu, padding='same')
-        x = tf.layers.conv3d(x, 32, [3, 3, 1], activation=tf.nn.relu, padding='same')
-        x = tf.layers.conv3d(x, 32, [1, 1, 5], activation=tf.nn.relu, padding='same')
+        x = binned_conv3d(0.001 * x, 50, [1, 1, 1], activation=tf.nn.leaky_relu, binning=self.voxel_binning)
+        x = binned_conv3d(x, 50, [1, 1, 1], activation=tf.nn.leaky_relu, binning=self.voxel_binning)
+        x = binned_conv3d(x, 50, [1, 1, 1], activation=tf.nn.leaky_relu, binning=self.voxel_binning)
+        x = binned_conv3d(x, 32, [3, 3, 1], activation=tf.nn.relu, binning=self.voxel_binning)
+        x = binned_conv3d(x, 32, [1, 1, 5], activation=tf.nn.relu, binning=self.voxel_binning)
 
-        x = tf.layers.conv3d(x, 32, [3, 3, 1], activation=tf.nn.relu, padding='same')
-        x = tf.layers.conv3d(x, 32, [1, 1, 5], activation=tf.nn.relu, padding='same')
-        x = tf.layers.conv3d(x, 32, [3, 3, 1], activation=tf.nn.relu, padding='same')
-        x = tf.layers.conv3d(x, 32, [1, 1, 5], strides=(1,1,1), activation=tf.nn.relu, padding='same')
-        x = tf.layers.conv3d(x, 32, [3, 3, 1], activation=tf.nn.relu, padding='same')
+        x = binned_conv3d(x, 32, [3, 3, 1], activation=tf.nn.relu, binning=self.voxel_binning)
+        x = binned_conv3d(x, 32, [1, 1, 5], activation=tf.nn.relu, binning=self.voxel_binning)
+        x = binned_conv3d(x, 32, [3, 3, 1], activation=tf.nn.relu, binning=self.voxel_binning)
+        x = binned_conv3d(x, 32, [1, 1, 5], activation=tf.nn.relu, binning=self.voxel_binning)
+        x = binned_conv3d(x, 32, [3, 3, 1], activation=tf.nn.relu, binning=self.voxel_binning)
 
-        x = tf.layers.conv3d(x, 32, [1, 1, 5], strides=(1,1,1), activation=tf.nn.relu, padding='same')
-        x = tf.layers.conv3d(x, 32, [3, 3, 1], activation=tf.nn.relu, padding='same')
-        x = tf.layers.conv3d(x, 32, [1, 1, 5], strides=(1,1,1), activation=tf.nn.relu, padding='same')
-        x = tf.layers.conv3d(x, 32, [2, 2, 1], activation=tf.nn.relu, padding='same')
-        x = tf.layers.conv3d(x, 48 if not self.seed_target_l2 else 96, [1, 1, 3], activation=tf.nn.relu, padding='same')
+        x = binned_conv3d(x, 32, [1, 1, 5], activation=tf.nn.relu, binning=self.voxel_binning)
+        x = binned_conv3d(x, 32, [3, 3, 1], activation=tf.nn.relu, binning=self.voxel_binning)
+        x = binned_conv3d(x, 32, [1, 1, 5], activation=tf.nn.relu, binning=self.voxel_binning)
+        x = binned_conv3d(x, 32, [2, 2, 1], activation=tf.nn.relu, binning=self.voxel_binning)
+        x = binned_conv3d(x, 48 if not self.seed_target_l2 else 96, [1, 1, 3], activation=tf.nn.relu,
+                          binning=self.voxel_binning)
 
-        x = tf.reshape(x, [self.batch_size, 8, 8, 25, 16, 3 if not self.seed_target_l2 else 6])
-        output = tf.gather_nd(x, self.indexing_array)
+        output = unbin_vertices(x, self.binning, active_voxels_only=self.voxel_binning is not None)
 
         self._graph_temp = output
 
@@ -240,9 +233,9 @@ class BinningSeedFinderAlpha(SparseConvClusteringBase):
 
             self._graph_loss = self._get_loss()
 
-            extra_ops = tf.get_collection(tf.GraphKeys.UPDATE_OPS)
+            extra_ops = self.get_update_ops()
             with tf.control_dependencies(extra_ops):
-                self._graph_optimizer = tf.train.AdamOptimizer(learning_rate=self.learning_rate).minimize(self._graph_loss)
+                self._graph_optimizer = self.get_adam_optimizer().minimize(self._graph_loss)
 
             # Repeating, maybe there is a better way?
             self._graph_summary_loss = tf.summary.scalar('Loss', self._graph_loss)
@@ -257,17 +250,12 @@ class BinningSeedFinderAlpha(SparseConvClusteringBase):
 
 
     def construct_conversion_ops(self):
-        batch_indices = np.arange(self.batch_size)
-        batch_indices = np.tile(batch_indices[..., np.newaxis], reps=(1, 2679))[..., np.newaxis]
-        indexing_array = \
-        np.concatenate((ic.x_bins[:, np.newaxis], ic.y_bins[:, np.newaxis], ic.l_bins[:, np.newaxis], ic.d_indices[:, np.newaxis]),
-                       axis=1)[np.newaxis, ...]
-        indexing_array = np.tile(indexing_array, reps=[self.batch_size, 1, 1])
-        self.indexing_array = np.concatenate((batch_indices, indexing_array), axis=2).astype(np.int64)
+        self.binning = 'small_calo'
+        # The l2 output is strided, it needs the dense binned tensor
+        self.voxel_binning = None if self.seed_target_l2 else voxel_binning(self.binning)
 
         values = tf.concat((self._placeholder_other_features, self._placeholder_space_features_local), axis=-1)
-        result = tf.scatter_nd(self.indexing_array, values, shape=(self.batch_size, 8, 8, 25, 16, 4))
-        result = tf.reshape(result, [self.batch_size, 8, 8, 25, 16*4])
+        result = bin_vertices(values, self.binning, active_voxels_only=self.voxel_binning is not None)
 
         return result
 
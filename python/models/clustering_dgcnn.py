@@ -4,6 +4,7 @@ from models.sparse_conv_clustering_base import SparseConvClusteringBase
 from ops.sparse_conv_2 import *
 from models.switch_model import SwitchModel
 from ops.activations import *
+from models.clustering_loss import permutation_losses, shower_responses
 
 
 class DynamicGraphCnnAlpha(SparseConvClusteringBase):
@@ -28,17 +29,8 @@ class DynamicGraphCnnAlpha(SparseConvClusteringBase):
 
 
     def make_placeholders(self):
-        self._placeholder_space_features = tf.placeholder(dtype=tf.float32,
-                                                          shape=[self.batch_size, self.max_entries, self.n_space])
-        self._placeholder_space_features_local = tf.placeholder(dtype=tf.float32,
-                                                                shape=[self.batch_size, self.max_entries,
-                                                                       self.n_space_local])
-        self._placeholder_other_features = tf.placeholder(dtype=tf.float32, shape=[self.batch_size, self.max_entries,
-                                                                                   self.n_other_features])
-        self._placeholder_targets = tf.placeholder(dtype=tf.float32,
-                                                   shape=[self.batch_size, self.max_entries, self.n_target_dim])
-        self._placeholder_num_entries = tf.placeholder(dtype=tf.int64, shape=[self.batch_size, 1])
-        self._placeholder_seed_indices = tf.placeholder(dtype=tf.int64, shape=[self.batch_size, 2])
+        super(DynamicGraphCnnAlpha, self).make_placeholders()
+        self.make_seed_indices_placeholder()
 
     def get_placeholders(self):
         return self._placeholder_space_features, self._placeholder_space_features_local, self._placeholder_other_features, \
@@ -47,77 +39,42 @@ class DynamicGraphCnnAlpha(SparseConvClusteringBase):
     def get_loss2(self):
         assert self._graph_output.shape[2] >= 2
 
-        num_entries = tf.squeeze(self._placeholder_num_entries, axis=1)
-        print('num_entries', num_entries.shape)
-        energy = self._placeholder_other_features[:, :, 0]
-        sqrt_energy = tf.sqrt(energy)
-
-        prediction = self._graph_output
         targets = self._placeholder_targets
+        sqrt_energies = targets * tf.sqrt(self._placeholder_other_features[:, :, 0])[:, :, tf.newaxis]
 
-        maxlen = self.max_entries
-        # if self.use_seeds:
-        #    energy=energy[:,0:-1]
-        #    targets = targets[:,0:-1,:]
-
-        total_energy = tf.reduce_sum(energy, axis=-1)
-
-        print('total_energy', total_energy.shape)
-
-        energies = targets * energy[:, :, tf.newaxis]
-        energy_sums = tf.reduce_sum(energies, axis=1)
-        energy_a = energy_sums[:, 0]
-        energy_b = energy_sums[:, 1]
-
-        print('energy_a', energy_a.shape)
-
-        sqrt_energies = targets * sqrt_energy[:, :, tf.newaxis]
-
-        print('sqrt_energies', sqrt_energies.shape)
-
-        sqrt_energy_sum = tf.reduce_sum(sqrt_energies, axis=1)
-        sqrt_energy_a = sqrt_energy_sum[:, 0]
-        sqrt_energy_b = sqrt_energy_sum[:, 1]
-
-        print('sqrt_energy_sum', sqrt_energy_sum.shape)
+        diff_sq = (self._graph_output[:, :, 0:2] - targets) ** 2.
 
-        diff_sq = (prediction[:, :, 0:2] - targets) ** 2.
-        diff_sq_a = diff_sq[:, :, 0]
-        diff_sq_b = diff_sq[:, :, 1]
+        return tf.reduce_mean(tf.reduce_sum(diff_sq * sqrt_energies, axis=[1, 2]) /
+                              tf.reduce_sum(sqrt_energies, axis=[1, 2]))
 
-        print('diff_sq_a', diff_sq_a.shape)
-
-        loss_a = tf.reduce_sum(diff_sq_a * sqrt_energies[:, :, 0], axis=1) / (sqrt_energy_a)
-        loss_b = tf.reduce_sum(diff_sq_b * sqrt_energies[:, :, 1], axis=1) / (sqrt_energy_b)
-
-        old_loss = (tf.reduce_sum(diff_sq_a * sqrt_energies[:, :, 0], axis=1) + tf.reduce_sum(
-            diff_sq_b * sqrt_energies[:, :, 1], axis=1)) / (sqrt_energy_a + sqrt_energy_b)
-
-        print('loss_a', loss_a.shape)
-
-        total_loss = loss_a + loss_b
+    def make_response_metrics(self):
+        """
+        Builds the diagnostics of the energy response of both showers and the sum of the losses of both showers.
+        They aren't needed for the loss, so they are only added to the validation summaries and aren't computed in
+        training steps.
+        """
+        energy = self._placeholder_other_features[:, :, 0]
+        prediction = self._graph_output[:, :, 0:2]
+        targets = self._placeholder_targets
 
-        response_a = tf.reduce_sum(prediction[:, :, 0] * energy, axis=1) / energy_a
-        response_b = tf.reduce_sum(prediction[:, :, 1] * energy, axis=1) / energy_b
+        sqrt_energies = targets * tf.sqrt(energy)[:, :, tf.newaxis]
+        sqrt_energy_sums = tf.reduce_sum(sqrt_energies, axis=1)
 
-        print('response_a', response_a.shape)
+        # Loss of the identity assignment with every shower weighted by its own energy
+        identity_losses = permutation_losses(prediction, targets, tf.sqrt(energy), target_weights=targets,
+                                             per_shower_normalisation=True)[:, 0]
+        self.total_loss = tf.reduce_mean(identity_losses)
 
-        total_response = tf.concat([response_a, response_b], axis=0)
+        responses = shower_responses(prediction, targets, energy)
+        total_response = tf.concat([responses[:, 0], responses[:, 1]], axis=0)
 
         self.mean_resolution, self.variance_resolution = self.normalise_response(total_response)
 
-        self.total_loss = tf.reduce_mean(total_loss)
-
-        sqrt_response_a = tf.reduce_sum(prediction[:, :, 0] * sqrt_energies[:, :, 0], axis=1) / sqrt_energy_a
-        sqrt_response_b = tf.reduce_sum(prediction[:, :, 1] * sqrt_energies[:, :, 1], axis=1) / sqrt_energy_b
-
-        sqrt_total_response = tf.concat([sqrt_response_a, sqrt_response_b], axis=0)
+        sqrt_responses = tf.reduce_sum(prediction * sqrt_energies, axis=1) / sqrt_energy_sums
+        sqrt_total_response = tf.concat([sqrt_responses[:, 0], sqrt_responses[:, 1]], axis=0)
 
         self.mean_sqrt_resolution, self.variance_sqrt_resolution = self.normalise_response(sqrt_total_response)
 
-        return tf.reduce_mean(
-            old_loss)  # + tf.reduce_mean(0.1*tf.abs(1-self.mean_resolution)+0.1*self.variance_resolution)
-
     def _get_loss(self):
 
         return self.get_loss2()
@@ -234,26 +191,30 @@ class DynamicGraphCnnAlpha(SparseConvClusteringBase):
 
             self.make_placeholders()
 
-            self._graph_output = self._compute_output()
+            self._graph_output = self._compute_active_output()
 
             # self._graph_temp = tf.nn.softmax(self.__graph_logits)
 
             self._graph_loss = self._get_loss()
 
-            self._graph_optimizer = tf.train.AdamOptimizer(learning_rate=self.learning_rate).minimize(self._graph_loss)
+            self._graph_optimizer = self.get_adam_optimizer().minimize(self._graph_loss)
+
+            self.make_response_metrics()
 
-            # Repeating, maybe there is a better way?
+            # Only the loss is computed in training steps, the diagnostics in validation steps
             self._graph_summary_loss = tf.summary.scalar('loss', self._graph_loss)
-            self._graph_summaries = tf.summary.merge([self._graph_summary_loss,
-                                                      tf.summary.scalar('mean-res', self.mean_resolution),
-                                                      tf.summary.scalar('variance-res', self.variance_resolution),
-                                                      tf.summary.scalar('mean-res-sqrt', self.mean_sqrt_resolution),
-                                                      tf.summary.scalar('variance-res-sqrt',
-                                                                        self.variance_sqrt_resolution),
-                                                      tf.summary.scalar('fraction-loss', self.total_loss)])
+            self._graph_summaries = tf.summary.merge([self._graph_summary_loss])
 
             self._graph_summary_loss_validation = tf.summary.scalar('Validation Loss', self._graph_loss)
-            self._graph_summaries_validation = tf.summary.merge([self._graph_summary_loss_validation])
+            self._graph_summaries_validation = tf.summary.merge([self._graph_summary_loss_validation,
+                                                                 tf.summary.scalar('mean-res', self.mean_resolution),
+                                                                 tf.summary.scalar('variance-res',
+                                                                                   self.variance_resolution),
+                                                                 tf.summary.scalar('mean-res-sqrt',
+                                                                                   self.mean_sqrt_resolution),
+                                                                 tf.summary.scalar('variance-res-sqrt',
+                                                                                   self.variance_sqrt_resolution),
+                                                                 tf.summary.scalar('fraction-loss', self.total_loss)])
 
     def get_losses(self):
         print("Hello, world!")
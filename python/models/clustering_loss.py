@@ -0,0 +1,147 @@
+"""
+Energy weighted, permutation invariant losses of the clustering models. The showers the models predict have no
+order, so an event is compared to its targets with the assignment of predicted to target showers which gives the
+lowest loss. All the assignments of all events are evaluated at once from the [B, N, N] costs of predicting every
+target shower with every predicted shower, so there's no branching on the assignment and only one pass over the
+vertices for any number of showers N.
+"""
+import itertools
+import numpy as np
+import tensorflow as tf
+
+
+def shower_permutations(num_showers):
+    """
+    Returns all the assignments of predicted to target showers, the identity first
+
+    :param num_showers: Number of showers N
+    :return: Numpy array [N!, N] of int32, row p assigns predicted shower i to target shower [p, i]
+    """
+    return np.array(list(itertools.permutations(range(num_showers))), dtype=np.int32)
+
+
+def _permutation_matrices(num_showers):
+    # [N!, N * N], one where predicted shower i is assigned to target shower j
+    permutations = shower_permutations(num_showers)
+    matrices = np.zeros((len(permutations), num_showers, num_showers), dtype=np.float32)
+    for p, permutation in enumerate(permutations):
+        matrices[p, np.arange(num_showers), permutation] = 1
+    return matrices.reshape((len(permutations), num_showers * num_showers))
+
+
+def assignment_costs(prediction, targets, weights, target_weights=None, per_shower_normalisation=False):
+    """
+    Computes the weighted squared error of predicting every target shower with every predicted shower
+
+    :param prediction: Predicted fractions [B, V, N]
+    :param targets: Target fractions [B, V, N]
+    :param weights: Weights [B, V] of the vertices, e.g. their sqrt energy times the mask of the valid vertices
+    :param target_weights: Optional additional weights [B, V, N] of the vertices for every target shower, e.g. the
+                           targets to weight every shower by its own energy
+    :param per_shower_normalisation: Divide the costs of every target shower by the sum of its weights
+    :return: Costs [B, N, N], [b, i, j] for predicting target shower j with predicted shower i
+    """
+    # [B, V, N] weights for every target shower
+    if target_weights is None:
+        shower_weights = tf.tile(weights[:, :, tf.newaxis], [1, 1, int(targets.shape[2])])
+    else:
+        shower_weights = weights[:, :, tf.newaxis] * target_weights
+
+    # sum_v w_vj (p_vi - t_vj)^2 = sum_v w_vj p_vi^2 - 2 sum_v w_vj t_vj p_vi + sum_v w_vj t_vj^2
+    costs = tf.matmul(prediction ** 2, shower_weights, transpose_a=True) \
+            - 2. * tf.matmul(prediction, shower_weights * targets, transpose_a=True) \
+            + tf.reduce_sum(shower_weights * targets ** 2, axis=1)[:, tf.newaxis, :]
+
+    if per_shower_normalisation:
+        costs = costs / tf.reduce_sum(shower_weights, axis=1)[:, tf.newaxis, :]
+    return costs
+
+
+def permutation_losses(prediction, targets, weights, target_weights=None, per_shower_normalisation=False):
+    """
+    Computes the loss of every assignment of predicted to target showers, see assignment_costs for the parameters.
+    The loss of an assignment is the sum of the costs of its pairs of showers.
+
+    :return: Losses [B, N!] in the order of shower_permutations, the first is the identity
+    """
+    num_showers = int(targets.shape[2])
+    costs = assignment_costs(prediction, targets, weights, target_weights, per_shower_normalisation)
+    return tf.matmul(tf.reshape(costs, [-1, num_showers * num_showers]),
+                     tf.constant(_permutation_matrices(num_showers)), transpose_b=True)
+
+
+def masked_permutation_losses(prediction, targets, loss_energy, num_entries):
+    """
+    Same as permutation_losses with the normalisation of the models which use only the first num_entries vertices:
+    the losses are divided by the sum of the loss energy and by the number of vertices, and are zero for events
+    without vertices
+
+    :param prediction: Predicted fractions [B, V, N]
+    :param targets: Target fractions [B, V, N]
+    :param loss_energy: Weights [B, V] of the vertices, e.g. their sqrt energy
+    :param num_entries: Number of vertices [B] of every event
+    :return: Losses [B, N!] in the order of shower_permutations, the first is the identity
+    """
+    mask = tf.cast(tf.sequence_mask(num_entries, maxlen=int(targets.shape[1])), tf.float32)
+    losses = permutation_losses(prediction, targets, loss_energy * mask)
+
+    num_entries = tf.cast(num_entries, tf.float32)
+    return losses / (tf.reduce_sum(loss_energy, axis=-1) * num_entries)[:, tf.newaxis] * \
+           tf.cast(num_entries != 0, tf.float32)[:, tf.newaxis]
+
+
+def sort_targets(targets, permutation_indices):
+    """
+    Orders the target showers of every event like the predicted ones
+
+    :param targets: Target fractions [B, V, N]
+    :param permutation_indices: Index [B] of the assignment of every event, e.g. tf.argmin of permutation_losses
+    :return: Target fractions [B, V, N], [:, :, i] is the target shower which predicted shower i is assigned to
+    """
+    num_showers = int(targets.shape[2])
+    permutations = tf.gather(tf.constant(shower_permutations(num_showers)), permutation_indices)
+    return tf.matmul(targets, tf.one_hot(permutations, num_showers, dtype=targets.dtype), transpose_b=True)
+
+
+def permutation_invariant_loss(prediction, targets, weights, target_weights=None, per_shower_normalisation=False):
+    """
+    Computes the loss of the best assignment of predicted to target showers of every event, see assignment_costs for
+    the parameters
+
+    :return: Tuple of the losses [B] and the targets [B, V, N] sorted by the best assignment
+    """
+    losses = permutation_losses(prediction, targets, weights, target_weights, per_shower_normalisation)
+    return tf.reduce_min(losses, axis=1), sort_targets(targets, tf.argmin(losses, axis=1))
+
+
+def shower_responses(prediction, targets, energy):
+    """
+    Computes the ratio of the predicted to the target energy of every shower
+
+    :param prediction: Predicted fractions [B, V, N]
+    :param targets: Target fractions [B, V, N], e.g. sorted by sort_targets
+    :param energy: Energy [B, V] of the vertices
+    :return: Responses [B, N]
+    """
+    return tf.reduce_sum(prediction * energy[:, :, tf.newaxis], axis=1) / \
+           tf.reduce_sum(targets * energy[:, :, tf.newaxis], axis=1)
+
+
+def permutation_losses_numpy(prediction, targets, weights, target_weights=None, per_shower_normalisation=False):
+    """
+    Same as permutation_losses for numpy arrays, for the evaluation of inference output. The batch dimension is
+    optional.
+    """
+    prediction, targets, weights = np.asarray(prediction), np.asarray(targets), np.asarray(weights)
+    shower_weights = weights[..., np.newaxis] if target_weights is None else weights[..., np.newaxis] * target_weights
+    shower_weights = np.broadcast_to(shower_weights, targets.shape)
+
+    # [..., N, N], predicted shower i and target shower j
+    costs = np.sum(shower_weights[..., np.newaxis, :] *
+                   (prediction[..., :, np.newaxis] - targets[..., np.newaxis, :]) ** 2, axis=-3)
+    if per_shower_normalisation:
+        costs = costs / np.sum(shower_weights, axis=-2)[..., np.newaxis, :]
+
+    num_showers = targets.shape[-1]
+    return np.matmul(costs.reshape(costs.shape[0:-2] + (num_showers * num_showers,)),
+                     _permutation_matrices(num_showers).T)
@@ -3,6 +3,7 @@ from models.sparse_conv_clustering_base import SparseConvClusteringBase
 from ops.sparse_conv import *
 from ops.sparse_conv_old import *
 from models.switch_model import SwitchModel
+from models.clustering_loss import masked_permutation_losses, sort_targets, shower_responses
 
 
 class SparseConvClusteringBareBaselineAlpha(SparseConvClusteringBase):
@@ -19,34 +20,17 @@ class SparseConvClusteringBareBaselineAlpha(SparseConvClusteringBase):
 
         energy = self._placeholder_other_features[:, :, 0]
 
-        diff_sq_1 = (self._graph_output[:,:,0:2] - self._placeholder_targets) ** 2 * tf.cast(
-            tf.sequence_mask(num_entries, maxlen=self.max_entries)[:, :,
-            tf.newaxis], tf.float32) * energy[:,:, tf.newaxis]
-        diff_sq_1 = tf.reduce_sum(diff_sq_1, axis=[-1, -2]) / tf.reduce_sum(energy, axis=-1)
-        loss_unreduced_1 = (diff_sq_1 / tf.cast(num_entries, tf.float32)) * tf.cast(
-            num_entries != 0, tf.float32)
+        losses = masked_permutation_losses(self._graph_output[:, :, 0:2], self._placeholder_targets, energy,
+                                           num_entries)
+        sorted_target = sort_targets(self._placeholder_targets, tf.argmin(losses, axis=1))
 
-        diff_sq_2 = (self._graph_output[:,:,0:2] - (1-self._placeholder_targets)) ** 2 * tf.cast(
-            tf.sequence_mask(num_entries, maxlen=self.max_entries)[:, :,
-            tf.newaxis], tf.float32) * energy[:,:, tf.newaxis]
-        diff_sq_2 = tf.reduce_sum(diff_sq_2, axis=[-1, -2]) / tf.reduce_sum(energy, axis=-1)
-        loss_unreduced_2 = (diff_sq_2 / tf.cast(num_entries, tf.float32)) * tf.cast(
-            num_entries != 0, tf.float32)
+        # Responses of the first showers of all events, then of the second ones
+        responses = tf.reshape(tf.transpose(shower_responses(self._graph_output[:, :, 0:2], sorted_target, energy)),
+                               [-1])
 
-        shower_indices = tf.argmin(tf.concat((loss_unreduced_1[:, tf.newaxis], loss_unreduced_2[:, tf.newaxis]), axis=-1), axis=-1)
+        self.mean_resolution, self.variance_resolution = tf.nn.moments(responses, axes=0)
 
-        condition_1 = tf.to_float(tf.equal((tf.to_float(shower_indices)[:, tf.newaxis, tf.newaxis]), 0.0))
-        condition_2 = tf.to_float(tf.equal((tf.to_float(shower_indices)[:, tf.newaxis, tf.newaxis]), 1.0))
-        sorted_target = self._placeholder_targets * condition_1 + (1-self._placeholder_targets) * condition_2
-
-        # + (1-self._placeholder_targets) * tf.cast(shower_indices[:,tf.newaxis,tf.newaxis]==1, tf.float32)
-
-        perf1 = tf.reduce_sum(self._graph_output[:,:,0] * energy, axis=[-1]) / tf.reduce_sum(sorted_target[:,:,0] * energy, axis=[-1])
-        perf2 = tf.reduce_sum(self._graph_output[:,:,1] * energy, axis=[-1]) / tf.reduce_sum(sorted_target[:,:,1] * energy, axis=[-1])
-
-        self.mean_resolution, self.variance_resolution = tf.nn.moments(tf.concat((perf1, perf2), axis=0), axes=0)
-
-        return tf.reduce_mean(tf.minimum(loss_unreduced_1, loss_unreduced_2)) * 1000
+        return tf.reduce_mean(tf.reduce_min(losses, axis=1)) * 1000
 
 
     def _compute_output(self):
@@ -61,7 +45,7 @@ class SparseConvClusteringBareBaselineAlpha(SparseConvClusteringBase):
         # TODO: Will cause problems with batch size of 1
 
         _input = construct_sparse_io_dict(self._placeholder_other_features, self._placeholder_space_features, self._placeholder_space_features_local,
-                                          tf.squeeze(self._placeholder_num_entries))
+                                          tf.squeeze(self._placeholder_num_entries), self.get_neighbor_table(18))
 
         net = sparse_conv_bare(_input, num_neighbors=18, output_all=30)
         net = sparse_conv_bare(net, num_neighbors=18, output_all=30)
@@ -87,13 +71,13 @@ class SparseConvClusteringBareBaselineAlpha(SparseConvClusteringBase):
 
             self.make_placeholders()
 
-            self._graph_output = self._compute_output()
+            self._graph_output = self._compute_active_output()
 
             # self._graph_temp = tf.nn.softmax(self.__graph_logits)
 
             self._graph_loss = self._get_loss()
 
-            self._graph_optimizer = tf.train.AdamOptimizer(learning_rate=self.learning_rate).minimize(self._graph_loss)
+            self._graph_optimizer = self.get_adam_optimizer().minimize(self._graph_loss)
 
             # Repeating, maybe there is a better way?
             self._graph_summary_loss = tf.summary.scalar('loss', self._graph_loss)
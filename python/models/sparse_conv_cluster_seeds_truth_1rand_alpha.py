@@ -2,6 +2,7 @@ import tensorflow as tf
 from models.sparse_conv_clustering_base import SparseConvClusteringBase
 from ops.sparse_conv_2 import *
 from models.switch_model import SwitchModel
+from models.clustering_loss import masked_permutation_losses, sort_targets, shower_responses
 
 
 class SparseConvClusteringSeedsTruthPlusOneRandomAlpha(SparseConvClusteringBase):
@@ -21,17 +22,8 @@ class SparseConvClusteringSeedsTruthPlusOneRandomAlpha(SparseConvClusteringBase)
         self.is_training = is_training
 
     def make_placeholders(self):
-        self._placeholder_space_features = tf.placeholder(dtype=tf.float32,
-                                                          shape=[self.batch_size, self.max_entries, self.n_space])
-        self._placeholder_space_features_local = tf.placeholder(dtype=tf.float32,
-                                                                shape=[self.batch_size, self.max_entries,
-                                                                       self.n_space_local])
-        self._placeholder_other_features = tf.placeholder(dtype=tf.float32, shape=[self.batch_size, self.max_entries,
-                                                                                   self.n_other_features])
-        self._placeholder_targets = tf.placeholder(dtype=tf.float32,
-                                                   shape=[self.batch_size, self.max_entries, self.n_target_dim])
-        self._placeholder_num_entries = tf.placeholder(dtype=tf.int64, shape=[self.batch_size, 1])
-        self._placeholder_seed_indices = tf.placeholder(dtype=tf.int64, shape=[self.batch_size, 2])
+        super(SparseConvClusteringSeedsTruthPlusOneRandomAlpha, self).make_placeholders()
+        self.make_seed_indices_placeholder()
 
     def get_placeholders(self):
         return self._placeholder_space_features, self._placeholder_space_features_local, self._placeholder_other_features, \
@@ -53,42 +45,20 @@ class SparseConvClusteringSeedsTruthPlusOneRandomAlpha(SparseConvClusteringBase)
         #    energy=energy[:,0:-1]
         #    targets = targets[:,0:-1,:]
 
-        diff_sq_1 = (prediction[:, :, 0:2] - targets) ** 2 * tf.cast(
-            tf.sequence_mask(num_entries, maxlen=self.max_entries)[:, :,
-            tf.newaxis], tf.float32) * sqrt_energy[:, :, tf.newaxis]
-        diff_sq_1 = tf.reduce_sum(diff_sq_1, axis=[-1, -2]) / tf.reduce_sum(sqrt_energy, axis=-1)
-        loss_unreduced_1 = (diff_sq_1 / tf.cast(num_entries, tf.float32)) * tf.cast(
-            num_entries != 0, tf.float32)
+        losses = masked_permutation_losses(prediction[:, :, 0:2], targets, sqrt_energy, num_entries)
+        sorted_target = sort_targets(targets, tf.argmin(losses, axis=1))
 
-        diff_sq_2 = (prediction[:, :, 0:2] - (1 - targets)) ** 2 * tf.cast(
-            tf.sequence_mask(num_entries, maxlen=self.max_entries)[:, :,
-            tf.newaxis], tf.float32) * sqrt_energy[:, :, tf.newaxis]
-        diff_sq_2 = tf.reduce_sum(diff_sq_2, axis=[-1, -2]) / tf.reduce_sum(sqrt_energy, axis=-1)
-        loss_unreduced_2 = (diff_sq_2 / tf.cast(num_entries, tf.float32)) * tf.cast(
-            num_entries != 0, tf.float32)
+        # Responses of the first showers of all events, then of the second ones
+        responses = tf.reshape(tf.transpose(shower_responses(prediction[:, :, 0:2], sorted_target, energy)), [-1])
 
-        shower_indices = tf.argmin(
-            tf.concat((loss_unreduced_1[:, tf.newaxis], loss_unreduced_2[:, tf.newaxis]), axis=-1), axis=-1)
-
-        condition_1 = tf.to_float(tf.equal((tf.to_float(shower_indices)[:, tf.newaxis, tf.newaxis]), 0.0))
-        condition_2 = tf.to_float(tf.equal((tf.to_float(shower_indices)[:, tf.newaxis, tf.newaxis]), 1.0))
-        sorted_target = targets * condition_1 + (1 - targets) * condition_2
-
-        # + (1-targets) * tf.cast(shower_indices[:,tf.newaxis,tf.newaxis]==1, tf.float32)
-
-        perf1 = tf.reduce_sum(prediction[:, :, 0] * energy, axis=[-1]) / tf.reduce_sum(sorted_target[:, :, 0] * energy,
-                                                                                       axis=[-1])
-        perf2 = tf.reduce_sum(prediction[:, :, 1] * energy, axis=[-1]) / tf.reduce_sum(sorted_target[:, :, 1] * energy,
-                                                                                       axis=[-1])
-
-        mean_resolution, variance_resolution = tf.nn.moments(tf.concat((perf1, perf2), axis=0), axes=0)
+        mean_resolution, variance_resolution = tf.nn.moments(responses, axes=0)
 
         self.mean_resolution = tf.clip_by_value(mean_resolution, 0.2, 2)
         self.variance_resolution = tf.clip_by_value(variance_resolution, 0, 1) / tf.clip_by_value(mean_resolution, 0.2,
                                                                                                   2)
 
-        return tf.reduce_mean(loss_unreduced_1) * 1000.
-        return tf.reduce_mean(tf.minimum(loss_unreduced_1, loss_unreduced_2)) * 1000.
+        return tf.reduce_mean(losses[:, 0]) * 1000.
+        return tf.reduce_mean(tf.reduce_min(losses, axis=1)) * 1000.
 
     def _get_loss(self):
         return self.get_loss2()
@@ -151,15 +121,15 @@ class SparseConvClusteringSeedsTruthPlusOneRandomAlpha(SparseConvClusteringBase)
 
             self.make_placeholders()
 
-            self._graph_output = self._compute_output()
+            self._graph_output = self._compute_active_output()
 
             # self._graph_temp = tf.nn.softmax(self.__graph_logits)
 
             self._graph_loss = self._get_loss()
 
-            extra_ops = tf.get_collection(tf.GraphKeys.UPDATE_OPS)
+            extra_ops = self.get_update_ops()
             with tf.control_dependencies(extra_ops):
-                self._graph_optimizer = tf.train.AdamOptimizer(learning_rate=self.learning_rate).minimize(self._graph_loss)
+                self._graph_optimizer = self.get_adam_optimizer().minimize(self._graph_loss)
 
             # Repeating, maybe there is a better way?
             self._graph_summary_loss = tf.summary.scalar('loss', self._graph_loss)
@@ -23,7 +23,7 @@ class SparseConvClusteringSpatial1(SparseConvClusteringBase):
 
         # TODO: Will cause problems with batch size of 1
         _input = construct_sparse_io_dict(self._placeholder_other_features, self._placeholder_space_features, self._placeholder_space_features_local,
-                                          tf.squeeze(self._placeholder_num_entries))
+                                          tf.squeeze(self._placeholder_num_entries), self.get_neighbor_table(18))
 
         net = sparse_conv_make_neighbors(_input, num_neighbors=18, output_all=15, spatial_degree_non_linearity=3, propagrate_ahead=True)
         net = sparse_conv_make_neighbors(net, num_neighbors=18, output_all=15, spatial_degree_non_linearity=3, propagrate_ahead=True)
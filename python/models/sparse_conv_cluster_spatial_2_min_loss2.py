@@ -4,6 +4,8 @@ from models.sparse_conv_clustering_base import SparseConvClusteringBase
 from ops.sparse_conv_2 import *
 from models.switch_model import SwitchModel
 from ops.activations import *
+from ops.binning import unbin_vertices
+from models.clustering_loss import shower_responses
 
 class SparseConvClusteringSpatialMinLoss2(SparseConvClusteringBase):
 
@@ -31,12 +33,8 @@ class SparseConvClusteringSpatialMinLoss2(SparseConvClusteringBase):
         return tf.clip_by_value(mean, 0.01, 100), tf.clip_by_value(variance, 0, 100)/tf.clip_by_value(mean,0.001,100)
 
     def make_placeholders(self):
-        self._placeholder_space_features = tf.placeholder(dtype=tf.float32, shape=[self.batch_size, self.max_entries, self.n_space])
-        self._placeholder_space_features_local = tf.placeholder(dtype=tf.float32, shape=[self.batch_size, self.max_entries, self.n_space_local])
-        self._placeholder_other_features = tf.placeholder(dtype=tf.float32, shape=[self.batch_size, self.max_entries, self.n_other_features])
-        self._placeholder_targets = tf.placeholder(dtype=tf.float32, shape=[self.batch_size, self.max_entries, self.n_target_dim])
-        self._placeholder_num_entries = tf.placeholder(dtype=tf.int64, shape=[self.batch_size, 1])
-        self._placeholder_seed_indices = tf.placeholder(dtype=tf.int64, shape=[self.batch_size, 2])
+        super(SparseConvClusteringSpatialMinLoss2, self).make_placeholders()
+        self.make_seed_indices_placeholder()
 
     def get_placeholders(self):
         return self._placeholder_space_features,self._placeholder_space_features_local, self._placeholder_other_features, \
@@ -55,219 +53,84 @@ class SparseConvClusteringSpatialMinLoss2(SparseConvClusteringBase):
         return self.create_loss_weight_by_energy(single_xentr)
         
         
-    def create_loss_weight_by_energy(self, loss_per_vertex):
-        
-        num_entries = tf.squeeze(self._placeholder_num_entries, axis=1)
-        print('num_entries',num_entries.shape)
+    def _loss_energy(self):
         energy = self._placeholder_other_features[:, :, 0]
-        
-        
-        sqrt_energy = None
+        if self.E_loss:
+            return energy
         if self.log_loss:
-            sqrt_energy = tf.log(energy+1)
-        else:
-            sqrt_energy = tf.sqrt(energy)
-        
+            return tf.log(energy+1)
+        return tf.sqrt(energy)
+
+    def create_loss_weight_by_energy(self, loss_per_vertex):
+        """
+        Weights the loss of every vertex and shower by the energy (see E_loss and log_loss) of the vertex in the
+        shower. Only builds the loss, the response diagnostics are in make_response_metrics.
+
+        :param loss_per_vertex: Loss [B, V, >=2] of every vertex for both showers
+        :return: The loss
+        """
+        targets = self._placeholder_targets
+
+        weights = targets * self._loss_energy()[:, :, tf.newaxis]
+        weight_sums = tf.reduce_sum(weights, axis=1)
+        weighted_loss = tf.reduce_sum(loss_per_vertex[:, :, 0:2] * weights, axis=1)
+
+        # Mean over the batch of (loss_a + loss_b) / 2
+        self.total_loss = tf.reduce_mean(weighted_loss / weight_sums)
+
+        if self.sum_loss:
+            return self.total_loss
+        return tf.reduce_mean(tf.reduce_sum(weighted_loss, axis=1) / tf.reduce_sum(weight_sums, axis=1))
+
+    def make_response_metrics(self):
+        """
+        Builds the diagnostics of the energy response of both showers. They aren't needed for the loss, so they are
+        only added to the validation summaries and aren't computed in training steps.
+        """
+        energy = self._placeholder_other_features[:, :, 0]
         prediction = self._graph_output
         targets = self._placeholder_targets
-        
-        maxlen = self.max_entries
-        #if self.use_seeds:
-        #    energy=energy[:,0:-1] 
-        #    targets = targets[:,0:-1,:]
-        
-        total_energy   = tf.reduce_sum(energy, axis=-1)
-        
-        print('total_energy',total_energy.shape)
-        
-        energies = targets * energy[:,:, tf.newaxis]
-        energy_sums = tf.reduce_sum(energies , axis=1)
-        energy_a = energy_sums[:,0]
-        energy_b = energy_sums[:,1]
-        
-        print('energy_a',energy_a.shape)
-        
-        sqrt_energies = targets * sqrt_energy[:,:, tf.newaxis]
-        
-        print('sqrt_energies',sqrt_energies.shape)
-        
-        sqrt_energy_sum = tf.reduce_sum(sqrt_energies , axis=1)
-        sqrt_energy_a = sqrt_energy_sum[:,0]
-        sqrt_energy_b = sqrt_energy_sum[:,1]
-        
-        print('sqrt_energy_sum',sqrt_energy_sum.shape)
-        
-        diff_sq = loss_per_vertex
-        diff_sq_a = diff_sq[:,:,0]
-        diff_sq_b = diff_sq[:,:,1]
-        
-        print('diff_sq_a',diff_sq_a.shape)
-        
-        e_for_loss = sqrt_energies
-        esum_for_loss_a = sqrt_energy_a
-        esum_for_loss_b = sqrt_energy_b
-        
-        if self.E_loss:
-            e_for_loss = energies
-            esum_for_loss_a = energy_a
-            esum_for_loss_b = energy_b
-            
-        
-        loss_a = tf.reduce_sum(diff_sq_a * e_for_loss[:,:,0],axis=1) / (esum_for_loss_a)
-        loss_b = tf.reduce_sum(diff_sq_b * e_for_loss[:,:,1],axis=1) / (esum_for_loss_b)
-        
-        
-        old_loss = (tf.reduce_sum(diff_sq_a * e_for_loss[:,:,0],axis=1) + tf.reduce_sum(diff_sq_b * e_for_loss[:,:,1],axis=1))/(esum_for_loss_a+esum_for_loss_b)
-        
-        print('loss_a',loss_a.shape)
-        
-        total_loss = (loss_a + loss_b)/2.
-        
-        response_a = tf.reduce_sum(prediction[:,:,0]*energy, axis=1) / energy_a
-        response_b = tf.reduce_sum(prediction[:,:,1]*energy, axis=1) / energy_b
-        
-        
-        print('response_a',response_a.shape)
-        
-        total_response = tf.concat([response_a , response_b], axis=0)
-        
+
+        energy_a = tf.reduce_sum(targets[:, :, 0] * energy, axis=1)
+
+        responses = shower_responses(prediction[:, :, 0:2], targets, energy)
+        response_a = responses[:, 0]
+
+        total_response = tf.concat([responses[:, 0], responses[:, 1]], axis=0)
+
         self.mean_resolution, self.variance_resolution = self.normalise_response(total_response)
-        
-        
-        
-        
+
         low_energy_resp = tf.where(energy_a<20000., response_a, tf.zeros_like(response_a))
         high_energy_resp = tf.where(energy_a>40000., response_a, tf.zeros_like(response_a))
         n_low_energy = tf.where(energy_a<20000., tf.zeros_like(response_a)+1, tf.zeros_like(response_a))
         n_high_energy = tf.where(energy_a>40000., tf.zeros_like(response_a)+1, tf.zeros_like(response_a))
-        
+
         low_energy_mean = tf.reduce_sum(low_energy_resp,axis=0,keepdims=True) / tf.reduce_sum(n_low_energy,axis=0,keepdims=True)
         low_energy_mean = tf.tile(low_energy_mean, [low_energy_resp.shape[0]])
         self.low_energy_mean  = tf.reduce_mean(low_energy_mean)
         high_energy_mean = tf.reduce_sum(high_energy_resp,axis=0,keepdims=True) / tf.reduce_sum(n_high_energy,axis=0,keepdims=True)
         high_energy_mean = tf.tile(high_energy_mean, [low_energy_resp.shape[0]])
         self.high_energy_mean = tf.reduce_mean(high_energy_mean)
-        
+
         low_energy_resp = tf.where(n_low_energy>0., low_energy_resp, low_energy_mean)
         self.low_energy_var  = tf.reduce_mean(tf.reduce_sum((low_energy_resp-low_energy_mean)**2,axis=0) / tf.reduce_sum(n_low_energy,axis=0))
-        
+
         high_energy_resp = tf.where(n_high_energy>0., high_energy_resp, high_energy_mean)
         self.high_energy_var = tf.reduce_mean(tf.reduce_sum((high_energy_resp-high_energy_mean)**2,axis=0) / tf.reduce_sum(n_high_energy,axis=0))
-        
-        
-        
-        
-        self.total_loss = tf.reduce_mean(total_loss)
-        
-        sqrt_response_a = tf.reduce_sum(prediction[:,:,0]*sqrt_energies[:,:,0], axis=1) / sqrt_energy_a
-        sqrt_response_b = tf.reduce_sum(prediction[:,:,1]*sqrt_energies[:,:,1], axis=1) / sqrt_energy_b
-        
-        sqrt_total_response = tf.concat([sqrt_response_a , sqrt_response_b], axis=0)
-        
-        self.mean_sqrt_resolution, self.variance_sqrt_resolution = self.normalise_response(sqrt_total_response)    
-  
-  
-        if self.sum_loss:
-            return self.total_loss
-        return tf.reduce_mean(old_loss)
 
+        sqrt_energies = targets * (tf.log(energy+1) if self.log_loss else tf.sqrt(energy))[:, :, tf.newaxis]
+        sqrt_responses = tf.reduce_sum(prediction[:, :, 0:2] * sqrt_energies, axis=1) / tf.reduce_sum(sqrt_energies,
+                                                                                                     axis=1)
+        sqrt_total_response = tf.concat([sqrt_responses[:, 0], sqrt_responses[:, 1]], axis=0)
+
+        self.mean_sqrt_resolution, self.variance_sqrt_resolution = self.normalise_response(sqrt_total_response)
 
     def get_loss2(self):
         assert self._graph_output.shape[2] >= 2
 
-        num_entries = tf.squeeze(self._placeholder_num_entries, axis=1)
-        print('num_entries',num_entries.shape)
-        energy = self._placeholder_other_features[:, :, 0]
-        
-        ###
-        sqrt_energy = None
-        if self.log_loss:
-            sqrt_energy = tf.log(energy+1)
-        else:
-            sqrt_energy = tf.sqrt(energy)
-        
-        prediction = self._graph_output
-        targets = self._placeholder_targets
-        
-        maxlen = self.max_entries
-        #if self.use_seeds:
-        #    energy=energy[:,0:-1] 
-        #    targets = targets[:,0:-1,:]
-        
-        total_energy   = tf.reduce_sum(energy, axis=-1)
-        
-        print('total_energy',total_energy.shape)
-        
-        energies = targets * energy[:,:, tf.newaxis]
-        energy_sums = tf.reduce_sum(energies , axis=1)
-        energy_a = energy_sums[:,0]
-        energy_b = energy_sums[:,1]
-        
-        print('energy_a',energy_a.shape)
-        
-        sqrt_energies = targets * sqrt_energy[:,:, tf.newaxis]
-        
-        print('sqrt_energies',sqrt_energies.shape)
-        
-        sqrt_energy_sum = tf.reduce_sum(sqrt_energies , axis=1)
-        sqrt_energy_a = sqrt_energy_sum[:,0]
-        sqrt_energy_b = sqrt_energy_sum[:,1]
-        
-        print('sqrt_energy_sum',sqrt_energy_sum.shape)
-        
-        diff_sq = (prediction[:,:,0:2] - targets) ** 2.
-        
-        
+        diff_sq = (self._graph_output[:,:,0:2] - self._placeholder_targets) ** 2.
+
         return self.create_loss_weight_by_energy(diff_sq)
-        
-        diff_sq_a = diff_sq[:,:,0]
-        diff_sq_b = diff_sq[:,:,1]
-        
-        print('diff_sq_a',diff_sq_a.shape)
-        
-        e_for_loss = sqrt_energies
-        esum_for_loss_a = sqrt_energy_a
-        esum_for_loss_b = sqrt_energy_b
-        
-        if self.E_loss:
-            e_for_loss = energies
-            esum_for_loss_a = energy_a
-            esum_for_loss_b = energy_b
-            
-        
-        loss_a = tf.reduce_sum(diff_sq_a * e_for_loss[:,:,0],axis=1) / (esum_for_loss_a)
-        loss_b = tf.reduce_sum(diff_sq_b * e_for_loss[:,:,1],axis=1) / (esum_for_loss_b)
-        
-        
-        old_loss = (tf.reduce_sum(diff_sq_a * e_for_loss[:,:,0],axis=1) + tf.reduce_sum(diff_sq_b * e_for_loss[:,:,1],axis=1))/(esum_for_loss_a+esum_for_loss_b)
-        
-        print('loss_a',loss_a.shape)
-        
-        total_loss = (loss_a + loss_b)/2.
-        
-        response_a = tf.reduce_sum(prediction[:,:,0]*energy, axis=1) / energy_a
-        response_b = tf.reduce_sum(prediction[:,:,1]*energy, axis=1) / energy_b
-        
-        
-        print('response_a',response_a.shape)
-        
-        total_response = tf.concat([response_a , response_b], axis=0)
-        
-        self.mean_resolution, self.variance_resolution = self.normalise_response(total_response)
-        
-        self.total_loss = tf.reduce_mean(total_loss)
-        
-        sqrt_response_a = tf.reduce_sum(prediction[:,:,0]*sqrt_energies[:,:,0], axis=1) / sqrt_energy_a
-        sqrt_response_b = tf.reduce_sum(prediction[:,:,1]*sqrt_energies[:,:,1], axis=1) / sqrt_energy_b
-        
-        sqrt_total_response = tf.concat([sqrt_response_a , sqrt_response_b], axis=0)
-        
-        self.mean_sqrt_resolution, self.variance_sqrt_resolution = self.normalise_response(sqrt_total_response)    
-  
-  
-        if self.sum_loss:
-            return self.total_loss
-        return tf.reduce_mean(old_loss) #+ tf.reduce_mean(0.1*tf.abs(1-self.mean_resolution)+0.1*self.variance_resolution)
 
     def _get_loss(self):
         if self.xentr_loss:
@@ -1069,7 +932,7 @@ class SparseConvClusteringSpatialMinLoss2(SparseConvClusteringBase):
         feat = sparse_conv_collapse(_input)
         feat = zero_out_by_energy(feat)
         feat = tf.layers.batch_normalization(feat, training=self.is_train)
-        feat, indices = construct_binning16(feat)
+        feat, binning = construct_binning16(feat)
         print(feat.shape)
         
         feat_list=[]
@@ -1109,8 +972,7 @@ class SparseConvClusteringSpatialMinLoss2(SparseConvClusteringBase):
             pass
             assert int(feat.shape[-1])>=4
             print('feat a',feat.shape)
-            feat = tf.reshape(feat, [int(feat.shape[0]), 16, 16, 20, 4, int(int(feat.shape[-1])/4)])
-            feat = tf.gather_nd(feat, indices)
+            feat = unbin_vertices(feat, binning)
             vert_list.append(feat)
             print('feat b',feat.shape)
             
@@ -1123,7 +985,7 @@ class SparseConvClusteringSpatialMinLoss2(SparseConvClusteringBase):
         feat = sparse_conv_collapse(_input)
         feat = zero_out_by_energy(feat)
         feat = tf.layers.batch_normalization(feat, training=self.is_train)
-        feat, indices = construct_binning20(feat)
+        feat, binning = construct_binning20(feat)
         print(feat.shape)
         
         feat_list=[]
@@ -1163,8 +1025,7 @@ class SparseConvClusteringSpatialMinLoss2(SparseConvClusteringBase):
             pass
             assert int(feat.shape[-1])>=1
             print('feat a',feat.shape)
-            feat = tf.reshape(feat, [int(feat.shape[0]), 20, 20, 20, 1, int(int(feat.shape[-1])/1)])
-            feat = tf.gather_nd(feat, indices)
+            feat = unbin_vertices(feat, binning)
             vert_list.append(feat)
             print('feat b',feat.shape)
             
@@ -1177,7 +1038,7 @@ class SparseConvClusteringSpatialMinLoss2(SparseConvClusteringBase):
         feat = sparse_conv_collapse(_input)
         feat = zero_out_by_energy(feat)
         feat = tf.layers.batch_normalization(feat, training=self.is_train)
-        feat, indices = construct_binning20(feat)
+        feat, binning = construct_binning20(feat)
         print(feat.shape)
         
         feat_list=[]
@@ -1203,8 +1064,7 @@ class SparseConvClusteringSpatialMinLoss2(SparseConvClusteringBase):
             pass
             assert int(feat.shape[-1])>=1
             print('feat a',feat.shape)
-            feat = tf.reshape(feat, [int(feat.shape[0]), 20, 20, 20, 1, int(int(feat.shape[-1])/1)])
-            feat = tf.gather_nd(feat, indices)
+            feat = unbin_vertices(feat, binning)
             vert_list.append(feat)
             print('feat b',feat.shape)
             
@@ -1365,32 +1225,32 @@ class SparseConvClusteringSpatialMinLoss2(SparseConvClusteringBase):
 
             self.make_placeholders()
 
-            self._graph_output = self._compute_output()
+            self._graph_output = self._compute_active_output()
 
             # self._graph_temp = tf.nn.softmax(self.__graph_logits)
 
             self._graph_loss = self._get_loss()
             
-            update_ops = tf.get_collection(tf.GraphKeys.UPDATE_OPS)
+            update_ops = self.get_update_ops()
             print(update_ops)
             with tf.control_dependencies(update_ops):
-                self._graph_optimizer = tf.train.AdamOptimizer(learning_rate=self.learning_rate).minimize(self._graph_loss)
+                self._graph_optimizer = self.get_adam_optimizer().minimize(self._graph_loss)
+
+            self.make_response_metrics()
 
-            # Repeating, maybe there is a better way?
+            # Only the loss is computed in training steps, the diagnostics in validation steps
             self._graph_summary_loss = tf.summary.scalar('loss', self._graph_loss)
-            self._graph_summaries = tf.summary.merge([self._graph_summary_loss, 
-                                                      tf.summary.scalar('mean-res', self.mean_resolution), 
-                                                      tf.summary.scalar('variance-res', self.variance_resolution),
-                                                      #tf.summary.scalar('mean-res-sqrt', self.mean_sqrt_resolution), 
-                                                      #tf.summary.scalar('variance-res-sqrt', self.variance_sqrt_resolution), 
-                                                      tf.summary.scalar('learning-rate', self.learning_rate),
-                                                      tf.summary.scalar('low_energy_mean',self.low_energy_mean),
-                                                      tf.summary.scalar('high_energy_mean',self.high_energy_mean),
-                                                      tf.summary.scalar('low_energy_var',self.low_energy_var),
-                                                      tf.summary.scalar('high_energy_var',self.high_energy_var)])
+            self._graph_summaries = tf.summary.merge([self._graph_summary_loss,
+                                                      tf.summary.scalar('learning-rate', self.learning_rate)])
 
             self._graph_summary_loss_validation = tf.summary.scalar('Validation Loss', self._graph_loss)
-            self._graph_summaries_validation = tf.summary.merge([self._graph_summary_loss_validation])
+            self._graph_summaries_validation = tf.summary.merge([self._graph_summary_loss_validation,
+                                                                 tf.summary.scalar('mean-res', self.mean_resolution),
+                                                                 tf.summary.scalar('variance-res', self.variance_resolution),
+                                                                 tf.summary.scalar('low_energy_mean',self.low_energy_mean),
+                                                                 tf.summary.scalar('high_energy_mean',self.high_energy_mean),
+                                                                 tf.summary.scalar('low_energy_var',self.low_energy_var),
+                                                                 tf.summary.scalar('high_energy_var',self.high_energy_var)])
 
     def get_losses(self):
         print("Hello, world!")
@@ -1,9 +1,15 @@
 import tensorflow as tf
 from models.model import Model
 from ops.sparse_conv import *
+import ops.sparse_conv_2 as sparse_conv_2
+from ops.neighbors import KNN_RECALL_COLLECTION
+from ops.packing import active_hits_mask, hit_packing, pack_hits, unpack_hits, pack_indices
+from ops.allreduce import AllreduceOptimizer
+from readers.geometry_registry import load_neighbor_table
 import inspect
 import sys
 import importlib
+import contextlib
 
 class lr_scheduler(object):
     def __init__(self, lr_dict=[], lr=0.0001):
@@ -41,7 +47,18 @@ class lr_scheduler(object):
 
         
 
+# Op types which are never compiled with XLA when set_xla_jit is used: their output shapes depend on the data, they
+# run on the host or they only produce summaries
+xla_jit_excluded_op_types = ['Where', 'Unique', 'UniqueWithCounts', 'DynamicPartition', 'PyFunc', 'PyFuncStateless',
+                             'Assert', 'Print', 'ScalarSummary', 'HistogramSummary', 'MergeSummary',
+                             'IteratorGetNext', 'IteratorFromStringHandle', 'CollectiveReduce', 'CollectiveBcastSend',
+                             'CollectiveBcastRecv']
+
+
 class SparseConvClusteringBase(Model):
+    # Whether _compute_output can run on the active hits in any order, see set_hit_packing
+    supports_hit_packing = True
+
     def __init__(self, n_space, n_space_local, n_others, n_target_dim, batch_size, max_entries, learning_rate=0.0001):
         self.initialized = False
         self.n_space = n_space
@@ -55,6 +72,18 @@ class SparseConvClusteringBase(Model):
         self.learningrate_scheduler = lr_scheduler(lr=learning_rate)
         self.use_seeds=False
         self.is_train = tf.placeholder(tf.bool, name="is_train");
+        self._input_feeds = None
+        self._adam_optimizer = None
+        self.bucket_lengths = None
+        self._bucket_name_scope = None
+        self._graph_knn_recall = None
+        self.xla_jit = False
+        self.xla_jit_excluded_op_types = []
+        self.pack_hits = False
+        self._packed_entries = None
+        self.data_parallel_workers = 1
+        self.geometry = None
+        self.geometry_spatial_columns = None
         
 
         
@@ -62,7 +91,172 @@ class SparseConvClusteringBase(Model):
         if self.initialized:
             print("Already initialized")
             return
-        self._construct_graphs()
+        with self._jit_scope():
+            if self.bucket_lengths is None:
+                self._construct_graphs()
+                self._construct_knn_recall()
+            else:
+                self._construct_bucket_graphs()
+
+    def set_xla_jit(self, enabled, excluded_op_types=()):
+        """
+        Compiles the ops of the model with XLA (JIT), so that chains of small ops like the ones of the GravNet and
+        GarNet layers are fused. Has to be called before initialize. Ops of the types in xla_jit_excluded_op_types
+        or excluded_op_types and ops which XLA has no kernel for are left out of the compiled clusters and run as
+        usual, so an op type for which the compilation fails can be excluded on its own.
+
+        :param enabled: Whether to compile with XLA
+        :param excluded_op_types: Additional op types (e.g. 'TopKV2') not to compile
+        :return:
+        """
+        self.xla_jit = enabled
+        self.xla_jit_excluded_op_types = list(excluded_op_types)
+
+    def set_hit_packing(self, enabled):
+        """
+        Runs _compute_output only on the active hits of every event (the first num_entries which have non-zero
+        energy) moved to the front of a shorter layout, and moves its output back to max_entries hits for the loss and
+        the output, see ops.packing. With bucket lengths (see set_bucket_lengths) the graphs are built for these
+        packed lengths while their placeholders keep max_entries, and select_packed_bucket picks the shortest one for
+        a batch. Without, the packed length is max_entries. Has to be called before initialize.
+
+        :param enabled: Whether to pack the active hits
+        :return:
+        """
+        if enabled and not self.supports_hit_packing:
+            raise ValueError("%s depends on the order of the hits, it can't pack them" % type(self).__name__)
+        self.pack_hits = enabled
+
+    def set_data_parallel(self, num_workers):
+        """
+        Averages the gradients over num_workers workers which train the same model on different batches before they
+        are applied, see ops.allreduce. The graph has to be built on the device of the worker. Has to be called before
+        initialize.
+
+        :param num_workers: Number of workers, 1 to train alone
+        :return:
+        """
+        self.data_parallel_workers = num_workers
+
+    def set_geometry(self, name, spatial_columns):
+        """
+        Sets the geometry of the hits, if they come in its fixed sensor order and the spatial features are the raw
+        cell positions. The layers which search neighbours in the raw space then take them from the neighbour tables
+        of the geometry registry instead, see get_neighbor_table. Has to be called before initialize.
+
+        :param name: Name of the geometry, e.g. beta_calo, None if the hits aren't in a fixed sensor order
+        :param spatial_columns: Columns of the input data of the spatial features
+        :return:
+        """
+        self.geometry = name
+        self.geometry_spatial_columns = None if spatial_columns is None else tuple(spatial_columns)
+
+    def get_neighbor_table(self, k):
+        """
+        Returns the precomputed k nearest neighbours [max_entries, k] of the cells of the geometry, or None if they
+        have to be searched, i.e. without geometry, with hit packing, for bucket lengths shorter than the geometry or
+        if no table for the spatial columns has been generated
+
+        :param k: Number of neighbours
+        :return: Numpy array [max_entries, k] or None
+        """
+        if self.geometry is None or self.pack_hits:
+            return None
+        try:
+            neighbor_table, columns = load_neighbor_table(self.geometry, k)
+        except IOError:
+            return None
+        if len(neighbor_table) != self.max_entries or columns != self.geometry_spatial_columns:
+            return None
+        return neighbor_table
+
+    def _jit_scope(self):
+        if not self.xla_jit:
+            return contextlib.suppress()
+        excluded = set(xla_jit_excluded_op_types) | set(self.xla_jit_excluded_op_types)
+        return tf.contrib.compiler.jit.experimental_jit_scope(compile_ops=lambda node_def: node_def.op not in excluded)
+
+    def set_bucket_lengths(self, bucket_lengths):
+        """
+        Builds one graph per padded length instead of one for max_entries, for readers which batch events into
+        buckets of similar number of entries. The graphs share all the variables. Has to be called before
+        initialize. Use select_bucket to switch between them.
+
+        :param bucket_lengths: List of padded lengths
+        :return:
+        """
+        self.bucket_lengths = sorted(bucket_lengths)
+
+    def _construct_bucket_graphs(self):
+        # Layers of ops.sparse_conv_2 name their variables with a global counter, it has to start from the same
+        # value for every bucket to get the same variables
+        naming_index = sparse_conv_2._sparse_conv_naming_index
+        max_entries = self.max_entries
+        self._bucket_graphs = dict()
+        with tf.variable_scope(tf.get_variable_scope(), reuse=tf.AUTO_REUSE):
+            for length in self.bucket_lengths:
+                sparse_conv_2._sparse_conv_naming_index = naming_index
+                if self.pack_hits:
+                    self._packed_entries = length
+                else:
+                    self.max_entries = length
+                with tf.name_scope('bucket_%d' % length) as name_scope:
+                    self._bucket_name_scope = name_scope
+                    self._construct_graphs()
+                    self._construct_knn_recall()
+                self._bucket_graphs[length] = {key: value for key, value in self.__dict__.items() if
+                                               key.startswith('_graph') or key.startswith('_placeholder')}
+        self.max_entries = max_entries
+        self._packed_entries = None
+        self._bucket_name_scope = None
+        self.select_bucket(self.bucket_lengths[-1])
+
+    def select_bucket(self, length):
+        """
+        Makes the getters (get_placeholders, get_losses etc.) return the graph built for the given padded length
+
+        :param length: One of the bucket lengths
+        :return:
+        """
+        self.__dict__.update(self._bucket_graphs[length])
+
+    def select_packed_bucket(self, num_active_hits):
+        """
+        Selects the graph of the shortest packed length which holds num_active_hits hits, see set_hit_packing
+
+        :param num_active_hits: Largest number of active hits of the events of the batch
+        :return:
+        """
+        lengths = [length for length in self.bucket_lengths if length >= num_active_hits]
+        self.select_bucket(lengths[0] if len(lengths) != 0 else self.bucket_lengths[-1])
+
+    def _construct_knn_recall(self):
+        # Mean recall of the approximate neighbour searches of the graph, if they measure it
+        recalls = tf.get_collection(KNN_RECALL_COLLECTION, scope=self._bucket_name_scope)
+        self._graph_knn_recall = tf.reduce_mean(tf.stack(recalls)) if len(recalls) != 0 else None
+
+    def get_knn_recall(self):
+        """
+        Returns the mean recall of the approximate k nearest neighbours searches against the exact ones, or None if
+        it isn't measured (see ops.neighbors.set_knn_approximate)
+        """
+        return self._graph_knn_recall
+
+    def get_adam_optimizer(self):
+        """
+        Returns one Adam optimizer per model, so that its slots are shared if more than one graph is built
+        """
+        if self._adam_optimizer is None:
+            self._adam_optimizer = tf.train.AdamOptimizer(learning_rate=self.learning_rate)
+            if self.data_parallel_workers > 1:
+                self._adam_optimizer = AllreduceOptimizer(self._adam_optimizer, self.data_parallel_workers)
+        return self._adam_optimizer
+
+    def get_update_ops(self):
+        """
+        Returns the update ops (batch norm etc.) of the graph which is being constructed
+        """
+        return tf.get_collection(tf.GraphKeys.UPDATE_OPS, scope=self._bucket_name_scope)
 
     def get_summary(self):
         return self._graph_summaries
@@ -101,6 +295,42 @@ class SparseConvClusteringBase(Model):
     def _compute_output(self):
         raise("Not implemented")
 
+    def _compute_active_output(self):
+        """
+        Same as _compute_output, but on the packed active hits if set_hit_packing is used. The output is moved back to
+        the max_entries hits of the placeholders and is zero for the other hits.
+        """
+        if not self.pack_hits:
+            return self._compute_output()
+        length = self.max_entries if self._packed_entries is None else self._packed_entries
+
+        # _compute_output reads the placeholders, they're replaced by their packed version while it runs
+        placeholders = {key: value for key, value in self.__dict__.items() if key.startswith('_placeholder')}
+        with tf.name_scope('pack_hits'):
+            mask = active_hits_mask(self._placeholder_num_entries, self.max_entries,
+                                    self._placeholder_other_features[:, :, 0])
+            hit_rows, positions, num_packed = hit_packing(mask, length)
+            packed = dict()
+            for key, value in placeholders.items():
+                if key == '_placeholder_num_entries':
+                    packed[key] = tf.cast(num_packed[:, tf.newaxis], value.dtype)
+                elif key == '_placeholder_seed_indices':
+                    packed[key] = pack_indices(value, positions)
+                else:
+                    packed[key] = pack_hits(value, hit_rows)
+
+        max_entries = self.max_entries
+        self.__dict__.update(packed)
+        self.max_entries = length
+        try:
+            output = self._compute_output()
+        finally:
+            self.__dict__.update(placeholders)
+            self.max_entries = max_entries
+
+        with tf.name_scope('unpack_hits'):
+            return unpack_hits(output, positions)
+
     def get_variable_scope(self):
         return 'sparse_conv_v1'
 
@@ -116,12 +346,58 @@ class SparseConvClusteringBase(Model):
 
         return tf.reduce_mean(loss_unreduced)
 
+    def set_input_feeds(self, feeds, spatial_features_indices, spatial_features_local_indices, other_features_indices,
+                        target_indices):
+        """
+        Builds the graph directly on the reader feeds instead of on plain placeholders. The columns are selected
+        in-graph and the placeholders become tf.placeholder_with_default, so they can still be fed to override the
+        feeds. Has to be called before initialize.
+
+        :param feeds: Reader feeds (data, num_entries) or (data, num_entries, seed_indices)
+        :param spatial_features_indices: Columns of data to use as spatial features
+        :param spatial_features_local_indices: Columns of data to use as local spatial features
+        :param other_features_indices: Columns of data to use as other features
+        :param target_indices: Columns of data to use as targets
+        :return:
+        """
+        data = feeds[0]
+        column_groups = [tf.gather(data, list(columns), axis=2) for columns in
+                         (spatial_features_indices, spatial_features_local_indices, other_features_indices,
+                          target_indices)]
+        self.set_input_feeds_split(column_groups, feeds[1], feeds[2] if len(feeds) > 2 else None)
+
+    def set_input_feeds_split(self, column_groups, num_entries, seed_indices=None):
+        """
+        Same as set_input_feeds but for readers which already split data into the column groups.
+
+        :param column_groups: (spatial features, spatial local features, other features, targets)
+        :param num_entries: Number of entries feed
+        :param seed_indices: Seed indices feed, if the reader returns them
+        :return:
+        """
+        self._input_feeds = dict()
+        self._input_feeds['features_space'] = column_groups[0]
+        self._input_feeds['features_space_local'] = column_groups[1]
+        self._input_feeds['features_others'] = column_groups[2]
+        self._input_feeds['targets'] = column_groups[3]
+        self._input_feeds['num_entries'] = num_entries
+        if seed_indices is not None:
+            self._input_feeds['seed_indices'] = seed_indices
+
+    def _make_input_placeholder(self, key, dtype, shape):
+        if self._input_feeds is None or key not in self._input_feeds:
+            return tf.placeholder(dtype=dtype, shape=shape)
+        return tf.placeholder_with_default(tf.cast(self._input_feeds[key], dtype), shape=shape)
+
     def make_placeholders(self):
-        self._placeholder_space_features = tf.placeholder(dtype=tf.float32, shape=[self.batch_size, self.max_entries, self.n_space])
-        self._placeholder_space_features_local = tf.placeholder(dtype=tf.float32, shape=[self.batch_size, self.max_entries, self.n_space_local])
-        self._placeholder_other_features = tf.placeholder(dtype=tf.float32, shape=[self.batch_size, self.max_entries, self.n_other_features])
-        self._placeholder_targets = tf.placeholder(dtype=tf.float32, shape=[self.batch_size, self.max_entries, self.n_target_dim])
-        self._placeholder_num_entries = tf.placeholder(dtype=tf.int64, shape=[self.batch_size, 1])
+        self._placeholder_space_features = self._make_input_placeholder('features_space', tf.float32, [self.batch_size, self.max_entries, self.n_space])
+        self._placeholder_space_features_local = self._make_input_placeholder('features_space_local', tf.float32, [self.batch_size, self.max_entries, self.n_space_local])
+        self._placeholder_other_features = self._make_input_placeholder('features_others', tf.float32, [self.batch_size, self.max_entries, self.n_other_features])
+        self._placeholder_targets = self._make_input_placeholder('targets', tf.float32, [self.batch_size, self.max_entries, self.n_target_dim])
+        self._placeholder_num_entries = self._make_input_placeholder('num_entries', tf.int64, [self.batch_size, 1])
+
+    def make_seed_indices_placeholder(self):
+        self._placeholder_seed_indices = self._make_input_placeholder('seed_indices', tf.int64, [self.batch_size, 2])
 
 
     def _construct_graphs(self):
@@ -131,13 +407,13 @@ class SparseConvClusteringBase(Model):
 
             self.make_placeholders()
 
-            self._graph_output = self._compute_output()
+            self._graph_output = self._compute_active_output()
 
             # self._graph_temp = tf.nn.softmax(self.__graph_logits)
 
             self._graph_loss = self._get_loss()
 
-            self._graph_optimizer = tf.train.AdamOptimizer(learning_rate=self.learning_rate).minimize(self._graph_loss)
+            self._graph_optimizer = self.get_adam_optimizer().minimize(self._graph_loss)
 
             # Repeating, maybe there is a better way?
             self._graph_summary_loss = tf.summary.scalar('Loss', self._graph_loss)
@@ -0,0 +1,98 @@
+"""
+Synchronous data parallel training over the collective ops of TensorFlow. Every worker builds the same graph on its
+own device, computes the gradients of its part of the batch and averages them with the other workers with an
+allreduce before applying them, so the variables stay the same on all workers. The workers can be CPU devices of one
+process or processes of a local cluster, see trainers.sparse_conv_clustering.
+"""
+import tensorflow as tf
+from tensorflow.python.ops import collective_ops
+
+
+# All the workers take part in every collective op
+GROUP_KEY = 1
+
+# Instance key of the last collective op. The workers match their collective ops by the instance key, so they have to
+# be built in the same order on every worker.
+_collective_instance_key = 0
+
+
+def _next_instance_key():
+    global _collective_instance_key
+    _collective_instance_key += 1
+    return _collective_instance_key
+
+
+def all_reduce_mean(tensors, num_workers):
+    """
+    Averages tensors over the workers
+
+    :param tensors: List of tensors, all placed on the device of the worker
+    :param num_workers: Number of workers
+    :return: List of the averages
+    """
+    averages = []
+    for tensor in tensors:
+        with tf.device(tensor.device):
+            averages.append(collective_ops.all_reduce(tensor, num_workers, GROUP_KEY, _next_instance_key(), 'Add',
+                                                      'Div'))
+    return averages
+
+
+def broadcast_variables(variables, num_workers, is_chief):
+    """
+    Makes an op which sets the variables of all the workers to the values of the chief, e.g. after initializing or
+    restoring them
+
+    :param variables: List of variables, in the same order on every worker
+    :param num_workers: Number of workers
+    :param is_chief: Whether this worker is the one which sends its values
+    :return: The op
+    """
+    assignments = []
+    for variable in variables:
+        instance_key = _next_instance_key()
+        dtype = variable.dtype.base_dtype
+        with tf.device(variable.device):
+            if is_chief:
+                received = collective_ops.broadcast_send(variable.read_value(), variable.shape, dtype, num_workers,
+                                                         GROUP_KEY, instance_key)
+            else:
+                received = collective_ops.broadcast_recv(variable.shape, dtype, num_workers, GROUP_KEY, instance_key)
+            assignments.append(tf.assign(variable, received))
+    return tf.group(*assignments)
+
+
+class AllreduceOptimizer(tf.train.Optimizer):
+    """
+    Wraps an optimizer so that the gradients are averaged over the workers before they're applied. Every call of
+    compute_gradients (or minimize) adds one allreduce per variable, so the workers have to run the same train ops.
+    """
+    def __init__(self, optimizer, num_workers, name='Allreduce'):
+        """
+        :param optimizer: The optimizer which applies the averaged gradients
+        :param num_workers: Number of workers
+        """
+        super(AllreduceOptimizer, self).__init__(use_locking=False, name=name)
+        self._optimizer = optimizer
+        self.num_workers = num_workers
+
+    def compute_gradients(self, *args, **kwargs):
+        grads_and_vars = self._optimizer.compute_gradients(*args, **kwargs)
+        with tf.name_scope(self._name):
+            reduced = [(index, tf.convert_to_tensor(gradient)) for index, (gradient, _) in enumerate(grads_and_vars)
+                       if gradient is not None]
+            averages = dict(zip([index for index, _ in reduced],
+                                all_reduce_mean([gradient for _, gradient in reduced], self.num_workers)))
+        return [(averages.get(index), variable) for index, (_, variable) in enumerate(grads_and_vars)]
+
+    def apply_gradients(self, *args, **kwargs):
+        return self._optimizer.apply_gradients(*args, **kwargs)
+
+    def get_slot(self, *args, **kwargs):
+        return self._optimizer.get_slot(*args, **kwargs)
+
+    def get_slot_names(self, *args, **kwargs):
+        return self._optimizer.get_slot_names(*args, **kwargs)
+
+    def variables(self, *args, **kwargs):
+        return self._optimizer.variables(*args, **kwargs)
@@ -0,0 +1,232 @@
+import tensorflow as tf
+import numpy as np
+from .neighbors import cached_index_tensor
+from readers.geometry_registry import load_binning
+
+
+# Active voxels and their neighbour tables by binning, see active_voxels and voxel_neighbor_table
+_active_voxels = dict()
+_voxel_neighbor_tables = dict()
+
+# Whether the binning models run on the active voxels of their binning only, see set_sparse_voxels
+sparse_voxels = False
+
+
+def set_sparse_voxels(enabled):
+    """
+    Makes the binning models which support it (their convolutions all have stride 1) keep only the active voxels of
+    their binning and use submanifold_conv3d instead of dense 3-D convolutions, see voxel_binning
+
+    :param enabled: Whether to use the active voxels only
+    :return:
+    """
+    global sparse_voxels
+    sparse_voxels = enabled
+
+
+def voxel_binning(name):
+    """
+    Returns the binning to pass to bin_vertices, binned_conv3d and unbin_vertices for the active voxels only, or None
+    for the dense binned tensor, depending on set_sparse_voxels
+
+    :param name: Name of the binning
+    :return: name or None
+    """
+    return name if sparse_voxels else None
+
+
+def _binning_tensors(name):
+    """
+    Returns the index of the bin slot of every cell [N] and the index of the cell in every bin slot [slots] of a
+    binning. Empty slots point to cell N. Only the [N, 4] table of the binning goes into the graph, once per graph,
+    see cached_index_tensor. Both tensors only depend on constants, so they are folded when the graph is optimized.
+    """
+    table, shape = load_binning(name)
+    n_cells = len(table)
+    n_slots = int(np.prod(shape))
+
+    def _cell_to_slot():
+        strides = [shape[1] * shape[2] * shape[3], shape[2] * shape[3], shape[3], 1]
+        return tf.reduce_sum(tf.constant(table, dtype=tf.int32) * tf.constant(strides, dtype=tf.int32), axis=1)
+
+    cell_to_slot = cached_index_tensor('binning_cell_to_slot_' + name, [n_cells], tf.int32, _cell_to_slot)
+
+    def _slot_to_cell():
+        # Every slot holds at most one cell (see readers.geometry_registry.compute_binning)
+        return tf.scatter_nd(cell_to_slot[:, tf.newaxis], tf.range(n_cells) - n_cells, [n_slots]) + n_cells
+
+    slot_to_cell = cached_index_tensor('binning_slot_to_cell_' + name, [n_slots], tf.int32, _slot_to_cell)
+
+    return cell_to_slot, slot_to_cell
+
+
+def active_voxels(name):
+    """
+    Returns the voxels (x bin, y bin, layer) of a binning which hold at least one cell. All the other voxels are
+    zero in every event.
+
+    :param name: Name of the binning
+    :return: Numpy array [V, 3] of int32, sorted like the flattened binned tensor
+    """
+    if name not in _active_voxels:
+        table, _ = load_binning(name)
+        _active_voxels[name] = np.unique(table[:, 0:3], axis=0).astype(np.int32)
+    return _active_voxels[name]
+
+
+def _kernel_offsets(kernel_size):
+    # Offsets of the kernel entries in the order of the conv3d kernel, with the 'same' padding of tf.layers.conv3d
+    return np.array([[i, j, k] for i in range(-((kernel_size[0] - 1) // 2), kernel_size[0] // 2 + 1)
+                     for j in range(-((kernel_size[1] - 1) // 2), kernel_size[1] // 2 + 1)
+                     for k in range(-((kernel_size[2] - 1) // 2), kernel_size[2] // 2 + 1)], dtype=np.int32)
+
+
+def voxel_neighbor_table(name, kernel_size):
+    """
+    Returns the active voxel at every kernel position around every active voxel of a binning. Kernel positions which
+    are outside of the grid or on an empty voxel point to voxel V, which is a row of zeros.
+
+    :param name: Name of the binning
+    :param kernel_size: Kernel size (x, y, layer)
+    :return: Numpy array [V, kernel volume] of int32
+    """
+    key = (name, tuple(kernel_size))
+    if key not in _voxel_neighbor_tables:
+        _, shape = load_binning(name)
+        voxels = active_voxels(name)
+        voxel_ids = -np.ones(shape[0:3], dtype=np.int32)
+        voxel_ids[voxels[:, 0], voxels[:, 1], voxels[:, 2]] = np.arange(len(voxels))
+
+        neighbors = voxels[:, np.newaxis, :] + _kernel_offsets(kernel_size)[np.newaxis, :, :]
+        inside = np.all((neighbors >= 0) & (neighbors < np.array(shape[0:3])), axis=2)
+        neighbors = np.minimum(np.maximum(neighbors, 0), np.array(shape[0:3]) - 1)
+        table = voxel_ids[neighbors[..., 0], neighbors[..., 1], neighbors[..., 2]]
+        table[np.logical_or(np.logical_not(inside), table == -1)] = len(voxels)
+        _voxel_neighbor_tables[key] = table
+    return _voxel_neighbor_tables[key]
+
+
+def _voxel_tensors(name):
+    """
+    Returns the index of the active voxel entry of every cell [N] and the index of the cell in every entry of the
+    active voxels [V * entries per bin]. Empty entries point to cell N.
+    """
+    table, shape = load_binning(name)
+    n_cells = len(table)
+    voxels = active_voxels(name)
+    n_entries = len(voxels) * shape[3]
+
+    def _cell_to_entry():
+        voxel_ids = -np.ones(shape[0:3], dtype=np.int32)
+        voxel_ids[voxels[:, 0], voxels[:, 1], voxels[:, 2]] = np.arange(len(voxels))
+        cell_voxels = voxel_ids[table[:, 0], table[:, 1], table[:, 2]]
+        return tf.constant(cell_voxels * shape[3] + table[:, 3], dtype=tf.int32)
+
+    cell_to_entry = cached_index_tensor('binning_cell_to_voxel_entry_' + name, [n_cells], tf.int32, _cell_to_entry)
+
+    def _entry_to_cell():
+        return tf.scatter_nd(cell_to_entry[:, tf.newaxis], tf.range(n_cells) - n_cells, [n_entries]) + n_cells
+
+    entry_to_cell = cached_index_tensor('binning_voxel_entry_to_cell_' + name, [n_entries], tf.int32, _entry_to_cell)
+
+    return cell_to_entry, entry_to_cell
+
+
+def bin_vertices(vertices, name, active_voxels_only=False):
+    """
+    Moves the vertices of a fixed geometry into the bins of one of its binnings, see readers.geometry_registry.
+    Same as tf.scatter_nd with the indices of binning_indexing_array, but the batch dimension is broadcast instead of
+    being part of the indices.
+
+    :param vertices: Vertices [B, N, F] in the sensor order of the geometry
+    :param name: Name of the binning
+    :param active_voxels_only: Return only the voxels which hold cells, for submanifold_conv3d
+    :return: Binned tensor [B, x bins, y bins, layers, entries per bin * F] or [B, V, entries per bin * F] with the
+             active voxels only. Empty entries are zero.
+    """
+    _, shape = load_binning(name)
+    if active_voxels_only:
+        _, slot_to_cell = _voxel_tensors(name)
+    else:
+        _, slot_to_cell = _binning_tensors(name)
+    n_features = int(vertices.shape[2])
+
+    padded = tf.concat((vertices, tf.zeros_like(vertices[:, 0:1, :])), axis=1)
+    binned = tf.gather(padded, slot_to_cell, axis=1)
+    if active_voxels_only:
+        return tf.reshape(binned, [-1, len(active_voxels(name)), shape[3] * n_features])
+    return tf.reshape(binned, [-1, shape[0], shape[1], shape[2], shape[3] * n_features])
+
+
+def unbin_vertices(binned, name, active_voxels_only=False):
+    """
+    Inverse of bin_vertices, takes the features of every cell out of its bin
+
+    :param binned: Binned tensor [B, x bins, y bins, layers, entries per bin * F] or [B, V, entries per bin * F]
+    :param name: Name of the binning
+    :param active_voxels_only: Whether binned holds the active voxels only
+    :return: Vertices [B, N, F] in the sensor order of the geometry
+    """
+    _, shape = load_binning(name)
+    if active_voxels_only:
+        cell_to_slot, _ = _voxel_tensors(name)
+        n_slots = len(active_voxels(name)) * shape[3]
+    else:
+        cell_to_slot, _ = _binning_tensors(name)
+        n_slots = int(np.prod(shape))
+    n_features = int(binned.shape[-1]) // shape[3]
+
+    binned = tf.reshape(binned, [-1, n_slots, n_features])
+    return tf.gather(binned, cell_to_slot, axis=1)
+
+
+def submanifold_conv3d(voxels, name, filters, kernel_size, activation=None, layer_name=None):
+    """
+    Same as tf.layers.conv3d with stride 1 and 'same' padding on the binned tensor, but only on the active voxels of
+    a binning (see bin_vertices with active_voxels_only) and only for the active voxels. The empty voxels are taken as
+    zero, so for one layer the result is the same as the dense convolution at the active voxels. The kernel has the
+    same shape and initialization as the one of tf.layers.conv3d.
+
+    :param voxels: Active voxels [B, V, C]
+    :param name: Name of the binning
+    :param filters: Number of output channels
+    :param kernel_size: Kernel size (x, y, layer)
+    :param activation: Activation function or None
+    :param layer_name: Name of the variable scope
+    :return: Active voxels [B, V, filters]
+    """
+    kernel_size = list(kernel_size)
+    n_voxels = int(voxels.shape[1])
+    n_channels = int(voxels.shape[2])
+    kernel_volume = int(np.prod(kernel_size))
+
+    with tf.variable_scope(layer_name, default_name='submanifold_conv3d'):
+        kernel = tf.get_variable('kernel', kernel_size + [n_channels, filters], dtype=voxels.dtype,
+                                 initializer=tf.glorot_uniform_initializer())
+        bias = tf.get_variable('bias', [filters], dtype=voxels.dtype, initializer=tf.zeros_initializer())
+
+        if kernel_volume == 1:
+            gathered = voxels
+        else:
+            neighbors = cached_index_tensor('voxel_neighbors_' + name, [n_voxels] + kernel_size, tf.int32,
+                                            lambda: tf.constant(voxel_neighbor_table(name, kernel_size)))
+            padded = tf.concat((voxels, tf.zeros_like(voxels[:, 0:1, :])), axis=1)
+            gathered = tf.gather(padded, neighbors, axis=1)  # [B, V, kernel volume, C]
+
+        gathered = tf.reshape(gathered, [-1, kernel_volume * n_channels])
+        output = tf.matmul(gathered, tf.reshape(kernel, [kernel_volume * n_channels, filters]))
+        output = tf.reshape(tf.nn.bias_add(output, bias), [-1, n_voxels, filters])
+
+        if activation is not None:
+            output = activation(output)
+    return output
+
+
+def binned_conv3d(x, filters, kernel_size, activation=None, binning=None):
+    """
+    tf.layers.conv3d with stride 1 and 'same' padding on the dense binned tensor if binning is None, otherwise
+    submanifold_conv3d on the active voxels of the binning. Lets the binning models switch between both.
+    """
+    if binning is None:
+        return tf.layers.conv3d(x, filters, kernel_size, activation=activation, padding='same')
+    return submanifold_conv3d(x, binning, filters, kernel_size, activation=activation)
@@ -1,6 +1,174 @@
 import tensorflow as tf
 
 
+# Query block size of the k nearest neighbours search behind indexing_tensor_2, None to build the full distance
+# matrix. See set_knn_block_size.
+knn_block_size = None
+
+
+def set_knn_block_size(block_size):
+    """
+    Makes indexing_tensor_2 find the neighbours block by block of query vertices (see
+    nearest_neighbor_matrix_blocked) instead of building the full [B, N, N] distance matrix.
+
+    :param block_size: Number of query vertices per block, None to disable
+    :return:
+    """
+    global knn_block_size
+    knn_block_size = block_size
+
+
+# Cell capacity of the grid k nearest neighbours search behind indexing_tensor and indexing_tensor_2 for spatial
+# features with at most 4 dimensions, None for the brute force search. See set_knn_grid_cell_capacity.
+knn_grid_cell_capacity = None
+
+
+def set_knn_grid_cell_capacity(cell_capacity):
+    """
+    Makes indexing_tensor and indexing_tensor_2 search the neighbours of low dimensional (S <= 4) spatial features
+    on a uniform grid (see nearest_neighbor_matrix_grid). Takes precedence over the blocked search.
+
+    :param cell_capacity: Max number of vertices per cell which are considered, None to disable
+    :return:
+    """
+    global knn_grid_cell_capacity
+    knn_grid_cell_capacity = cell_capacity
+
+
+# Parameters of the approximate k nearest neighbours search behind indexing_tensor_2 (meant for learned spaces), None
+# for the exact search. See set_knn_approximate.
+knn_approximate = None
+
+# Collection of the measured recalls of the approximate searches
+KNN_RECALL_COLLECTION = 'knn_recall'
+
+
+def set_knn_approximate(n_projections=4, window=None, measure_recall=False):
+    """
+    Makes indexing_tensor_2 search the neighbours approximately (see nearest_neighbor_matrix_approximate), unless the
+    grid search is used. More projections and a larger window give a higher recall for more compute.
+
+    :param n_projections: Number of random directions, None to disable
+    :param window: Number of candidates per direction, None for 4 * k
+    :param measure_recall: Also build the exact search and add the recall against it to KNN_RECALL_COLLECTION. It
+                           only costs when the recall is evaluated, e.g. in the validation steps.
+    :return:
+    """
+    global knn_approximate
+    if n_projections is None:
+        knn_approximate = None
+    else:
+        knn_approximate = {'n_projections': n_projections, 'window': window, 'measure_recall': measure_recall}
+
+
+# Whether indexing_tensor and indexing_tensor_2 reuse earlier searches on the same spatial features, see
+# set_knn_memoization
+knn_memoization = True
+
+
+def set_knn_memoization(enabled):
+    """
+    Makes indexing_tensor and indexing_tensor_2 search the neighbours of a spatial features tensor only once per
+    graph, see _memoized_search. The neighbours are the same, so this is only meant to be disabled for comparisons.
+
+    :param enabled: Whether to reuse the searches
+    :return:
+    """
+    global knn_memoization
+    knn_memoization = enabled
+
+
+def _graph_cache(graph, name):
+    """
+    Returns a dict which is attached to the graph, to keep tensors of the graph for later layers. Tensors reference
+    their graph, so they can't be kept in a dict outside of it without keeping the graph alive after e.g.
+    tf.reset_default_graph.
+
+    :param graph: The graph
+    :param name: Name of the cache
+    :return: The dict
+    """
+    attribute = '_neighbors_cache_' + name
+    if not hasattr(graph, attribute):
+        setattr(graph, attribute, dict())
+    return getattr(graph, attribute)
+
+
+def _memoized_search(spatial_features, k, search, search_function):
+    """
+    Returns search_function(k), the neighbours [B, N, k] of spatial_features and their distances [B, N, k] sorted by
+    distance, but searches only once per graph: a later search on the same spatial_features tensor with the same
+    search and a k up to the one of an earlier search takes the first k columns of its result. A search with a
+    larger k replaces the earlier one.
+
+    :param spatial_features: Spatial features of shape [B, N, S]
+    :param k: Max neighbors
+    :param search: Hashable parameters of the search which change its result, e.g. ('grid', cell_capacity)
+    :param search_function: Function of k which runs the search
+    :return: Neighbours [B, N, k] and their distances [B, N, k]
+    """
+    if not knn_memoization:
+        return search_function(k)
+
+    graph = tf.get_default_graph()
+    # A search inside of a while loop or cond can't be used outside of it
+    key = (spatial_features, search, graph._get_control_flow_context())
+    # Neighbour searches of the graph by (spatial features, search, control flow context)
+    searches = _graph_cache(graph, 'neighbor_searches')
+
+    if key in searches and searches[key][0] >= k:
+        searched_k, neighbor_matrix, distance_matrix = searches[key]
+        if searched_k == k:
+            return neighbor_matrix, distance_matrix
+        return neighbor_matrix[:, :, 0:k], distance_matrix[:, :, 0:k]
+
+    neighbor_matrix, distance_matrix = search_function(k)
+    searches[key] = (k, neighbor_matrix, distance_matrix)
+    return neighbor_matrix, distance_matrix
+
+
+def cached_index_tensor(name, shape, dtype, build_function):
+    """
+    Returns the tensor which build_function builds, but builds it only once per graph for the same name, shape and
+    dtype. Index helpers like n_range_tensor only depend on these, so all the layers of a model can share one copy
+    instead of adding their own tile/concat subgraph or constant. The tensor is built at the top level of the graph,
+    outside of any control flow, control dependencies and name scopes, so that it can be used everywhere in it.
+
+    :param name: Name of the kind of tensor
+    :param shape: Static shape (list of ints) or other hashable parameters the tensor depends on
+    :param dtype: dtype of the tensor
+    :param build_function: Function without arguments which builds the tensor
+    :return: The tensor
+    """
+    graph = tf.get_default_graph()
+    key = (name, tuple([int(x) for x in shape]), tf.as_dtype(dtype))
+    # Index helper tensors of the graph by (name, shape, dtype)
+    index_tensors = _graph_cache(graph, 'index_tensors')
+    if key not in index_tensors:
+        with graph.control_dependencies(None), graph.name_scope(None):
+            with tf.name_scope('index_tensors'):
+                index_tensors[key] = build_function()
+    return index_tensors[key]
+
+
+def batch_range_tensor(shape, dtype=tf.int32):
+    """
+    Tensor of the given shape [B, ...] which holds the batch index of every element, to build gather_nd indexing
+    tensors. It's cached, see cached_index_tensor.
+
+    :param shape: Static shape, usually [B, ..., 1]
+    :param dtype: dtype of the tensor
+    :return: The tensor
+    """
+    shape = [int(x) for x in shape]
+
+    def _build():
+        batch_range = tf.reshape(tf.range(0, shape[0], dtype=dtype), [shape[0]] + [1] * (len(shape) - 1))
+        return tf.tile(batch_range, [1] + shape[1:])
+
+    return cached_index_tensor('batch_range', shape, dtype, _build)
+
+
 def euclidean_squared(A, B):
     """
     Returns euclidean distance between two batches of shape [B,N,F] and [B,M,F] where B is batch size, N is number of
@@ -68,7 +236,316 @@ def nearest_neighbor_matrix_2(spatial_features, k=10):
     return N, -D
 
 
-def indexing_tensor(spatial_features, k=10):
+def batch_gather(params, indices):
+    """
+    Gathers along the second dimension of params [B, N, ...] with indices [B, ...] into the same batch element, e.g.
+    a neighbour matrix [B, M, K] or the ids of selected vertices [B, M]. Gives the same as gather_nd with an indexing
+    tensor [B, ..., 2] of (batch, index) pairs, but the batch is added to int32 indices as a flat row offset, so no
+    batch index tensor is built.
+
+    :param params: Tensor of shape [B, N, ...]
+    :param indices: Integer tensor of shape [B, ...] with values in [0, N)
+    :return: Tensor of shape indices.shape + params.shape[2:]
+    """
+    params_shape = params.get_shape().as_list()
+    dynamic_shape = tf.shape(params)
+    n_batch = params_shape[0] if params_shape[0] is not None else dynamic_shape[0]
+    n_max_entries = params_shape[1] if params_shape[1] is not None else dynamic_shape[1]
+
+    indices = tf.cast(indices, tf.int32)
+    offsets_shape = [-1] + [1] * (indices.get_shape().ndims - 1)
+    if params_shape[0] is not None and params_shape[1] is not None:
+        offsets = cached_index_tensor('batch_offsets', [n_batch, n_max_entries, len(offsets_shape)], tf.int32,
+                                      lambda: tf.reshape(tf.range(0, n_batch) * n_max_entries, offsets_shape))
+    else:
+        offsets = tf.reshape(tf.range(0, n_batch) * n_max_entries, offsets_shape)
+
+    flat_params = tf.reshape(params, tf.concat(([-1], dynamic_shape[2:]), axis=0))
+    flat_params.set_shape([None] + params_shape[2:])
+    return tf.gather(flat_params, indices + offsets)
+
+
+def _gather_neighbors(features, neighbor_matrix):
+    """
+    Gathers features [B, N, F] of neighbours given by neighbor_matrix [B, M, K] of indices in the second dimension.
+    Returns tensor of shape [B, M, K, F]
+    """
+    return batch_gather(features, neighbor_matrix)
+
+
+def _select_candidates(candidates, selected):
+    """
+    Selects from candidates [B, N, C] of every vertex the ones given by selected [B, N, K] of indices in the last
+    dimension. Returns tensor of shape [B, N, K]
+    """
+    n_batch, n_max_entries, n_candidates = candidates.get_shape().as_list()
+    k = selected.get_shape().as_list()[2]
+    selected = _gather_neighbors(tf.reshape(candidates, [n_batch * n_max_entries, n_candidates, 1]),
+                                 tf.reshape(selected, [n_batch * n_max_entries, 1, k]))
+    return tf.reshape(selected, [n_batch, n_max_entries, k])
+
+
+def nearest_neighbor_matrix_blocked(spatial_features, k=10, block_size=256):
+    """
+    Same as nearest_neighbor_matrix_2 but the query vertices are processed in blocks of block_size one after
+    another, so only a [B, block_size, N] slice of the distance matrix exists at a time. The neighbours are
+    selected without gradient and their distances are recomputed from the coordinates, so the backward pass doesn't
+    keep the distance slices either.
+
+    :param spatial_features: Spatial features of shape [B, N, S] where B = batch size, N = max examples in batch,
+                             S = spatial features
+    :param k: Max neighbors
+    :param block_size: Number of query vertices per block
+    :return: Neighbours [B, N, k] and their squared distances [B, N, k]
+    """
+    shape = spatial_features.get_shape().as_list()
+
+    assert spatial_features.dtype == tf.float32 or spatial_features.dtype == tf.float64
+    assert len(shape) == 3
+
+    n_batch, n_max_entries, n_spatial = shape
+    n_blocks = (n_max_entries + block_size - 1) // block_size
+
+    queries = tf.pad(spatial_features, [[0, 0], [0, n_blocks * block_size - n_max_entries], [0, 0]])
+    queries = tf.transpose(tf.reshape(queries, [n_batch, n_blocks, block_size, n_spatial]), perm=[1, 0, 2, 3])
+
+    candidates = tf.stop_gradient(spatial_features)
+
+    def _find_in_block(queries_block):
+        D = euclidean_squared(tf.stop_gradient(queries_block), candidates)
+        _, N = tf.nn.top_k(-D, k)
+        return N
+
+    # One block at a time, otherwise all the blocks could be evaluated in parallel
+    neighbor_matrix = tf.map_fn(_find_in_block, queries, dtype=tf.int32, parallel_iterations=1, back_prop=False)
+    neighbor_matrix = tf.reshape(tf.transpose(neighbor_matrix, perm=[1, 0, 2, 3]), [n_batch, -1, k])
+    neighbor_matrix = neighbor_matrix[:, 0:n_max_entries, :]
+
+    neighbors = _gather_neighbors(spatial_features, neighbor_matrix)
+    distance_matrix = tf.reduce_sum((neighbors - tf.expand_dims(spatial_features, axis=2)) ** 2, axis=3)
+
+    return neighbor_matrix, distance_matrix
+
+
+def _grid_cell_offsets(n_spatial):
+    """
+    Returns the 3^n_spatial offsets of a cell and all of its adjacent cells as list of lists
+    """
+    offsets = [[]]
+    for _ in range(n_spatial):
+        offsets = [offset + [step] for offset in offsets for step in (-1, 0, 1)]
+    return offsets
+
+
+def nearest_neighbor_matrix_grid(spatial_features, k=10, cell_capacity=32, n_cells_per_dim=None):
+    """
+    Same as nearest_neighbor_matrix_2 but for low dimensional spatial features (S <= 4). The bounding box of every
+    event is divided into a uniform grid and every vertex only looks at the vertices in its own and the adjacent
+    cells, at most cell_capacity of them per cell. That's 3^S * cell_capacity candidates per vertex instead of N.
+
+    The result is checked to be exact: the k-th distance of every vertex must not be larger than its distance to
+    the border of the searched cells, and none of the searched cells may have been cut to cell_capacity. If any
+    vertex of the batch fails the check, e.g. because its cells are too sparse, the whole batch falls back to the
+    brute force search. The neighbours are selected without gradient and their distances are recomputed from the
+    coordinates, same as in nearest_neighbor_matrix_blocked.
+
+    :param spatial_features: Spatial features of shape [B, N, S] where B = batch size, N = max examples in batch,
+                             S = spatial features
+    :param k: Max neighbors
+    :param cell_capacity: Max number of vertices per cell which are considered
+    :param n_cells_per_dim: Number of cells along every dimension. If None, it's chosen such that uniformly
+                            distributed vertices fill a quarter of the cell capacity on average.
+    :return: Neighbours [B, N, k] and their squared distances [B, N, k]
+    """
+    shape = spatial_features.get_shape().as_list()
+
+    assert spatial_features.dtype == tf.float32 or spatial_features.dtype == tf.float64
+    assert len(shape) == 3
+    assert shape[2] <= 4
+
+    n_batch, n_max_entries, n_spatial = shape
+    if n_cells_per_dim is None:
+        n_cells_per_dim = max(1, int(round((4. * n_max_entries / cell_capacity) ** (1. / n_spatial))))
+    n_cells = n_cells_per_dim ** n_spatial
+    offsets = _grid_cell_offsets(n_spatial)
+    n_candidates = len(offsets) * cell_capacity
+
+    x = tf.stop_gradient(spatial_features)
+    infinity = tf.ones_like(x) * float('inf')
+
+    # Cell of every vertex [B, N, S] and its flat id [B, N]
+    lower = tf.reduce_min(x, axis=1, keepdims=True)
+    cell_width = tf.maximum((tf.reduce_max(x, axis=1, keepdims=True) - lower) / n_cells_per_dim, 1e-12)
+    cell_coordinates = tf.clip_by_value(tf.cast(tf.floor((x - lower) / cell_width), tf.int32), 0, n_cells_per_dim - 1)
+    strides = tf.constant([n_cells_per_dim ** (n_spatial - 1 - i) for i in range(n_spatial)], dtype=tf.int32)
+    cell_ids = tf.reduce_sum(cell_coordinates * strides, axis=2)
+
+    # Vertices ordered by cell and, for every cell, its number of vertices and the position of its first one
+    _, vertices_by_cell = tf.nn.top_k(-cell_ids, n_max_entries)
+    batch_offsets = tf.expand_dims(tf.range(0, n_batch) * n_cells, axis=1)
+    cell_counts = tf.reshape(tf.unsorted_segment_sum(tf.ones_like(cell_ids), cell_ids + batch_offsets,
+                                                     n_batch * n_cells), [n_batch, n_cells])
+    cell_starts = tf.cumsum(cell_counts, axis=1, exclusive=True)
+
+    # Own and adjacent cells of every vertex [B, N, 3^S]
+    searched_coordinates = tf.expand_dims(cell_coordinates, axis=2) + tf.constant(offsets, dtype=tf.int32)
+    searched_valid = tf.reduce_all(tf.logical_and(searched_coordinates >= 0, searched_coordinates < n_cells_per_dim),
+                                   axis=3)
+    searched_ids = tf.reduce_sum(tf.clip_by_value(searched_coordinates, 0, n_cells_per_dim - 1) * strides, axis=3)
+    searched_counts = _gather_neighbors(tf.expand_dims(cell_counts, axis=2), searched_ids)[..., 0]
+    searched_counts = tf.where(searched_valid, searched_counts, tf.zeros_like(searched_counts))
+    searched_starts = _gather_neighbors(tf.expand_dims(cell_starts, axis=2), searched_ids)[..., 0]
+
+    # Candidates [B, N, 3^S * cell_capacity]
+    slots = tf.range(0, cell_capacity)
+    candidates_valid = tf.reshape(tf.expand_dims(searched_counts, axis=3) > slots,
+                                  [n_batch, n_max_entries, n_candidates])
+    positions = tf.reshape(tf.minimum(tf.expand_dims(searched_starts, axis=3) + slots, n_max_entries - 1),
+                           [n_batch, n_max_entries, n_candidates])
+    candidates = _gather_neighbors(tf.expand_dims(vertices_by_cell, axis=2), positions)[..., 0]
+
+    D = tf.reduce_sum((_gather_neighbors(x, candidates) - tf.expand_dims(x, axis=2)) ** 2, axis=3)
+    D = tf.where(candidates_valid, D, tf.ones_like(D) * float('inf'))
+    D, N = tf.nn.top_k(-D, k)
+    neighbor_matrix_grid = _select_candidates(candidates, N)
+
+    # Nothing outside of the searched cells can be closer than the distance to their border. There is nothing
+    # beyond the outermost cells.
+    kth_distance = -D[:, :, k - 1]
+    margin_lower = tf.where(cell_coordinates > 0,
+                            x - lower - tf.cast(cell_coordinates - 1, x.dtype) * cell_width, infinity)
+    margin_upper = tf.where(cell_coordinates < n_cells_per_dim - 1,
+                            lower + tf.cast(cell_coordinates + 2, x.dtype) * cell_width - x, infinity)
+    margin = tf.reduce_min(tf.minimum(margin_lower, margin_upper), axis=2)
+    # Cells cut to cell_capacity don't matter if k vertices at the same position were found (e.g. padding)
+    truncated = tf.reduce_any(searched_counts > cell_capacity, axis=2)
+    exact = tf.logical_and(kth_distance <= margin ** 2, tf.logical_or(tf.logical_not(truncated), kth_distance <= 0))
+
+    neighbor_matrix = tf.cond(tf.reduce_all(exact), lambda: neighbor_matrix_grid,
+                              lambda: nearest_neighbor_matrix(x, k))
+
+    neighbors = _gather_neighbors(spatial_features, neighbor_matrix)
+    distance_matrix = tf.reduce_sum((neighbors - tf.expand_dims(spatial_features, axis=2)) ** 2, axis=3)
+
+    return neighbor_matrix, distance_matrix
+
+
+def nearest_neighbor_matrix_approximate(spatial_features, k=10, n_projections=4, window=None):
+    """
+    Approximate version of nearest_neighbor_matrix_2 for higher dimensional (e.g. learned) spaces. The vertices are
+    ordered along n_projections random directions and every vertex only looks at the window vertices around it in
+    each of these orders, that's n_projections * window candidates instead of N. The directions are drawn anew at
+    every step. The recall, the fraction of the exact neighbours which are found, increases with n_projections and
+    window. It can be measured with neighbor_recall.
+
+    The neighbours are selected without gradient and their distances are recomputed from the coordinates, same as
+    in nearest_neighbor_matrix_blocked.
+
+    :param spatial_features: Spatial features of shape [B, N, S] where B = batch size, N = max examples in batch,
+                             S = spatial features
+    :param k: Max neighbors
+    :param n_projections: Number of random directions
+    :param window: Number of candidates per direction, None for 4 * k
+    :return: Neighbours [B, N, k] and their squared distances [B, N, k]
+    """
+    shape = spatial_features.get_shape().as_list()
+
+    assert spatial_features.dtype == tf.float32 or spatial_features.dtype == tf.float64
+    assert len(shape) == 3
+
+    n_batch, n_max_entries, n_spatial = shape
+    window = min(4 * k if window is None else window, n_max_entries)
+    assert k <= window
+    n_candidates = n_projections * window
+
+    x = tf.stop_gradient(spatial_features)
+
+    # Order of the vertices along every direction and the position of every vertex in it [B, P, N]
+    directions = tf.random_normal([n_spatial, n_projections], dtype=x.dtype)
+    projected = tf.transpose(tf.tensordot(x, directions, axes=[[2], [0]]), perm=[0, 2, 1])
+    projected.set_shape([n_batch, n_projections, n_max_entries])
+    _, order = tf.nn.top_k(projected, n_max_entries)
+    _, positions = tf.nn.top_k(-order, n_max_entries)
+
+    # Window around every vertex, shifted at the ends so that it always has window vertices
+    window_start = tf.clip_by_value(positions - window // 2, 0, n_max_entries - window)
+    window_positions = tf.reshape(tf.expand_dims(window_start, axis=3) + tf.range(0, window),
+                                  [n_batch * n_projections, n_max_entries, window])
+    candidates = _gather_neighbors(tf.reshape(order, [n_batch * n_projections, n_max_entries, 1]),
+                                   window_positions)
+    candidates = tf.reshape(candidates, [n_batch, n_projections, n_max_entries, window])
+    candidates = tf.reshape(tf.transpose(candidates, perm=[0, 2, 1, 3]), [n_batch, n_max_entries, n_candidates])
+
+    # The same vertex can be in the windows of more than one direction, only its first occurrence is kept
+    candidates, _ = tf.nn.top_k(candidates, n_candidates)
+    duplicate = tf.concat((tf.zeros([n_batch, n_max_entries, 1], dtype=tf.bool),
+                           tf.equal(candidates[:, :, 1:], candidates[:, :, 0:-1])), axis=2)
+
+    D = tf.reduce_sum((_gather_neighbors(x, candidates) - tf.expand_dims(x, axis=2)) ** 2, axis=3)
+    D = tf.where(duplicate, tf.ones_like(D) * float('inf'), D)
+    _, N = tf.nn.top_k(-D, k)
+    neighbor_matrix = _select_candidates(candidates, N)
+
+    neighbors = _gather_neighbors(spatial_features, neighbor_matrix)
+    distance_matrix = tf.reduce_sum((neighbors - tf.expand_dims(spatial_features, axis=2)) ** 2, axis=3)
+
+    return neighbor_matrix, distance_matrix
+
+
+def neighbor_recall(neighbor_matrix, exact_neighbor_matrix):
+    """
+    Fraction of the exact nearest neighbours [B, N, k] which are in neighbor_matrix [B, N, k]
+
+    :return: Scalar recall
+    """
+    found = tf.equal(tf.expand_dims(exact_neighbor_matrix, axis=3), tf.expand_dims(neighbor_matrix, axis=2))
+    return tf.reduce_mean(tf.cast(tf.reduce_any(found, axis=3), tf.float32))
+
+
+def _use_grid(spatial_features, cell_capacity):
+    return cell_capacity is not None and spatial_features.get_shape().as_list()[2] <= 4
+
+
+def indexing_tensor_static(neighbor_table, n_batch, k=None, compact=False):
+    """
+    Indexing tensor of precomputed neighbours of a fixed geometry (see readers.geometry_registry.load_neighbor_table).
+    Same as what indexing_tensor returns, but it's a constant and no distances are computed.
+
+    :param neighbor_table: Numpy array [N, K] of the neighbour indices of every cell
+    :param n_batch: Batch size
+    :param k: Number of neighbours, the first k columns of the table are used. None for all of them.
+    :param compact: Return the int32 neighbour matrix [B, N, k] for batch_gather instead
+    :return: Indexing tensor [B, N, k, 2]
+    """
+    if k is not None:
+        assert k <= neighbor_table.shape[1]
+        neighbor_table = neighbor_table[:, 0:k]
+    n_max_entries, k = neighbor_table.shape
+
+    if compact:
+        return tf.tile(tf.expand_dims(tf.constant(neighbor_table, dtype=tf.int32), axis=0), [n_batch, 1, 1])
+
+    batch_range = batch_range_tensor([n_batch, n_max_entries, k, 1], tf.int64)
+    expanded_neighbor_matrix = tf.expand_dims(tf.expand_dims(tf.constant(neighbor_table, dtype=tf.int64), axis=0),
+                                              axis=3)
+    expanded_neighbor_matrix = tf.tile(expanded_neighbor_matrix, [n_batch, 1, 1, 1])
+
+    return tf.concat([batch_range, expanded_neighbor_matrix], axis=3)
+
+
+def indexing_tensor(spatial_features, k=10, cell_capacity=-1, neighbor_table=None, compact=False):
+    """
+    Indexing tensor of the k nearest neighbours.
+
+    :param spatial_features: Spatial features of shape [B, N, S]
+    :param k: Max neighbors
+    :param cell_capacity: Cell capacity for nearest_neighbor_matrix_grid if S <= 4, None for the brute force search
+                          and -1 for the module default (see set_knn_grid_cell_capacity)
+    :param neighbor_table: Precomputed neighbours [N, >=k] of a fixed geometry, if spatial_features are the raw cell
+                           positions in sensor order. Nothing is computed then.
+    :param compact: Return the int32 neighbour matrix [B, N, k] for batch_gather instead
+    :return: Indexing tensor [B, N, k, 2]
+    """
 
     shape_spatial_features = spatial_features.get_shape().as_list()
 
@@ -81,10 +558,25 @@ def indexing_tensor(spatial_features, k=10):
     # Neighbor matrix should be int as it should be used for indexing
     assert spatial_features.dtype == tf.float64 or spatial_features.dtype == tf.float32
 
-    neighbor_matrix = nearest_neighbor_matrix(spatial_features, k)
+    if neighbor_table is not None:
+        assert neighbor_table.shape[0] == n_max_entries
+        return indexing_tensor_static(neighbor_table, n_batch, k, compact)
+
+    if cell_capacity == -1:
+        cell_capacity = knn_grid_cell_capacity
+
+    if _use_grid(spatial_features, cell_capacity):
+        neighbor_matrix, _ = _memoized_search(
+            spatial_features, k, ('grid', cell_capacity),
+            lambda k: nearest_neighbor_matrix_grid(spatial_features, k, cell_capacity))
+    else:
+        neighbor_matrix, _ = _memoized_search(spatial_features, k, ('exact',),
+                                              lambda k: nearest_neighbor_matrix_2(spatial_features, k))
 
-    batch_range = tf.expand_dims(tf.expand_dims(tf.expand_dims(tf.range(0, n_batch), axis=1),axis=1), axis=1)
-    batch_range = tf.tile(batch_range, [1,n_max_entries,k,1])
+    if compact:
+        return neighbor_matrix
+
+    batch_range = batch_range_tensor([n_batch, n_max_entries, k, 1])
     expanded_neighbor_matrix = tf.expand_dims(neighbor_matrix, axis=3)
 
     _indexing_tensor = tf.concat([batch_range, expanded_neighbor_matrix], axis=3)
@@ -92,7 +584,23 @@ def indexing_tensor(spatial_features, k=10):
     return tf.cast(_indexing_tensor, tf.int64)
 
 
-def indexing_tensor_2(spatial_features, k=10, n_batch=-1):
+def indexing_tensor_2(spatial_features, k=10, n_batch=-1, block_size=-1, cell_capacity=-1, approximate=-1,
+                      compact=False):
+    """
+    Indexing tensor of the k nearest neighbours and their squared distances.
+
+    :param spatial_features: Spatial features of shape [B, N, S]
+    :param k: Max neighbors
+    :param n_batch: If positive, spatial_features has batch size 1 and the result is tiled to n_batch
+    :param block_size: Query block size for nearest_neighbor_matrix_blocked, None for the full distance matrix and
+                       -1 for the module default (see set_knn_block_size)
+    :param cell_capacity: Cell capacity for nearest_neighbor_matrix_grid if S <= 4, None to not use the grid and -1
+                          for the module default (see set_knn_grid_cell_capacity)
+    :param approximate: Parameters of the approximate search (see set_knn_approximate), None for the exact search
+                        and -1 for the module default. The grid search is exact and takes precedence.
+    :param compact: Return the int32 neighbour matrix [B, N, k] for batch_gather instead of the indexing tensor
+    :return: Indexing tensor [B, N, k, 2] and distances [B, N, k]
+    """
 
     shape_spatial_features = spatial_features.get_shape().as_list()
     generate_batch=True
@@ -107,10 +615,44 @@ def indexing_tensor_2(spatial_features, k=10, n_batch=-1):
     # Neighbor matrix should be int as it should be used for indexing
     assert spatial_features.dtype == tf.float64 or spatial_features.dtype == tf.float32
 
-    neighbor_matrix, distance_matrix = nearest_neighbor_matrix_2(spatial_features, k)
-
-    batch_range = tf.expand_dims(tf.expand_dims(tf.expand_dims(tf.range(0, n_batch), axis=1),axis=1), axis=1)
-    batch_range = tf.tile(batch_range, [1,n_max_entries,k,1])
+    if block_size == -1:
+        block_size = knn_block_size
+    if cell_capacity == -1:
+        cell_capacity = knn_grid_cell_capacity
+    if approximate == -1:
+        approximate = knn_approximate
+
+    if _use_grid(spatial_features, cell_capacity):
+        neighbor_matrix, distance_matrix = _memoized_search(
+            spatial_features, k, ('grid', cell_capacity),
+            lambda k: nearest_neighbor_matrix_grid(spatial_features, k, cell_capacity))
+    elif approximate is not None:
+        def _search_approximate(k):
+            neighbor_matrix, distance_matrix = nearest_neighbor_matrix_approximate(spatial_features, k,
+                                                                                   approximate['n_projections'],
+                                                                                   approximate['window'])
+            if approximate['measure_recall']:
+                exact_neighbor_matrix = nearest_neighbor_matrix(tf.stop_gradient(spatial_features), k)
+                tf.add_to_collection(KNN_RECALL_COLLECTION, neighbor_recall(neighbor_matrix, exact_neighbor_matrix))
+            return neighbor_matrix, distance_matrix
+
+        neighbor_matrix, distance_matrix = _memoized_search(
+            spatial_features, k, ('approximate', approximate['n_projections'], approximate['window']),
+            _search_approximate)
+    elif block_size is not None and block_size < n_max_entries:
+        # Same neighbours as the full distance matrix, so it's the same search
+        neighbor_matrix, distance_matrix = _memoized_search(
+            spatial_features, k, ('exact',), lambda k: nearest_neighbor_matrix_blocked(spatial_features, k, block_size))
+    else:
+        neighbor_matrix, distance_matrix = _memoized_search(spatial_features, k, ('exact',),
+                                                            lambda k: nearest_neighbor_matrix_2(spatial_features, k))
+
+    if compact:
+        if generate_batch:
+            neighbor_matrix = tf.tile(neighbor_matrix, [n_batch, 1, 1])
+        return neighbor_matrix, distance_matrix
+
+    batch_range = batch_range_tensor([n_batch, n_max_entries, k, 1])
     expanded_neighbor_matrix = tf.expand_dims(neighbor_matrix, axis=3)
     
     if generate_batch:
@@ -122,9 +664,22 @@ def indexing_tensor_2(spatial_features, k=10, n_batch=-1):
 
 
 def n_range_tensor(dims):
+    """
+    Tensor of shape dims + [len(dims)] which holds the index of every element. It's cached, see
+    cached_index_tensor.
+    """
     assert type(dims) is list
     assert len(dims) != 0
 
+    return cached_index_tensor('n_range', dims, tf.int32, lambda: _build_n_range_tensor(dims))
+
+
+def _n_range_tensor_leading(dims):
+    # Index of every element without the last dimension, to be combined with indices in the last dimension
+    return cached_index_tensor('n_range_leading', dims, tf.int32, lambda: n_range_tensor(dims)[..., 0:-1])
+
+
+def _build_n_range_tensor(dims):
     n_range_tensor = []
     for i in range(len(dims)):
         range_in_this_dim = tf.range(dims[i])
@@ -140,13 +695,17 @@ def n_range_tensor(dims):
     return tf.concat(n_range_tensor, axis=len(dims))
 
 
-def get_sorted_vertices_ids(x):
-    
+def get_sorted_vertices_ids(x, compact=False):
+    """
+    Indexing tensor [B, N, 2] which sorts the vertices by x [B, N] in descending order, or the int32 ids [B, N]
+    for batch_gather if compact is true
+    """
     _, I = tf.nn.top_k(x, x.shape[1])
+    if compact:
+        return I
     I = tf.expand_dims(I, axis=2)
 
-    batch_range = tf.expand_dims(tf.expand_dims(tf.range(0, x.shape[0]), axis=1), axis=1)
-    batch_range = tf.tile(batch_range, [1,x.shape[1], 1])
+    batch_range = batch_range_tensor([x.shape[0], x.shape[1], 1])
     _indexing_tensor = tf.concat([batch_range, I], axis=2)
     return _indexing_tensor
 
@@ -156,30 +715,18 @@ def sort_last_dim_tensor(x):
     
 
     ind = tf.expand_dims(ind, axis=-1)
-    tensor_combine_with = n_range_tensor(shape)
-    tensor_combine_with = tensor_combine_with[...,0:-1]
+    tensor_combine_with = _n_range_tensor_leading(shape)
     _indexing_tensor = tf.concat([tensor_combine_with, ind], axis=-1)
     return _indexing_tensor
 
 
-global saved_nd_range
-if not ('saved_nd_range' in globals()):
-    saved_nd_range = dict()
-
-
 def sort_last_dim_tensor_save(x):
-    global saved_nd_range
     shape = x.shape.as_list()
     v, ind = tf.nn.top_k(x, shape[-1])
 
     ind = tf.expand_dims(ind, axis=-1)
 
-    # hash_value = hash(tuple(shape))
-    # if hash_value in saved_nd_range:
-    #     tensor_combine_with = saved_nd_range[hash_value]
-    # else:
-    tensor_combine_with = n_range_tensor(shape)
-    tensor_combine_with = tensor_combine_with[...,0:-1]
+    tensor_combine_with = _n_range_tensor_leading(shape)
 
     _indexing_tensor = tf.concat([tensor_combine_with, ind], axis=-1)
     return _indexing_tensor
\ No newline at end of file
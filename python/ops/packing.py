@@ -0,0 +1,102 @@
+import tensorflow as tf
+import numpy as np
+from .neighbors import batch_gather
+
+
+def active_hits_mask(num_entries, num_vertices, energy=None):
+    """
+    Returns which hits of every event are active: the first num_entries and, if energy is given, only the ones with
+    non-zero energy among them (for the readers which return all the cells of a fixed geometry in every event)
+
+    :param num_entries: Number of entries [B, 1] or [B]
+    :param num_vertices: Number of hits V per event in the layout
+    :param energy: Energy [B, V] of the hits or None
+    :return: Boolean mask [B, V]
+    """
+    mask = tf.sequence_mask(tf.reshape(num_entries, [-1]), maxlen=num_vertices)
+    if energy is not None:
+        mask = tf.logical_and(mask, tf.not_equal(energy, 0))
+    return mask
+
+
+def hit_packing(mask, length):
+    """
+    Computes the compact layout of the active hits: every event keeps its active hits, in their order, in the first
+    rows of [B, length] and the remaining rows are padding. Events with more than length active hits lose the last
+    ones, so length should be at least the largest number of active hits of the batch.
+
+    :param mask: Active hits [B, V], see active_hits_mask
+    :param length: Number of rows per event in the compact layout
+    :return: Tuple of the row in the full layout of every row of the compact layout [B, length] (V for padding), the
+             row in the compact layout of every hit [B, V] (length for the hits which aren't packed) and the number
+             of packed hits of every event [B]
+    """
+    n_vertices = int(mask.shape[1])
+    # The batch size may only be known when running, e.g. in the input pipeline
+    n_batch = tf.shape(mask)[0]
+
+    positions = tf.cumsum(tf.cast(mask, tf.int32), axis=1, exclusive=True)
+    packed = tf.logical_and(mask, positions < length)
+    positions = tf.where(packed, positions, tf.ones_like(positions) * length)
+
+    # Every event has length + 1 slots in the flat layout. Slot length takes all the hits which aren't packed, their
+    # rows add up there but it is cut off.
+    slots = positions + tf.range(n_batch)[:, tf.newaxis] * (length + 1)
+    rows = tf.tile(tf.range(n_vertices)[tf.newaxis, :], tf.stack((n_batch, 1))) - n_vertices
+    hit_rows = tf.scatter_nd(tf.reshape(slots, [-1, 1]), tf.reshape(rows, [-1]),
+                             tf.reshape(n_batch * (length + 1), [1])) + n_vertices
+    hit_rows = tf.reshape(hit_rows, [-1, length + 1])[:, 0:length]
+    hit_rows.set_shape([mask.shape[0], length])
+
+    return hit_rows, positions, tf.reduce_sum(tf.cast(packed, tf.int32), axis=1)
+
+
+def pack_hits(x, hit_rows):
+    """
+    Moves per hit values into the compact layout, see hit_packing
+
+    :param x: Values [B, V, ...] in the full layout
+    :param hit_rows: Rows [B, length] in the full layout of the rows of the compact layout
+    :return: Values [B, length, ...], zero in the padding rows
+    """
+    padded = tf.concat((x, tf.zeros_like(x[:, 0:1])), axis=1)
+    return batch_gather(padded, hit_rows)
+
+
+def unpack_hits(packed, positions):
+    """
+    Inverse of pack_hits, moves per hit values of the compact layout back to the full layout
+
+    :param packed: Values [B, length, ...] in the compact layout
+    :param positions: Rows [B, V] in the compact layout of the hits of the full layout
+    :return: Values [B, V, ...], zero for the hits which aren't packed
+    """
+    padded = tf.concat((packed, tf.zeros_like(packed[:, 0:1])), axis=1)
+    return batch_gather(padded, positions)
+
+
+def pack_indices(indices, positions):
+    """
+    Maps indices of hits in the full layout, e.g. the seed indices, to their rows in the compact layout
+
+    :param indices: Indices [B, ...] of hits in the full layout
+    :param positions: Rows [B, V] in the compact layout of the hits of the full layout
+    :return: Indices [B, ...] in the compact layout, with the dtype of indices. Hits which aren't packed map to length.
+    """
+    return tf.cast(batch_gather(positions, indices), indices.dtype)
+
+
+def num_active_hits_numpy(num_entries, energy=None):
+    """
+    Same as summing active_hits_mask over the hits, for numpy batches, e.g. to pick the length of the compact layout
+    before running a batch
+
+    :param num_entries: Number of entries [B, 1] or [B]
+    :param energy: Energy [B, V] of the hits or None
+    :return: Number of active hits [B]
+    """
+    num_entries = np.reshape(num_entries, [-1])
+    if energy is None:
+        return num_entries
+    mask = np.arange(energy.shape[1])[np.newaxis, :] < num_entries[:, np.newaxis]
+    return np.sum(np.logical_and(mask, energy != 0), axis=1)
@@ -1,5 +1,6 @@
 import tensorflow as tf
-from .neighbors import indexing_tensor, indexing_tensor_2, sort_last_dim_tensor, get_sorted_vertices_ids
+from .neighbors import indexing_tensor, indexing_tensor_2, sort_last_dim_tensor, get_sorted_vertices_ids, batch_gather, \
+    batch_range_tensor
 from ops.nn import *
 import numpy as np
 from tensorflow.python.ops.init_ops import Initializer
@@ -35,7 +36,8 @@ def sparse_conv_delta(A, B):
     return A - tf.expand_dims(B, axis=2)
 
 
-def construct_sparse_io_dict(all_features, spatial_features_global, spatial_features_local, num_entries):
+def construct_sparse_io_dict(all_features, spatial_features_global, spatial_features_local, num_entries,
+                             neighbor_table=None):
     """
     Constructs dictionary for readers of sparse convolution layers
 
@@ -43,16 +45,30 @@ def construct_sparse_io_dict(all_features, spatial_features_global, spatial_feat
     :param spatial_features_global: Space like features tensor. Should be of shape [batch_size, num_entries, num_features]
     :param spatial_features_local: Space like features tensor (sensor sizes etc). Should be of shape [batch_size, num_entries, num_features]
     :param num_entries: Number of entries tensor for each batch entry.
+    :param neighbor_table: Precomputed neighbours [num_entries, K] of a fixed geometry if spatial_features_global are
+                           its raw cell positions in sensor order, see SparseConvClusteringBase.get_neighbor_table.
+                           The layers which keep spatial_features_global pass it on.
     :return: dictionary in the format of the sparse conv layer
     """
     return {
         'all_features': all_features,
         'spatial_features_global': spatial_features_global,
         'spatial_features_local': spatial_features_local,
-        'num_entries' : num_entries
+        'num_entries' : num_entries,
+        'neighbor_table': neighbor_table
     }
 
 
+def _get_neighbor_table(sparse_dict, num_neighbors):
+    """
+    Returns the precomputed neighbour table of the space of sparse_dict if it has one for num_neighbors, else None
+    """
+    neighbor_table = sparse_dict.get('neighbor_table')
+    if neighbor_table is None or neighbor_table.shape[1] < num_neighbors:
+        return None
+    return neighbor_table
+
+
 @tf.custom_gradient
 def gradient_scale_down(x):
   def grad(dy):
@@ -94,7 +110,8 @@ def sparse_conv(sparse_dict, num_neighbors=10, output_all=15):
                                                                                  sparse_dict['spatial_features_local'], \
                                                                                  sparse_dict['num_entries']
 
-    _indexing_tensor = indexing_tensor(spatial_features_global, num_neighbors)
+    _indexing_tensor = indexing_tensor(spatial_features_global, num_neighbors,
+                                       neighbor_table=_get_neighbor_table(sparse_dict, num_neighbors), compact=True)
 
     shape_space_features = spatial_features_global.get_shape().as_list()
     shape_space_features_local = spatial_features_local.get_shape().as_list()
@@ -109,19 +126,19 @@ def sparse_conv(sparse_dict, num_neighbors=10, output_all=15):
 
     # All of these tensors should be 3-dimensional
     # TODO: Add assert for indexing_tensor shape
-    assert len(shape_space_features) == 3 and len(shape_all_features) == 3 and len(shape_indexing_tensor) == 4
+    assert len(shape_space_features) == 3 and len(shape_all_features) == 3 and len(shape_indexing_tensor) == 3
 
     # First dimension is batch, second is number of entries, hence these two should be same for all
     assert shape_space_features[0] == shape_all_features[0]
     assert shape_space_features[1] == shape_all_features[1]
 
     # Neighbor matrix should be int as it should be used for indexing
-    assert _indexing_tensor.dtype == tf.int64
+    assert _indexing_tensor.dtype == tf.int32
 
-    gathered_space_1 = tf.gather_nd(spatial_features_global, _indexing_tensor)  # [B,E,5,S]
+    gathered_space_1 = batch_gather(spatial_features_global, _indexing_tensor)  # [B,E,5,S]
     delta_space = sparse_conv_delta(gathered_space_1, spatial_features_global)  # [B,E,5,S]
 
-    spatial_features_local_gathered = tf.gather_nd(spatial_features_local, _indexing_tensor)
+    spatial_features_local_gathered = batch_gather(spatial_features_local, _indexing_tensor)
 
     weighting_factor_for_all_features = tf.reshape(delta_space, [n_batch, n_max_entries, -1])
     weighting_factor_for_all_features = tf.concat(
@@ -137,7 +154,7 @@ def sparse_conv(sparse_dict, num_neighbors=10, output_all=15):
     weighting_factor_for_all_features = tf.expand_dims(weighting_factor_for_all_features,
                                                            axis=3)  # [B,E,N] - N = neighbors
 
-    gathered_all = tf.gather_nd(all_features, _indexing_tensor)  # [B,E,5,F]
+    gathered_all = batch_gather(all_features, _indexing_tensor)  # [B,E,5,F]
 
     gathered_all_dotted = gathered_all * weighting_factor_for_all_features# [B,E,5,2*F]
     # pre_output = tf.layers.dense(gathered_all, output_all, activation=tf.nn.relu)
@@ -156,7 +173,7 @@ def sparse_conv(sparse_dict, num_neighbors=10, output_all=15):
     weighting_factor_for_spatial_features = tf.expand_dims(weighting_factor_for_spatial_features, axis=3)
 
     spatial_output = spatial_features_global + tf.reduce_mean(delta_space * weighting_factor_for_spatial_features, axis=2)
-    spatial_output_local = spatial_features_local + tf.reduce_mean(tf.gather_nd(spatial_features_local, _indexing_tensor) * weighting_factor_for_spatial_features, axis=2)
+    spatial_output_local = spatial_features_local + tf.reduce_mean(batch_gather(spatial_features_local, _indexing_tensor) * weighting_factor_for_spatial_features, axis=2)
 
     # TODO: Confirm if this is done correctly
     mask = tf.cast(tf.expand_dims(tf.sequence_mask(num_entries, maxlen=n_max_entries), axis=2), tf.float32)
@@ -213,16 +230,11 @@ def sparse_max_pool(sparse_dict, num_entries_result):
     # Neighbor matrix should be int as it should be used for indexing
     assert all_features.dtype == tf.float64 or all_features.dtype == tf.float32
 
-    _, I = tf.nn.top_k(tf.reduce_max(all_features, axis=2), num_entries_result)
-    I = tf.expand_dims(I, axis=2)
+    _, _indexing_tensor = tf.nn.top_k(tf.reduce_max(all_features, axis=2), num_entries_result)
 
-    batch_range = tf.expand_dims(tf.expand_dims(tf.range(0, n_batch), axis=1), axis=1)
-    batch_range = tf.tile(batch_range, [1,num_entries_result, 1])
-    _indexing_tensor = tf.concat([batch_range, I], axis=2)
-
-    out_all_features = tf.gather_nd(all_features, _indexing_tensor)
-    out_spatial_features_global = tf.gather_nd(spatial_features_global, _indexing_tensor)
-    out_spatial_features_local = tf.gather_nd(spatial_features_local, _indexing_tensor)
+    out_all_features = batch_gather(all_features, _indexing_tensor)
+    out_spatial_features_global = batch_gather(spatial_features_global, _indexing_tensor)
+    out_spatial_features_local = batch_gather(spatial_features_local, _indexing_tensor)
 
     num_entries = tf.minimum(tf.ones(shape=[n_batch], dtype=tf.int64) * num_entries_result, num_entries)
 
@@ -253,16 +265,11 @@ def sparse_max_pool_factored(sparse_dict, factor):
 
     result_max_entires = int(n_max_entries / factor)
 
-    _, I = tf.nn.top_k(tf.reduce_max(all_features, axis=2), result_max_entires)
-    I = tf.expand_dims(I, axis=2)
-
-    batch_range = tf.expand_dims(tf.expand_dims(tf.range(0, n_batch), axis=1), axis=1)
-    batch_range = tf.tile(batch_range, [1,result_max_entires, 1])
-    _indexing_tensor = tf.concat([batch_range, I], axis=2)
+    _, _indexing_tensor = tf.nn.top_k(tf.reduce_max(all_features, axis=2), result_max_entires)
 
-    out_all_features = tf.gather_nd(all_features, _indexing_tensor)
-    out_spatial_features_global = tf.gather_nd(spatial_features_global, _indexing_tensor)
-    out_spatial_features_local = tf.gather_nd(spatial_features_local, _indexing_tensor)
+    out_all_features = batch_gather(all_features, _indexing_tensor)
+    out_spatial_features_global = batch_gather(spatial_features_global, _indexing_tensor)
+    out_spatial_features_local = batch_gather(spatial_features_local, _indexing_tensor)
 
     num_entries_reduced = tf.cast(num_entries / factor, tf.int64)
 
@@ -290,7 +297,8 @@ def sparse_conv_bare(sparse_dict, num_neighbors=10, output_all=15, weight_init_w
                                                                                  sparse_dict['spatial_features_local'], \
                                                                                  sparse_dict['num_entries']
 
-    _indexing_tensor = indexing_tensor(spatial_features_global, num_neighbors)
+    _indexing_tensor = indexing_tensor(spatial_features_global, num_neighbors,
+                                       neighbor_table=_get_neighbor_table(sparse_dict, num_neighbors), compact=True)
 
     shape_space_features = spatial_features_global.get_shape().as_list()
     shape_space_features_local = spatial_features_local.get_shape().as_list()
@@ -305,21 +313,22 @@ def sparse_conv_bare(sparse_dict, num_neighbors=10, output_all=15, weight_init_w
 
     # All of these tensors should be 3-dimensional
     # TODO: Add assert for indexing_tensor shape
-    assert len(shape_space_features) == 3 and len(shape_all_features) == 3 and len(shape_indexing_tensor) == 4
+    assert len(shape_space_features) == 3 and len(shape_all_features) == 3 and len(shape_indexing_tensor) == 3
 
     # First dimension is batch, second is number of entries, hence these two should be same for all
     assert shape_space_features[0] == shape_all_features[0]
     assert shape_space_features[1] == shape_all_features[1]
 
     # Neighbor matrix should be int as it should be used for indexing
-    assert _indexing_tensor.dtype == tf.int64
+    assert _indexing_tensor.dtype == tf.int32
 
-    gathered_all = tf.gather_nd(all_features, _indexing_tensor)  # [B,E,5,F]
+    gathered_all = batch_gather(all_features, _indexing_tensor)  # [B,E,5,F]
 
     pre_output = tf.layers.dense(gathered_all, output_all, activation=tf.nn.relu)
     output = tf.layers.dense(tf.reshape(pre_output, [n_batch, n_max_entries, -1]), output_all, activation=tf.nn.relu)
 
-    return construct_sparse_io_dict(output, spatial_features_global, spatial_features_local, num_entries)
+    return construct_sparse_io_dict(output, spatial_features_global, spatial_features_local, num_entries,
+                                    sparse_dict.get('neighbor_table'))
 
 
 def find_filter_weights(x, num_outputs=10, activation=tf.nn.relu):
@@ -387,7 +396,8 @@ def sparse_conv_2(sparse_dict, num_neighbors=8, num_filters=16, n_prespace_condi
                                                                                  sparse_dict['spatial_features_local'], \
                                                                                  sparse_dict['num_entries']
 
-    _indexing_tensor = indexing_tensor(spatial_features_global, num_neighbors)
+    _indexing_tensor = indexing_tensor(spatial_features_global, num_neighbors,
+                                       neighbor_table=_get_neighbor_table(sparse_dict, num_neighbors), compact=True)
 
     shape_space_features = spatial_features_global.get_shape().as_list()
     shape_space_features_local = spatial_features_local.get_shape().as_list()
@@ -403,23 +413,23 @@ def sparse_conv_2(sparse_dict, num_neighbors=8, num_filters=16, n_prespace_condi
 
     # All of these tensors should be 3-dimensional
     # TODO: Add assert for indexing_tensor shape
-    assert len(shape_space_features) == 3 and len(shape_all_features) == 3 and len(shape_indexing_tensor) == 4
+    assert len(shape_space_features) == 3 and len(shape_all_features) == 3 and len(shape_indexing_tensor) == 3
 
     # First dimension is batch, second is number of entries, hence these two should be same for all
     assert shape_space_features[0] == shape_all_features[0]
     assert shape_space_features[1] == shape_all_features[1]
 
     # Neighbor matrix should be int as it should be used for indexing
-    assert _indexing_tensor.dtype == tf.int64
+    assert _indexing_tensor.dtype == tf.int32
 
     print("Indexing tensor shape", _indexing_tensor.shape)
-    gathered_spatial = tf.gather_nd(spatial_features_global, _indexing_tensor)  # [B,E,5,S]
+    gathered_spatial = batch_gather(spatial_features_global, _indexing_tensor)  # [B,E,5,S]
 
     print("Gathered spatial shape", spatial_features_global.shape, gathered_spatial.shape)
     delta_space = sparse_conv_delta(gathered_spatial, spatial_features_global)  # [B,E,5,S]
 
-    spatial_features_local_gathered = tf.gather_nd(spatial_features_local, _indexing_tensor)
-    gathered_all = tf.gather_nd(all_features, _indexing_tensor)  # [B,E,N,A]
+    spatial_features_local_gathered = batch_gather(spatial_features_local, _indexing_tensor)
+    gathered_all = batch_gather(all_features, _indexing_tensor)  # [B,E,N,A]
 
     """
     Hint: (from next line onward)
@@ -492,7 +502,8 @@ def sparse_conv_2(sparse_dict, num_neighbors=8, num_filters=16, n_prespace_condi
 
     print('color_like_output.shape b ', color_like_output.shape)
     
-    return construct_sparse_io_dict(color_like_output , spatial_features_global, spatial_features_local, num_entries)
+    return construct_sparse_io_dict(color_like_output , spatial_features_global, spatial_features_local, num_entries,
+                                    sparse_dict.get('neighbor_table'))
 
 
 class NoisyEyeInitializer(Initializer):
@@ -597,7 +608,8 @@ def sparse_conv_make_neighbors2(sparse_dict, num_neighbors=10,
                                                                                  sparse_dict['spatial_features_local'], \
                                                                                  sparse_dict['num_entries']
 
-    _indexing_tensor = indexing_tensor(spatial_features_global, num_neighbors)
+    _indexing_tensor = indexing_tensor(spatial_features_global, num_neighbors,
+                                       neighbor_table=_get_neighbor_table(sparse_dict, num_neighbors), compact=True)
 
     shape_space_features = spatial_features_global.get_shape().as_list()
     shape_space_features_local = spatial_features_local.get_shape().as_list()
@@ -612,14 +624,14 @@ def sparse_conv_make_neighbors2(sparse_dict, num_neighbors=10,
 
     # All of these tensors should be 3-dimensional
     # TODO: Add assert for indexing_tensor shape
-    assert len(shape_space_features) == 3 and len(shape_all_features) == 3 and len(shape_indexing_tensor) == 4
+    assert len(shape_space_features) == 3 and len(shape_all_features) == 3 and len(shape_indexing_tensor) == 3
 
     # First dimension is batch, second is number of entries, hence these two should be same for all
     assert shape_space_features[0] == shape_all_features[0]
     assert shape_space_features[1] == shape_all_features[1]
 
     # Neighbor matrix should be int as it should be used for indexing
-    assert _indexing_tensor.dtype == tf.int64
+    assert _indexing_tensor.dtype == tf.int32
 
 
     #add local space features here?
@@ -644,7 +656,7 @@ def sparse_conv_make_neighbors2(sparse_dict, num_neighbors=10,
     breakdown_y = tf.layers.dense(transformed_space_features, 1, activation=tf.nn.tanh)
     sorting = breakdown_x + breakdown_y
 
-    _indexing_tensor, distance = indexing_tensor_2(sorting, num_neighbors,create_indexing_batch)
+    _indexing_tensor, distance = indexing_tensor_2(sorting, num_neighbors,create_indexing_batch, compact=True)
     
     #for future use
     if strict_global_space:
@@ -659,15 +671,18 @@ def sparse_conv_make_neighbors2(sparse_dict, num_neighbors=10,
     output_all = make_sequence(output_all)
     for i in range(len(output_all)):
         f = output_all[i]
-        gathered_all = tf.gather_nd(last_iteration, _indexing_tensor) * expanded_distance
+        gathered_all = batch_gather(last_iteration, _indexing_tensor) * expanded_distance
         flattened_gathered = tf.reshape(gathered_all, [n_batch, n_max_entries, -1])
         last_iteration = tf.layers.dense(flattened_gathered, f, activation=tf.nn.relu, name = name+ str(f) + str(i)) 
 
     output_global_space = spatial_features_global
+    neighbor_table = sparse_dict.get('neighbor_table')
     if propagrate_ahead:
         output_global_space = tf.concat([transformed_space_features,spatial_features_global],axis=-1)
+        neighbor_table = None
        
-    return construct_sparse_io_dict(last_iteration, output_global_space, spatial_features_local, num_entries)
+    return construct_sparse_io_dict(last_iteration, output_global_space, spatial_features_local, num_entries,
+                                    neighbor_table)
 
    
 def sparse_conv_make_neighbors(sparse_dict, num_neighbors=10, 
@@ -775,8 +790,7 @@ def make_batch_selection(ids):
     n_batch=ids.shape[0]
     n_vertices=ids.shape[1]
     ids = tf.cast(ids, dtype=tf.int64)
-    batch=tf.range(n_batch, dtype=tf.int64)
-    batch = tf.tile(batch[..., tf.newaxis, tf.newaxis], [1,n_vertices,1])
+    batch = batch_range_tensor([n_batch, n_vertices, 1], tf.int64)
     select = tf.concat((batch, ids[..., tf.newaxis]), axis=-1)
     return select
     
@@ -826,10 +840,10 @@ def sparse_conv_make_seeds(sparse_dict,
     breakdown_y = tf.layers.dense(dimension_breakdown, 1,activation=tf.nn.tanh)
     sorting = breakdown_x+breakdown_y
     sorting = tf.squeeze(sorting) #only one dimension
-    ids = get_sorted_vertices_ids(sorting)
+    ids = get_sorted_vertices_ids(sorting, compact=True)
     all_features = tf.concat([dimension_breakdown,(breakdown_x-3.)/2.,breakdown_y], axis=-1)
 
-    sorted_all_features = tf.gather_nd(all_features,ids)
+    sorted_all_features = batch_gather(all_features,ids)
     #sorted_all_features= tf.squeeze(sorted_all_features)
     print('sorted_all_features',sorted_all_features.shape)
     
@@ -853,14 +867,12 @@ def sparse_conv_make_seeds(sparse_dict,
     allids = tf.tile(allids,[n_batch,1])
     
     #resort
-    allids = tf.gather_nd(allids,ids)
+    allids = batch_gather(allids,ids)
     print('allids',allids.shape)
     
     #select in resorted space
-    selids = make_batch_selection(outidx)
-    selids=sprint(selids,'selids')
     outidx=sprint(outidx,'outidx')
-    out_seed_ids = tf.gather_nd(allids,selids)
+    out_seed_ids = batch_gather(allids,outidx)
     
     return v,tf.cast(out_seed_ids,dtype=tf.int64)
 
@@ -893,10 +905,10 @@ def sparse_conv_prepare_2Dconv(sparse_dict,
     breakdown_y = tf.layers.dense(dimension_breakdown, 1,activation=tf.nn.tanh)
     sorting = breakdown_x+breakdown_y
     sorting = tf.squeeze(sorting) #only one dimension
-    ids = get_sorted_vertices_ids(sorting)
+    ids = get_sorted_vertices_ids(sorting, compact=True)
     all_features = tf.concat([dimension_breakdown,(breakdown_x-3.)/2.,breakdown_y], axis=-1)
 
-    sorted_all_features = tf.gather_nd(all_features,ids)
+    sorted_all_features = batch_gather(all_features,ids)
     #sorted_all_features= tf.squeeze(sorted_all_features)
     print('sorted_all_features',sorted_all_features.shape)
     
@@ -939,7 +951,6 @@ def sparse_conv_seeded(sparse_dict, all_features_in, seed_indices, seed_scaling,
     
     feature_layerout=[]
     space_layerout=[]
-    seedselector = make_seed_selector(seed_indices)
     
     for i in range(nspacetransform):
         
@@ -953,7 +964,7 @@ def sparse_conv_seeded(sparse_dict, all_features_in, seed_indices, seed_scaling,
 
         space_layerout.append(trans_space)
         
-        seed_trans_space_orig = tf.gather_nd(trans_space,seedselector)
+        seed_trans_space_orig = batch_gather(trans_space,seed_indices)
         seed_trans_space = tf.expand_dims(seed_trans_space_orig,axis=2)
         seed_trans_space = tf.tile(seed_trans_space,[1,1,nvertex,1])
         
@@ -972,7 +983,7 @@ def sparse_conv_seeded(sparse_dict, all_features_in, seed_indices, seed_scaling,
         thisout = tf.reduce_sum(thisout,axis=2)
         
         #add back seed features
-        seed_all_features = tf.gather_nd(all_features,seedselector)
+        seed_all_features = batch_gather(all_features,seed_indices)
         if seed_scaling is not None:
             seed_all_features = seed_scaling*seed_all_features
         
@@ -1050,8 +1061,7 @@ def sparse_conv_add_simple_seed_labels(net,seed_indices):
                                                                     net['spatial_features_global'], \
                                                                     net['spatial_features_local'], \
                                                                     net['num_entries']
-    seedselector = make_seed_selector(seed_indices)
-    seed_space = tf.gather_nd(space_global,seedselector)
+    seed_space = batch_gather(space_global,seed_indices)
     label = tf.argmin(euclidean_squared(space_global, seed_space), axis=-1)
     label = tf.cast(label,dtype=tf.float32)
     colours_in = tf.concat([colours_in,tf.expand_dims(label, axis=2)], axis=-1)
@@ -1,14 +1,48 @@
 import tensorflow as tf
-from .neighbors import euclidean_squared,indexing_tensor, indexing_tensor_2, sort_last_dim_tensor, get_sorted_vertices_ids
+from .neighbors import euclidean_squared,indexing_tensor, indexing_tensor_2, indexing_tensor_static, sort_last_dim_tensor, get_sorted_vertices_ids, batch_gather, \
+    batch_range_tensor
 from ops.nn import *
 import numpy as np
 from .initializers import NoisyEyeInitializer
+from .binning import bin_vertices
 from .activations import gauss_of_lin, gauss_times_linear, sinc, open_tanh, asymm_falling, gauss, multi_dim_edge_activation
 import math
 
 ###helper functions
 _sparse_conv_naming_index=0
 
+# Number of vertices per block when edges are built and applied, None to build all the edges and the whole product
+# of edges and vertices at once. See set_edge_block_size.
+edge_block_size = None
+
+
+def set_edge_block_size(block_size):
+    """
+    Sets the default block size of the edges between vertices and seeds (see SeedEdges) and of the aggregation in
+    apply_edges (see aggregate_edges_blocked). Only the max, sum and mean aggregations are blocked.
+
+    :param block_size: Number of vertices per block, None to disable blocking
+    :return:
+    """
+    global edge_block_size
+    edge_block_size = block_size
+
+
+# Number of filters per block of sparse_conv_multipl_dense, None to build the factors of all the filters at once. See
+# set_multipl_dense_block_size.
+multipl_dense_block_size = None
+
+
+def set_multipl_dense_block_size(block_size):
+    """
+    Sets the default filter block size of sparse_conv_multipl_dense, see multipl_dense_blocked
+
+    :param block_size: Number of filters per block, None to disable blocking
+    :return:
+    """
+    global multipl_dense_block_size
+    multipl_dense_block_size = block_size
+
 def construct_sparse_io_dict(all_features, spatial_features_global, spatial_features_local, num_entries):
     """
     Constructs dictionary for readers of sparse convolution layers
@@ -96,8 +130,7 @@ def make_batch_selection(ids):
     n_batch=ids.shape[0]
     n_vertices=ids.shape[1]
     ids = tf.cast(ids, dtype=tf.int64)
-    batch=tf.range(n_batch, dtype=tf.int64)
-    batch = tf.tile(batch[..., tf.newaxis, tf.newaxis], [1,n_vertices,1])
+    batch = batch_range_tensor([n_batch, n_vertices, 1], tf.int64)
     select = tf.concat((batch, ids[..., tf.newaxis]), axis=-1)
     return select
     
@@ -105,8 +138,7 @@ def make_batch_selection(ids):
 def select_based_on(vertices_to_select_from, select_criterion_max, n_select): 
        
     _, I = tf.nn.top_k(select_criterion_max, n_select)
-    selection = make_batch_selection(I)
-    return tf.gather_nd(vertices_to_select_from,selection)
+    return batch_gather(vertices_to_select_from,I)
     
 
 def apply_distance_weight(x, zero_is_one=False):
@@ -151,7 +183,77 @@ def create_edges(vertices_a, vertices_b, zero_is_one_weight=False, n_properties=
     else:
         return edges
     
-def sparse_conv_multipl_dense(in_tensor, nfilters, activation=None, kernel_initializer=tf.glorot_normal_initializer, name=None):
+def multipl_dense_blocked(x, weights, block_size=8):
+    """
+    Same as reduce_prod(expand_dims(x, -2) * weights + 1, axis=-1), the product of sparse_conv_multipl_dense, but
+    the filters are processed in blocks of block_size one after another, so only a [..., block_size, F] slice of the
+    factors exists at a time instead of [..., nfilters, F]. The backward pass recomputes the slices block by block.
+    The derivative of a factor is the product of the other factors of its filter, it's computed from exclusive
+    cumulative products instead of dividing the product by the factor, so factors of zero get the same gradients as
+    with reduce_prod.
+
+    :param x: Input [..., F] with a static shape
+    :param weights: Weights [nfilters, F]
+    :param block_size: Number of filters per block
+    :return: Products [..., nfilters]
+    """
+    dtype = x.dtype
+    leading_shape = x.get_shape().as_list()[0:-1]
+    n_leading = len(leading_shape)
+    n_filters, n_features = weights.get_shape().as_list()
+    n_blocks = (n_filters + block_size - 1) // block_size
+    n_padding = n_blocks * block_size - n_filters
+
+    def _factors(x, weights_block):
+        return tf.expand_dims(x, axis=-2) * weights_block + 1.
+
+    @tf.custom_gradient
+    def _multipl_dense(x, weights):
+        # The padded filters have zero weights, so their products are one, and they're cut off
+        weight_blocks = tf.reshape(tf.pad(weights, [[0, n_padding], [0, 0]]), [n_blocks, block_size, n_features])
+
+        # One block at a time, otherwise all the blocks could be evaluated in parallel
+        products = tf.map_fn(lambda weights_block: tf.reduce_prod(_factors(x, weights_block), axis=-1),
+                             weight_blocks, dtype=dtype, parallel_iterations=1, back_prop=False)
+        # [n_blocks, ..., block_size] -> [..., nfilters]
+        products = tf.transpose(products, perm=list(range(1, n_leading + 1)) + [0, n_leading + 1])
+        products = tf.reshape(products, leading_shape + [n_blocks * block_size])[..., 0:n_filters]
+
+        def grad(d_products):
+            # [..., nfilters] -> [n_blocks, ..., block_size]
+            d_blocks = tf.pad(d_products, [[0, 0]] * n_leading + [[0, n_padding]])
+            d_blocks = tf.reshape(d_blocks, leading_shape + [n_blocks, block_size])
+            d_blocks = tf.transpose(d_blocks, perm=[n_leading] + list(range(n_leading)) + [n_leading + 1])
+
+            def _grad_block(d_accumulated, elems):
+                d_x, d_weight_blocks = d_accumulated
+                weights_block, d_block, block_one_hot = elems
+                factors = _factors(x, weights_block)
+                d_factors = tf.expand_dims(d_block, axis=-1) * tf.cumprod(factors, axis=-1, exclusive=True) * \
+                            tf.cumprod(factors, axis=-1, exclusive=True, reverse=True)
+                d_x = d_x + tf.reduce_sum(d_factors * weights_block, axis=-2)
+                d_weights_block = tf.reduce_sum(tf.reshape(d_factors * tf.expand_dims(x, axis=-2),
+                                                           [-1, block_size, n_features]), axis=0)
+                return d_x, d_weight_blocks + block_one_hot[:, tf.newaxis, tf.newaxis] * d_weights_block
+
+            d_x, d_weight_blocks = tf.foldl(_grad_block, (weight_blocks, d_blocks, tf.eye(n_blocks, dtype=dtype)),
+                                            initializer=(tf.zeros_like(x), tf.zeros_like(weight_blocks)),
+                                            parallel_iterations=1, back_prop=False)
+            return d_x, tf.reshape(d_weight_blocks, [n_blocks * block_size, n_features])[0:n_filters]
+
+        return products, grad
+
+    return _multipl_dense(x, weights)
+
+
+def sparse_conv_multipl_dense(in_tensor, nfilters, activation=None, kernel_initializer=tf.glorot_normal_initializer,
+                              name=None, block_size=-1):
+    """
+    Dense layer where every filter is the product over the features of (1 + weight * feature), minus one, plus a bias
+
+    :param block_size: Number of filters per block for multipl_dense_blocked, None to build the factors of all the
+                       filters at once and -1 for the module default (see set_multipl_dense_block_size)
+    """
     global _sparse_conv_naming_index
     _sparse_conv_naming_index+=1
     if name is None:
@@ -174,15 +276,21 @@ def sparse_conv_multipl_dense(in_tensor, nfilters, activation=None, kernel_initi
     bias = tf.get_variable(name+"_bias", [nfilters],dtype=tf.float32,
                                         initializer=tf.zeros_initializer())    
     
-    expanded_in_tensor = tf.expand_dims(in_tensor, axis=-2)
-    
-    print('weights',weights.shape)
-    
-    applied_weights = weights*expanded_in_tensor + 1.
-    
-    print('applied_weights',applied_weights.shape)
-    
-    collapsed = tf.reduce_prod(applied_weights, axis=-1) - 1.
+    if block_size == -1:
+        block_size = multipl_dense_block_size
+    if block_size is not None and block_size < nfilters:
+        collapsed = multipl_dense_blocked(in_tensor, tf.reshape(weights, [nfilters, int(in_tensor.shape[-1])]),
+                                          block_size) - 1.
+    else:
+        expanded_in_tensor = tf.expand_dims(in_tensor, axis=-2)
+
+        print('weights',weights.shape)
+
+        applied_weights = weights*expanded_in_tensor + 1.
+
+        print('applied_weights',applied_weights.shape)
+
+        collapsed = tf.reduce_prod(applied_weights, axis=-1) - 1.
     
     collapsed = tf.nn.bias_add(collapsed, bias)
     #exit()
@@ -193,38 +301,382 @@ def sparse_conv_multipl_dense(in_tensor, nfilters, activation=None, kernel_initi
     
     
     
-def create_active_edges(vertices_a, vertices_b, name,multiplier=1):
+def create_active_edges_parameters(vertices_a, vertices_b, name, multiplier=1):
     '''
-    learnable:
-    -global scaler for receptive field in Y with Y: BxYxVxF
-    -local frequency a for activation: exp(x^2)cos(a x)
+    Creates the learnable parameters of create_active_edges, returns the receptive field and frequency scalers
+    '''
+    n_features = int(vertices_a.shape[-1]) * 2**(multiplier-1)
+    rec_field_scaler = tf.get_variable(name+"_rec_field_scaler", [vertices_b.shape[1]],dtype=tf.float32,
+                                        initializer=tf.zeros_initializer)
+    frequency_scaler = tf.get_variable(name+"_frequency_scaler", [n_features],dtype=tf.float32)
+    return tf.convert_to_tensor(rec_field_scaler), tf.convert_to_tensor(frequency_scaler)
+
+
+def apply_active_edges(vertices_a, vertices_b, rec_field_scaler, frequency_scaler, multiplier=1):
+    '''
+    The edges of create_active_edges for given parameters, see create_active_edges_parameters
     '''
-    
     expanded_vertices_a = tf.expand_dims(vertices_a, axis=1)
     expanded_vertices_b = tf.expand_dims(vertices_b, axis=2)
     edges = expanded_vertices_a - expanded_vertices_b
     for i in range(multiplier-1):
         edges = tf.concat([edges,edges],axis=-1)
     
-    rec_field_scaler = tf.get_variable(name+"_rec_field_scaler", [edges.shape[1]],dtype=tf.float32,
-                                        initializer=tf.zeros_initializer)
     rec_field_scaler = tf.expand_dims(tf.expand_dims(tf.expand_dims(rec_field_scaler,axis=0),axis=2),axis=3)
     edges = edges * (rec_field_scaler+0.1 )#+ 1.)
     
-    frequency_scaler = tf.get_variable(name+"_frequency_scaler", [edges.shape[-1]],dtype=tf.float32)
     frequency_scaler = tf.expand_dims(tf.expand_dims(tf.expand_dims(frequency_scaler,axis=0),axis=0),axis=0)
     
-    edges = tf.exp(-edges*edges)*tf.cos(frequency_scaler*5.* edges)
+    return tf.exp(-edges*edges)*tf.cos(frequency_scaler*5.* edges)
+
+
+def create_active_edges(vertices_a, vertices_b, name,multiplier=1):
+    '''
+    learnable:
+    -global scaler for receptive field in Y with Y: BxYxVxF
+    -local frequency a for activation: exp(x^2)cos(a x)
+    '''
+    rec_field_scaler, frequency_scaler = create_active_edges_parameters(vertices_a, vertices_b, name, multiplier)
+    edges = apply_active_edges(vertices_a, vertices_b, rec_field_scaler, frequency_scaler, multiplier)
     print('create_active_edges: edges out ',name,edges.shape)
     return edges
     
     
-def apply_edges(vertices, edges, reduce_sum=True, flatten=True,expand_first_vertex_dim=True, aggregation_function=tf.reduce_max): 
+_blocked_aggregations = {
+    tf.reduce_max: 'max',
+    tf.reduce_sum: 'sum',
+    tf.reduce_mean: 'mean',
+}
+
+
+def aggregate_statistics(x, axis, aggregation_functions):
+    """
+    Applies several aggregation functions to x over axis. tf.reduce_sum and tf.reduce_mean share one sum, so the
+    statistics need a single pass over x each instead of one per function.
+
+    :param x: The tensor to aggregate
+    :param axis: The axis to aggregate over
+    :param aggregation_functions: List of functions like tf.reduce_max which take x and axis
+    :return: List with the aggregated tensor of every aggregation function
+    """
+    sums = None
+    aggregated = []
+    for aggregation_function in aggregation_functions:
+        if aggregation_function == tf.reduce_sum or aggregation_function == tf.reduce_mean:
+            if sums is None:
+                sums = tf.reduce_sum(x, axis=axis)
+            aggregated.append(sums if aggregation_function == tf.reduce_sum else sums / int(x.shape[axis]))
+        else:
+            aggregated.append(aggregation_function(x, axis=axis))
+    return aggregated
+
+
+def _to_blocks(x, axis, n_blocks, block_size):
+    # [..., V, ...] -> [n_blocks, ..., block_size, ...], padded with zeros
+    shape = x.get_shape().as_list()
+    paddings = [[0, 0]] * len(shape)
+    paddings[axis] = [0, n_blocks * block_size - shape[axis]]
+    x = tf.reshape(tf.pad(x, paddings), shape[0:axis] + [n_blocks, block_size] + shape[axis + 1:])
+    return tf.transpose(x, perm=[axis] + list(range(axis)) + list(range(axis + 1, len(shape) + 1)))
+
+
+def _from_blocks(x, axis, length):
+    # Inverse of _to_blocks, the padding is cut off
+    shape = x.get_shape().as_list()
+    x = tf.transpose(x, perm=list(range(1, axis + 1)) + [0] + list(range(axis + 1, len(shape))))
+    x = tf.reshape(x, shape[1:axis + 1] + [shape[0] * shape[axis + 1]] + shape[axis + 2:])
+    size = [-1] * (len(shape) - 1)
+    size[axis] = length
+    return tf.slice(x, [0] * (len(shape) - 1), size)
+
+
+def _block_gradients(ys, xs, grad_ys):
+    gradients = tf.gradients(ys, xs, grad_ys=grad_ys)
+    return tuple([tf.zeros_like(x) if g is None else g for x, g in zip(xs, gradients)])
+
+
+def _aggregate_blocked(edge_function, edge_inputs, edge_inputs_axis, shared_inputs, vertices, aggregation_functions,
+                       block_size):
+    """
+    Aggregation of aggregate_edges_blocked and collapse_edges_blocked. The edges of a block are
+    edge_function(block of edge_inputs along edge_inputs_axis, *shared_inputs), [B, V, block_size, F].
+    """
+    modes = [_blocked_aggregations[x] for x in aggregation_functions]
+    with_max = 'max' in modes
+    with_sum = 'sum' in modes or 'mean' in modes
+    dtype = vertices.dtype
+    n_vertices = vertices.get_shape().as_list()[2]
+    n_blocks = (n_vertices + block_size - 1) // block_size
+    n_shared = len(shared_inputs)
+
+    # Added to the product for the maximum so that the padded vertices never are the maximum
+    padding_penalty = np.zeros(n_blocks * block_size)
+    padding_penalty[n_vertices:] = -np.inf
+    padding_penalty = tf.constant(padding_penalty.reshape([n_blocks, 1, 1, block_size, 1, 1]), dtype=dtype)
+
+    def _product(edge_inputs_block, vertices_block, shared):
+        edges_block = edge_function(edge_inputs_block, *shared)
+        return tf.expand_dims(edges_block, axis=3) * tf.expand_dims(vertices_block, axis=4)
+
+    @tf.custom_gradient
+    def _aggregate(edge_inputs, vertices, *shared_inputs):
+        blocks = (_to_blocks(edge_inputs, edge_inputs_axis, n_blocks, block_size),
+                  _to_blocks(vertices, 2, n_blocks, block_size), padding_penalty)
+
+        def _aggregate_block(elems):
+            edge_inputs_block, vertices_block, penalty_block = elems
+            product = _product(edge_inputs_block, vertices_block, shared_inputs)
+            aggregated_block = []
+            if with_max:
+                aggregated_block.append(tf.reduce_max(product + penalty_block, axis=2))
+            if with_sum:
+                aggregated_block.append(tf.reduce_sum(product, axis=2))
+            return tuple(aggregated_block)
+
+        # One block at a time, otherwise all the blocks could be evaluated in parallel
+        aggregated_blocks = tf.map_fn(_aggregate_block, blocks, dtype=(dtype,) * (int(with_max) + int(with_sum)),
+                                      parallel_iterations=1, back_prop=False)
+        maxima = tf.reduce_max(aggregated_blocks[0], axis=0) if with_max else None
+        sums = tf.reduce_sum(aggregated_blocks[-1], axis=0) if with_sum else None
+
+        def _selected(product, penalty_block):
+            return tf.cast(tf.equal(product + penalty_block, tf.expand_dims(maxima, axis=2)), dtype)
+
+        def grad(*d_aggregated):
+            d_maxima = None
+            d_sums = None
+            for mode, d in zip(modes, d_aggregated):
+                if mode == 'max':
+                    d_maxima = d if d_maxima is None else d_maxima + d
+                else:
+                    d = d if mode == 'sum' else d / n_vertices
+                    d_sums = d if d_sums is None else d_sums + d
+            if d_maxima is not None:
+                # Same as the gradient of tf.reduce_max, shared equally between all the maxima
+                n_selected = tf.map_fn(
+                    lambda elems: tf.reduce_sum(_selected(_product(elems[0], elems[1], shared_inputs), elems[2]),
+                                                axis=2), blocks, dtype=dtype, parallel_iterations=1, back_prop=False)
+                d_maxima = d_maxima / tf.reduce_sum(n_selected, axis=0)
+
+            def _grad_block(elems):
+                edge_inputs_block, vertices_block, penalty_block = elems
+                # The gradients of the edge function are taken inside the loop, with respect to copies of its inputs
+                shared = [tf.identity(x) for x in shared_inputs]
+                product = _product(edge_inputs_block, vertices_block, shared)
+                d_product = tf.zeros_like(product)
+                if d_maxima is not None:
+                    d_product = d_product + tf.expand_dims(d_maxima, axis=2) * _selected(product, penalty_block)
+                if d_sums is not None:
+                    d_product = d_product + tf.expand_dims(d_sums, axis=2)
+                return _block_gradients(product, [edge_inputs_block, vertices_block] + shared, d_product)
+
+            d_blocks = tf.map_fn(_grad_block, blocks, dtype=(dtype,) * (2 + n_shared), parallel_iterations=1,
+                                 back_prop=False)
+            d_edge_inputs = _from_blocks(d_blocks[0], edge_inputs_axis, int(edge_inputs.shape[edge_inputs_axis]))
+            d_shared = [tf.reduce_sum(x, axis=0) for x in d_blocks[2:]]
+            return [d_edge_inputs, _from_blocks(d_blocks[1], 2, n_vertices)] + d_shared
+
+        aggregated = []
+        for mode in modes:
+            if mode == 'max':
+                aggregated.append(maxima)
+            else:
+                aggregated.append(sums if mode == 'sum' else sums / n_vertices)
+        return aggregated, grad
+
+    return _aggregate(edge_inputs, vertices, *shared_inputs)
+
+
+def aggregate_edges_blocked(vertices, edges, aggregation_functions=(tf.reduce_max,), block_size=256):
+    """
+    Same as aggregation_function(expand_dims(edges, 3) * expand_dims(vertices, 4), axis=2) for every aggregation
+    function, the aggregation of apply_edges, but the V' vertices are processed in blocks of block_size one after
+    another, so only a [B, V, block_size, F', F] slice of the product exists at a time. All the aggregations are
+    computed from the same slices. The backward pass recomputes the slices block by block as well and gives the same
+    gradients as the dense aggregation, ties of the maximum included.
+
+    :param vertices: Vertices [B, 1, V', F'] or [B, V, V', F']
+    :param edges: Edges [B, V, V', F]
+    :param aggregation_functions: List of tf.reduce_max, tf.reduce_sum or tf.reduce_mean
+    :param block_size: Number of vertices per block
+    :return: List with the aggregated features [B, V, F', F] of every aggregation function
+    """
+    return _aggregate_blocked(lambda edges_block: edges_block, edges, 2, [], vertices, aggregation_functions,
+                              block_size)
+
+
+def collapse_edges_blocked(edge_function, vertex_positions, shared_inputs, vertices,
+                           aggregation_functions=(tf.reduce_max,), block_size=256):
+    """
+    Same as aggregate_edges_blocked(expand_dims(vertices, 1), edge_function(vertex_positions, *shared_inputs), ...),
+    but the edges are built block by block too, so neither the [B, S, V, F] edges nor the intermediate tensors of
+    edge_function exist for more than block_size vertices at a time, in the forward or the backward pass.
+
+    :param edge_function: Function of a block of vertex positions [B, block_size, D] and the shared inputs which
+                          returns the edges [B, S, block_size, F], like create_edges(positions, seed_positions). It
+                          must not create or read variables, they are passed as shared inputs instead.
+    :param vertex_positions: Vertex positions [B, V, D]
+    :param shared_inputs: List of the other tensors edge_function takes, e.g. the seed positions
+    :param vertices: Vertex features [B, V, F']
+    :param aggregation_functions: List of tf.reduce_max, tf.reduce_sum or tf.reduce_mean
+    :param block_size: Number of vertices per block
+    :return: List with the aggregated features [B, S, F', F] of every aggregation function
+    """
+    return _aggregate_blocked(edge_function, vertex_positions, 1, list(shared_inputs), tf.expand_dims(vertices, axis=1),
+                              aggregation_functions, block_size)
+
+
+def expand_edges_blocked(edge_function, vertex_positions, shared_inputs, features, block_size=256):
+    """
+    Same as apply_edges(features, transpose(edge_function(vertex_positions, *shared_inputs), [0, 2, 1, 3]),
+    reduce_sum=False, flatten=False), the propagation from the seeds back to the vertices, but the edges are built
+    for block_size vertices at a time, in the forward and the backward pass. Only the output [B, V, S, F', F] exists
+    in full.
+
+    :param edge_function: See collapse_edges_blocked
+    :param vertex_positions: Vertex positions [B, V, D]
+    :param shared_inputs: List of the other tensors edge_function takes
+    :param features: Seed features [B, S, F']
+    :param block_size: Number of vertices per block
+    :return: Propagated features [B, V, S, F', F]
+    """
+    shared_inputs = list(shared_inputs)
+    dtype = features.dtype
+    n_vertices = vertex_positions.get_shape().as_list()[1]
+    n_blocks = (n_vertices + block_size - 1) // block_size
+    n_shared = len(shared_inputs)
+
+    def _expand(positions_block, features, shared):
+        edges_block = tf.transpose(edge_function(positions_block, *shared), perm=[0, 2, 1, 3])
+        return tf.expand_dims(edges_block, axis=3) * tf.expand_dims(tf.expand_dims(features, axis=1), axis=4)
+
+    @tf.custom_gradient
+    def _expand_blocked(vertex_positions, features, *shared_inputs):
+        position_blocks = _to_blocks(vertex_positions, 1, n_blocks, block_size)
+        expanded = tf.map_fn(lambda positions_block: _expand(positions_block, features, shared_inputs),
+                             position_blocks, dtype=dtype, parallel_iterations=1, back_prop=False)
+        expanded = _from_blocks(expanded, 1, n_vertices)
+
+        def grad(d_expanded):
+            def _grad_block(elems):
+                positions_block, d_block = elems
+                inputs = [tf.identity(x) for x in [features] + list(shared_inputs)]
+                expanded_block = _expand(positions_block, inputs[0], inputs[1:])
+                return _block_gradients(expanded_block, [positions_block] + inputs, d_block)
+
+            d_blocks = tf.map_fn(_grad_block, (position_blocks, _to_blocks(d_expanded, 1, n_blocks, block_size)),
+                                 dtype=(dtype,) * (2 + n_shared), parallel_iterations=1, back_prop=False)
+            return [_from_blocks(d_blocks[0], 1, n_vertices)] + [tf.reduce_sum(x, axis=0) for x in d_blocks[1:]]
+
+        return expanded, grad
+
+    return _expand_blocked(vertex_positions, features, *shared_inputs)
+
+
+class SeedEdges(object):
+    """
+    Edges [B, S, V, F] between the vertices and S seeds (or aggregators), given by an edge function of the vertex
+    positions, for a collapse to the seeds and an expansion back to the vertices. With edge_block_size (see
+    set_edge_block_size) the edges are only ever built for a block of vertices, see collapse_edges_blocked and
+    expand_edges_blocked. Otherwise they are built once and applied with apply_edges.
+    """
+    def __init__(self, edge_function, vertex_positions, shared_inputs=(), block_size=-1):
+        """
+        :param edge_function: See collapse_edges_blocked
+        :param vertex_positions: Vertex positions [B, V, D]
+        :param shared_inputs: List of the other tensors edge_function takes, e.g. the seed positions
+        :param block_size: Number of vertices per block, None to build all the edges at once and -1 for the module
+                           default
+        """
+        if block_size == -1:
+            block_size = edge_block_size
+        if block_size is not None and block_size >= int(vertex_positions.shape[1]):
+            block_size = None
+        self.edge_function = edge_function
+        self.vertex_positions = vertex_positions
+        self.shared_inputs = list(shared_inputs)
+        self.block_size = block_size
+        self._edges = None
+
+    def get_edges(self):
+        """
+        Returns the full edges [B, S, V, F], e.g. to use them as features
+        """
+        if self._edges is None:
+            self._edges = self.edge_function(self.vertex_positions, *self.shared_inputs)
+        return self._edges
+
+    def collapse(self, vertices, aggregation_functions=(tf.reduce_max,), flatten=True):
+        """
+        Same as apply_edges_multi(vertices, edges, aggregation_functions, flatten)
+
+        :param vertices: Vertex features [B, V, F']
+        :return: List with the features [B, S, F'*F] (or [B, S, F', F] if not flatten) of every aggregation function
+        """
+        if self.block_size is None:
+            return apply_edges_multi(vertices, self.get_edges(), aggregation_functions, flatten=flatten,
+                                     block_size=None)
+        outs = collapse_edges_blocked(self.edge_function, self.vertex_positions, self.shared_inputs, vertices,
+                                      aggregation_functions, self.block_size)
+        if flatten:
+            outs = [tf.reshape(out, shape=[out.shape[0], out.shape[1], -1]) for out in outs]
+        return outs
+
+    def expand(self, features, flatten=True):
+        """
+        Same as apply_edges(features, transpose(edges, [0, 2, 1, 3]), reduce_sum=False, flatten)
+
+        :param features: Seed features [B, S, F']
+        :return: Vertex features [B, V, S*F'*F] (or [B, V, S, F', F] if not flatten)
+        """
+        if self.block_size is None:
+            return apply_edges(features, tf.transpose(self.get_edges(), perm=[0, 2, 1, 3]), reduce_sum=False,
+                               flatten=flatten)
+        out = expand_edges_blocked(self.edge_function, self.vertex_positions, self.shared_inputs, features,
+                                   self.block_size)
+        if flatten:
+            out = tf.reshape(out, shape=[out.shape[0], out.shape[1], -1])
+        return out
+
+
+def apply_edges_multi(vertices, edges, aggregation_functions, flatten=True, expand_first_vertex_dim=True,
+                      block_size=-1):
+    '''
+    Same as apply_edges with reduce_sum for several aggregation functions at once, e.g. [tf.reduce_max, tf.reduce_mean].
+    The product of edges and vertices is only built once for all of them, see aggregate_statistics, or in blocks
+    (see apply_edges).
+    Returns a list with BxVxF'' for every aggregation function
+    '''
+    if block_size == -1:
+        block_size = edge_block_size
+    if expand_first_vertex_dim:
+        vertices = tf.expand_dims(vertices,axis=1)
+
+    if block_size is not None and block_size < int(edges.shape[2]) \
+            and all([x in _blocked_aggregations for x in aggregation_functions]):
+        outs = aggregate_edges_blocked(vertices, edges, aggregation_functions, block_size)
+    else:
+        out = tf.expand_dims(edges,axis=3)*tf.expand_dims(vertices,axis=4) # [BxVxV'x1xF] x [Bx1xV'xF'x1] = [BxVxV'xFxF']
+        outs = aggregate_statistics(out, 2, aggregation_functions)
+
+    if flatten:
+        outs = [tf.reshape(out,shape=[out.shape[0],out.shape[1],-1]) for out in outs]
+    return outs
+
+
+def apply_edges(vertices, edges, reduce_sum=True, flatten=True,expand_first_vertex_dim=True, aggregation_function=tf.reduce_max,
+                block_size=-1): 
     '''
     edges are naturally BxVxV'xF
     vertices are BxVxF'  or BxV'xF'
     This function returns BxVxF'' if flattened and summed
+    If reduce_sum, the aggregation over V' is done in blocks of block_size vertices (-1 for the module default,
+    see set_edge_block_size), see aggregate_edges_blocked
     '''
+    if reduce_sum:
+        return apply_edges_multi(vertices, edges, [aggregation_function], flatten=flatten,
+                                 expand_first_vertex_dim=expand_first_vertex_dim, block_size=block_size)[0]
+
     edges = tf.expand_dims(edges,axis=3)
     if expand_first_vertex_dim:
         vertices = tf.expand_dims(vertices,axis=1)
@@ -232,8 +684,6 @@ def apply_edges(vertices, edges, reduce_sum=True, flatten=True,expand_first_vert
 
     out = edges*vertices # [BxVxV'x1xF] x [Bx1xV'xF'x1] = [BxVxV'xFxF']
 
-    if reduce_sum:
-        out = aggregation_function(out,axis=2)
     if flatten:
         out = tf.reshape(out,shape=[out.shape[0],out.shape[1],-1])
     
@@ -257,8 +707,7 @@ def sparse_conv_add_simple_seed_labels(net,seed_indices):
                                                                     net['spatial_features_global'], \
                                                                     net['spatial_features_local'], \
                                                                     net['num_entries']
-    seedselector = make_batch_selection(seed_indices)
-    seed_space = tf.gather_nd(space_global,seedselector)
+    seed_space = batch_gather(space_global,seed_indices)
     label = tf.argmin(euclidean_squared(space_global, seed_space), axis=-1)
     label = tf.cast(label,dtype=tf.float32)
     colours_in = tf.concat([colours_in,tf.expand_dims(label, axis=2)], axis=-1)
@@ -267,9 +716,8 @@ def sparse_conv_add_simple_seed_labels(net,seed_indices):
 
 def get_distance_weight_to_seeds(vertices_in, seed_idx, dimensions=4, add_zeros=0):
     
-    seedselector = make_batch_selection(seed_idx)
     vertices_in = tf.layers.dense (vertices_in, dimensions, kernel_initializer=NoisyEyeInitializer)
-    seed_vertices = tf.gather_nd(vertices_in,seedselector)
+    seed_vertices = batch_gather(vertices_in,seed_idx)
     edges = create_edges(vertices_in,seed_vertices, zero_is_one_weight=True)
     distance = edges[:,:,:,0]
     distance = tf.transpose(distance, perm=[0,2,1])
@@ -296,20 +744,19 @@ def sparse_conv_seeded3(vertices_in,
     #for later
     _sparse_conv_naming_index+=1
     
-    seedselector = make_batch_selection(seed_indices) # To select seeds from all the features using gather_nd
-    
     trans_space = apply_space_transform(vertices_in, nspacefilters,nspacedim) # Just a couple of dense layers
 
-    seed_trans_space = tf.gather_nd(trans_space,seedselector) # Select seeds from transformed space
+    seed_trans_space = batch_gather(trans_space,seed_indices) # Select seeds from transformed space
 
-    edges = create_edges(trans_space,seed_trans_space,n_properties=use_edge_properties) # BxVxV'xF
+    edges = SeedEdges(lambda positions, seeds: create_edges(positions, seeds, n_properties=use_edge_properties),
+                      trans_space, [seed_trans_space]) # BxVxV'xF
 
     trans_vertices = tf.layers.dense(vertices_in,nfilters,activation=tf.nn.relu) # Just dense again
 
-    expanded_collapsed = apply_edges(trans_vertices, edges, reduce_sum=True, flatten=True) # [BxVxF]
+    expanded_collapsed = edges.collapse(trans_vertices)[0] # [BxVxF]
    
     #add back seed features
-    seed_all_features = tf.gather_nd(trans_vertices,seedselector)
+    seed_all_features = batch_gather(trans_vertices,seed_indices)
     
     #simple dense check this part
     #maybe add additional dense
@@ -331,8 +778,7 @@ def sparse_conv_seeded3(vertices_in,
     print('expanded_collapsed',expanded_collapsed.shape)
     
     #propagate back, transposing the edges does the trick, now they point from Nseeds to Nvertices
-    edges = tf.transpose(edges, perm=[0,2, 1,3]) # [BxVxV'xF]
-    expanded_collapsed = apply_edges(expanded_collapsed, edges, reduce_sum=False, flatten=True)
+    expanded_collapsed = edges.expand(expanded_collapsed)
     if compress_before_propagate:
         expanded_collapsed = tf.layers.dense(expanded_collapsed,nfilters, activation=tf.nn.tanh,
                                              kernel_initializer=NoisyEyeInitializer)
@@ -358,10 +804,9 @@ def sparse_conv_global_exchange(vertices_in,
     if learn_global_node_placement_dimensions is not None:
         trans_vertices_in_space = trans_vertices_in[:,:,0:learn_global_node_placement_dimensions]
         global_node_placement = tf.reduce_mean(trans_vertices_in_space,axis=1, keepdims=True)
-        edges = create_edges(trans_vertices_in_space, global_node_placement,
-                             norotation=True)
-        edges = gauss_times_linear(edges)
-        global_summed = apply_edges(trans_vertices_in, edges, reduce_sum=True, flatten=True)
+        edges = SeedEdges(lambda positions, seeds: gauss_times_linear(create_edges(positions, seeds, norotation=True)),
+                          trans_vertices_in_space, [global_node_placement])
+        global_summed = edges.collapse(trans_vertices_in)[0]
         
         
     else: 
@@ -420,10 +865,14 @@ def sparse_conv_moving_seeds2(vertices_in,
     
     print('seed_positions',seed_positions.shape)
     
-    edges = create_active_edges(trans_global_vertices,seed_positions,multiplier=edge_multiplicity,name=this_name)
+    edge_parameters = create_active_edges_parameters(trans_global_vertices, seed_positions, this_name,
+                                                     multiplier=edge_multiplicity)
+    edges = SeedEdges(lambda positions, seeds, rec_field_scaler, frequency_scaler:
+                      apply_active_edges(positions, seeds, rec_field_scaler, frequency_scaler,
+                                         multiplier=edge_multiplicity),
+                      trans_global_vertices, [seed_positions] + list(edge_parameters))
     
-    print('sparse_conv_moving_seeds: edges ', edges.shape)
-    expanded_collapsed = apply_edges(trans_vertices, edges, reduce_sum=True, flatten=True)
+    expanded_collapsed = edges.collapse(trans_vertices)[0]
     
     
     
@@ -446,8 +895,7 @@ def sparse_conv_moving_seeds2(vertices_in,
     if compress_before_propagate:
         expanded_collapsed = tf.layers.dense(expanded_collapsed,n_filters,activation=tf.nn.relu)
         
-    edges = tf.transpose(edges, perm=[0,2, 1,3]) # [BxVxV'xF]
-    expanded_collapsed = apply_edges(expanded_collapsed, edges, reduce_sum=False, flatten=True)
+    expanded_collapsed = edges.expand(expanded_collapsed)
     
     if compress_before_propagate or not add_back_original:
         expanded_collapsed = tf.layers.dense(expanded_collapsed,n_filters, activation=tf.nn.tanh,
@@ -503,14 +951,15 @@ def sparse_conv_make_neighbors2(vertices_in, num_neighbors=10,
     else:
         trans_space = vertices_in[:,:,0:space_transformations[-1]]
 
-    indexing = None
+    # A given indexing (e.g. indexing_tensor_static(..., compact=True) of a fixed geometry) is used as it is
     if train_global_space:
-        indexing, _ = indexing_tensor_2(trans_space[0:1,:,:], num_neighbors, n_batch=trans_space.shape[0])
+        if indexing is None:
+            indexing, _ = indexing_tensor_2(trans_space[0:1,:,:], num_neighbors, n_batch=trans_space.shape[0], compact=True)
         trans_space = tf.tile(trans_space,[vertices_in.shape[0],1,1])
-    else:
-        indexing, _ = indexing_tensor_2(trans_space, num_neighbors)
+    elif indexing is None:
+        indexing, _ = indexing_tensor_2(trans_space, num_neighbors, compact=True)
     
-    neighbour_space = tf.gather_nd(trans_space, indexing)
+    neighbour_space = batch_gather(trans_space, indexing)
     
     #build edges manually
     expanded_trans_space = tf.expand_dims(trans_space, axis=2)
@@ -545,7 +994,7 @@ def sparse_conv_make_neighbors2(vertices_in, num_neighbors=10,
                                 edges.shape[-1],activation=edge_activation,
                                 kernel_initializer = space_initializer)
         
-        vertex_with_neighbours = tf.gather_nd(updated_vertices, indexing)
+        vertex_with_neighbours = batch_gather(updated_vertices, indexing)
         vertex_with_neighbours = tf.expand_dims(vertex_with_neighbours,axis=4)
         flattened_gathered = vertex_with_neighbours * edges
         flattened_gathered = tf.reduce_mean(flattened_gathered, axis=2)
@@ -569,9 +1018,9 @@ def sparse_conv_edge_conv(vertices_in, num_neighbors=30,
                       ):
     
     trans_space = vertices_in
-    indexing, _ = indexing_tensor_2(trans_space, num_neighbors)
+    indexing, _ = indexing_tensor_2(trans_space, num_neighbors, compact=True)
     #change indexing to be not self-referential
-    neighbour_space = tf.gather_nd(vertices_in, indexing)
+    neighbour_space = batch_gather(vertices_in, indexing)
     
     expanded_trans_space = tf.expand_dims(trans_space, axis=2)
     expanded_trans_space = tf.tile(expanded_trans_space,[1,1,num_neighbors,1])
@@ -596,13 +1045,8 @@ def max_pool_on_last_dimensions(vertices_in, n_output_vertices):
     all_features = vertices_in
     
     _, I = tf.nn.top_k(tf.reduce_max(all_features, axis=2), n_output_vertices)
-    I = tf.expand_dims(I, axis=2)
-
-    batch_range = tf.expand_dims(tf.expand_dims(tf.range(0, vertices_in.shape[0]), axis=1), axis=1)
-    batch_range = tf.tile(batch_range, [1,n_output_vertices, 1])
-    _indexing_tensor = tf.concat([batch_range, I], axis=2)
     
-    return tf.gather_nd(vertices_in, _indexing_tensor)
+    return batch_gather(vertices_in, I)
     
 
 def create_active_edges2(vertices_a, vertices_b, name,multiplier=1,skew_and_var=None,fixed_frequency=-1,
@@ -1098,10 +1542,11 @@ def sparse_conv_aggregator_simple(vertices_in,
     seed_properties  = tf.concat(seed_properties, axis=1)
     ###
 
-    edges = create_edges(trans_space,seed_trans_space,n_properties=use_edge_properties) # BxVxV'xF
+    edges = SeedEdges(lambda positions, seeds: create_edges(positions, seeds, n_properties=use_edge_properties),
+                      trans_space, [seed_trans_space]) # BxVxV'xF
 
 
-    expanded_collapsed = apply_edges(trans_vertices, edges, reduce_sum=True, flatten=True) # [BxVxF]
+    expanded_collapsed = edges.collapse(trans_vertices)[0] # [BxVxF]
     if not weighted_aggregator_positions:
         expanded_collapsed = tf.concat([expanded_collapsed,seed_properties],axis=-1)
     if collapse_dropout>0:
@@ -1112,8 +1557,7 @@ def sparse_conv_aggregator_simple(vertices_in,
     aggregators = expanded_collapsed
     print('expanded_collapsed',expanded_collapsed.shape)
     #propagate back, transposing the edges does the trick, now they point from Nseeds to Nvertices
-    edges = tf.transpose(edges, perm=[0,2, 1,3]) # [BxVxV'xF]
-    expanded_collapsed = apply_edges(expanded_collapsed, edges, reduce_sum=False, flatten=True)
+    expanded_collapsed = edges.expand(expanded_collapsed)
     if expand_dropout>0:
         expanded_collapsed = tf.layers.dropout(expanded_collapsed,rate=expand_dropout,training=is_training)
     if compress_before_propagate:
@@ -1163,13 +1607,13 @@ def sparse_conv_make_neighbors_simple(vertices_in,
     print('trans_space',trans_space.shape)
     
     if train_global_space:
-        indexing, _ = indexing_tensor_2(trans_space, num_neighbors, n_batch=vertices_in.shape[0])
+        indexing, _ = indexing_tensor_2(trans_space, num_neighbors, n_batch=vertices_in.shape[0], compact=True)
         trans_space = tf.tile(trans_space,[vertices_in.shape[0],1,1])
     else:
-        indexing, _ = indexing_tensor_2(trans_space, num_neighbors)
+        indexing, _ = indexing_tensor_2(trans_space, num_neighbors, compact=True)
 
 
-    neighbour_space = tf.gather_nd(trans_space, indexing)
+    neighbour_space = batch_gather(trans_space, indexing)
     
     #build edges manually
     expanded_trans_space = tf.expand_dims(trans_space, axis=2)
@@ -1191,7 +1635,7 @@ def sparse_conv_make_neighbors_simple(vertices_in,
         trans_vertices = tf.layers.dense(trans_vertices,f,activation=tf.nn.relu)
         #some dense on the vertex input
     
-    neighbour_vertices = tf.gather_nd(trans_vertices, indexing)
+    neighbour_vertices = batch_gather(trans_vertices, indexing)
     for f in edge_filters:
         edges = tf.layers.dense(edges,f,activation=tf.nn.relu)
     print('edges',edges.shape)
@@ -1242,13 +1686,13 @@ def sparse_conv_make_neighbors_simple_multipass(vertices_in,
     print('trans_space',trans_space.shape)
     
     if train_global_space:
-        indexing, _ = indexing_tensor_2(trans_space, num_neighbors, n_batch=vertices_in.shape[0])
+        indexing, _ = indexing_tensor_2(trans_space, num_neighbors, n_batch=vertices_in.shape[0], compact=True)
         trans_space = tf.tile(trans_space,[vertices_in.shape[0],1,1])
     else:
-        indexing, _ = indexing_tensor_2(trans_space, num_neighbors)
+        indexing, _ = indexing_tensor_2(trans_space, num_neighbors, compact=True)
 
 
-    neighbour_space = tf.gather_nd(trans_space, indexing)
+    neighbour_space = batch_gather(trans_space, indexing)
     
     #build edges manually
     expanded_trans_space = tf.expand_dims(trans_space, axis=2)
@@ -1261,7 +1705,7 @@ def sparse_conv_make_neighbors_simple_multipass(vertices_in,
     edges_orig=edges
     for i in range(len(n_filters)):
         trans_vertices = updated_vertices #tf.layers.dense(updated_vertices,n_filters[i],activation=tf.nn.relu)
-        neighbour_vertices = tf.gather_nd(trans_vertices, indexing)
+        neighbour_vertices = batch_gather(trans_vertices, indexing)
         edges = tf.layers.dense(edges_orig,edge_filters[i],activation=tf.nn.relu)
         edges = tf.expand_dims(edges, axis=4)
         neighbour_vertices = tf.expand_dims(neighbour_vertices, axis=3)
@@ -1306,12 +1750,15 @@ def sparse_conv_hidden_aggregators(vertices_in,
     print('edges',edges.shape)
     print('vertices_in',vertices_in.shape)
     
-    vertices_in_collapsed = apply_edges(vertices_in, edges, reduce_sum=True, flatten=True)#,aggregation_function=tf.reduce_mean)# [BxNAxF]
-    vertices_in_mean_collapsed = apply_edges(vertices_in, edges, reduce_sum=True, flatten=True ,aggregation_function=tf.reduce_mean)# [BxNAxF]
-    
-    #vertices_in_collapsed = sprint(vertices_in_collapsed,'vertices_in_collapsed')
     if plus_mean:
+        # max and mean from one product of edges and vertices
+        vertices_in_collapsed, vertices_in_mean_collapsed = apply_edges_multi(vertices_in, edges,
+                                                                              [tf.reduce_max, tf.reduce_mean])# [BxNAxF]
         vertices_in_collapsed= tf.concat([vertices_in_collapsed,vertices_in_mean_collapsed],axis=-1 )
+    else:
+        vertices_in_collapsed = apply_edges(vertices_in, edges, reduce_sum=True, flatten=True)# [BxNAxF]
+    
+    #vertices_in_collapsed = sprint(vertices_in_collapsed,'vertices_in_collapsed')
     print('vertices_in_collapsed',vertices_in_collapsed.shape)
 
     if return_agg:
@@ -1352,7 +1799,7 @@ def sparse_conv_multi_neighbours(vertices_in,
     #neighb_dimensions=sprint(neighb_dimensions,'neighb_dimensions')
     
     def collapse_to_vertex(indexing,distance,vertices,indiv_conv):
-        neighbours = tf.gather_nd(vertices, indexing)  #BxVxNxF
+        neighbours = batch_gather(vertices, indexing)  #BxVxNxF
         distance = tf.expand_dims(distance,axis=3)
         if not total_distance:
             distance = distance*1e5
@@ -1364,22 +1811,22 @@ def sparse_conv_multi_neighbours(vertices_in,
         #edges = sprint(edges,'edges')
         neighbours = neighbours[:,:,1:,:]
         scaled_feat = edges*neighbours
-        collapsed = tf.reduce_max(scaled_feat, axis=2)
-        collapsed_mean = tf.reduce_mean(scaled_feat,axis=2)
         if plus_mean:
-            collapsed = tf.concat([collapsed,collapsed_mean],axis=-1)
+            collapsed = tf.concat(aggregate_statistics(scaled_feat, 2, [tf.reduce_max, tf.reduce_mean]),axis=-1)
+        else:
+            collapsed = tf.reduce_max(scaled_feat, axis=2)
         if indiv_conv:
             collapsed = tf.concat([collapsed, tf.reshape(neighbours,[neighbours.shape[0],neighbours.shape[1],-1])],axis=-1)
         return collapsed
     
     out_per_dim = []
     if total_distance:
-        indexing, distance = indexing_tensor_2(neighb_dimensions, n_neighbours)
+        indexing, distance = indexing_tensor_2(neighb_dimensions, n_neighbours, compact=True)
         out_per_dim.append(collapse_to_vertex(indexing,distance,vertices_prop,individual_conv))
     else:
         neighb_dimensions_exp = tf.expand_dims(neighb_dimensions,axis=3) #BxVxNDx1
         for d in range(n_dimensions):
-            indexing, distance = indexing_tensor_2(neighb_dimensions_exp[:,:,d,:], n_neighbours)
+            indexing, distance = indexing_tensor_2(neighb_dimensions_exp[:,:,d,:], n_neighbours, compact=True)
             out_per_dim.append(collapse_to_vertex(indexing,distance,vertices_prop,individual_conv))
         #make it a weighted mean mean of weighted
         #add a conv part where IN ADDITION to the weighted mean, the features are ordered by distance (just use neighbouts as they are)
@@ -1430,70 +1877,13 @@ def sparse_conv_hidden_aggregators_reference(vertices_in,
     
     
 
-import readers.indices_calculated as ic    
 def construct_binning16(vertices_in):
-    
-    batch_size = int(vertices_in.shape[0])
-    max_entries = int(vertices_in.shape[1])
-    nfeat = int(vertices_in.shape[2])
-    
-    
-    batch_indices = np.arange(batch_size)
-    batch_indices = np.tile(batch_indices[..., np.newaxis], reps=(1, max_entries))[..., np.newaxis]
-
-    indexing_array = \
-        np.concatenate((ic.x_bins_beta_calo_16[:, np.newaxis], ic.y_bins_beta_calo_16[:, np.newaxis], ic.l_bins_beta_calo_16[:, np.newaxis],
-                        ic.d_indices_beta_calo_16[:, np.newaxis]),
-                       axis=1)[np.newaxis, ...]
-
-    indexing_array = np.tile(indexing_array, reps=[batch_size, 1, 1])
-    indexing_array = np.concatenate((batch_indices, indexing_array), axis=2).astype(np.int64)
-
-
-    indexing_array2 = \
-        np.concatenate((ic.x_bins_beta_calo[:, np.newaxis], ic.y_bins_beta_calo[:, np.newaxis], ic.l_bins_beta_calo[:, np.newaxis],
-                        ic.d_indices_beta_calo[:, np.newaxis]),
-                       axis=1)[np.newaxis, ...]
-
-    indexing_array2 = np.tile(indexing_array2, reps=[batch_size, 1, 1])
-    indexing_array2 = np.concatenate((batch_indices, indexing_array2), axis=2).astype(np.int64)
-
-    result = tf.scatter_nd(indexing_array, vertices_in, shape=(batch_size, 16, 16, 20, 4, nfeat ))
-    result = tf.reshape(result, [batch_size, 16, 16, 20, -1])
-
-    return result, indexing_array
+    # Returns the binned vertices and the name of the binning for unbin_vertices
+    return bin_vertices(vertices_in, 'beta_calo_16'), 'beta_calo_16'
 
 def construct_binning20(vertices_in):
-    
-    batch_size = int(vertices_in.shape[0])
-    max_entries = int(vertices_in.shape[1])
-    nfeat = int(vertices_in.shape[2])
-    
-    
-    batch_indices = np.arange(batch_size)
-    batch_indices = np.tile(batch_indices[..., np.newaxis], reps=(1, max_entries))[..., np.newaxis]
-
-    indexing_array = \
-        np.concatenate((ic.x_bins_beta_calo_20[:, np.newaxis], ic.y_bins_beta_calo_20[:, np.newaxis], ic.l_bins_beta_calo_20[:, np.newaxis],
-                        ic.d_indices_beta_calo_20[:, np.newaxis]),
-                       axis=1)[np.newaxis, ...]
-
-    indexing_array = np.tile(indexing_array, reps=[batch_size, 1, 1])
-    indexing_array = np.concatenate((batch_indices, indexing_array), axis=2).astype(np.int64)
-
-
-    indexing_array2 = \
-        np.concatenate((ic.x_bins_beta_calo[:, np.newaxis], ic.y_bins_beta_calo[:, np.newaxis], ic.l_bins_beta_calo[:, np.newaxis],
-                        ic.d_indices_beta_calo[:, np.newaxis]),
-                       axis=1)[np.newaxis, ...]
-
-    indexing_array2 = np.tile(indexing_array2, reps=[batch_size, 1, 1])
-    indexing_array2 = np.concatenate((batch_indices, indexing_array2), axis=2).astype(np.int64)
-
-    result = tf.scatter_nd(indexing_array, vertices_in, shape=(batch_size, 20, 20, 20, 1, nfeat ))
-    result = tf.reshape(result, [batch_size, 20, 20, 20, -1])
-
-    return result, indexing_array
+    # Returns the binned vertices and the name of the binning for unbin_vertices
+    return bin_vertices(vertices_in, 'beta_calo_20'), 'beta_calo_20'
     
 def sparse_conv_global_exchange_binned(binned_in):
     in_shape = binned_in.shape.as_list()
@@ -1,5 +1,5 @@
 import tensorflow as tf
-from .neighbors import indexing_tensor, indexing_tensor_2, sort_last_dim_tensor
+from .neighbors import indexing_tensor, indexing_tensor_2, sort_last_dim_tensor, batch_gather
 from ops.nn import *
 import numpy as np
 from tensorflow.python.ops.init_ops import Initializer
@@ -27,7 +27,7 @@ def sparse_conv_rec(sparse_dict, num_neighbors=10, output_all=15):
                                                                                  sparse_dict['spatial_features_local'], \
                                                                                  sparse_dict['num_entries']
 
-    _indexing_tensor = indexing_tensor(spatial_features_global, num_neighbors)
+    _indexing_tensor = indexing_tensor(spatial_features_global, num_neighbors, compact=True)
 
     shape_space_features = spatial_features_global.get_shape().as_list()
     shape_space_features_local = spatial_features_local.get_shape().as_list()
@@ -42,21 +42,21 @@ def sparse_conv_rec(sparse_dict, num_neighbors=10, output_all=15):
 
     # All of these tensors should be 3-dimensional
     # TODO: Add assert for indexing_tensor shape
-    assert len(shape_space_features) == 3 and len(shape_all_features) == 3 and len(shape_indexing_tensor) == 4
+    assert len(shape_space_features) == 3 and len(shape_all_features) == 3 and len(shape_indexing_tensor) == 3
 
     # First dimension is batch, second is number of entries, hence these two should be same for all
     assert shape_space_features[0] == shape_all_features[0]
     assert shape_space_features[1] == shape_all_features[1]
 
     # Neighbor matrix should be int as it should be used for indexing
-    assert _indexing_tensor.dtype == tf.int64
+    assert _indexing_tensor.dtype == tf.int32
 
-    gathered_space_1 = tf.gather_nd(spatial_features_global, _indexing_tensor)  # [B,E,5,S]
+    gathered_space_1 = batch_gather(spatial_features_global, _indexing_tensor)  # [B,E,5,S]
     delta_space = sparse_conv_delta(gathered_space_1, spatial_features_global)  # [B,E,5,S]
 
-    spatial_features_local_gathered = tf.gather_nd(spatial_features_local, _indexing_tensor)
+    spatial_features_local_gathered = batch_gather(spatial_features_local, _indexing_tensor)
 
-    gathered_all = tf.gather_nd(all_features, _indexing_tensor)  # [B,E,5,F]
+    gathered_all = batch_gather(all_features, _indexing_tensor)  # [B,E,5,F]
 
     gathered_flattenned_temporal = tf.reshape(gathered_all, (-1, n_max_neighbors, n_features_input_all))
 
@@ -91,7 +91,7 @@ def sparse_conv_add(sparse_dict, num_neighbors=10, output_all=15):
                                                                                  sparse_dict['spatial_features_local'], \
                                                                                  sparse_dict['num_entries']
 
-    _indexing_tensor = indexing_tensor(spatial_features_global, num_neighbors)
+    _indexing_tensor = indexing_tensor(spatial_features_global, num_neighbors, compact=True)
 
     shape_space_features = spatial_features_global.get_shape().as_list()
     shape_space_features_local = spatial_features_local.get_shape().as_list()
@@ -106,21 +106,21 @@ def sparse_conv_add(sparse_dict, num_neighbors=10, output_all=15):
 
     # All of these tensors should be 3-dimensional
     # TODO: Add assert for indexing_tensor shape
-    assert len(shape_space_features) == 3 and len(shape_all_features) == 3 and len(shape_indexing_tensor) == 4
+    assert len(shape_space_features) == 3 and len(shape_all_features) == 3 and len(shape_indexing_tensor) == 3
 
     # First dimension is batch, second is number of entries, hence these two should be same for all
     assert shape_space_features[0] == shape_all_features[0]
     assert shape_space_features[1] == shape_all_features[1]
 
     # Neighbor matrix should be int as it should be used for indexing
-    assert _indexing_tensor.dtype == tf.int64
+    assert _indexing_tensor.dtype == tf.int32
 
-    gathered_space_1 = tf.gather_nd(spatial_features_global, _indexing_tensor)  # [B,E,5,S]
+    gathered_space_1 = batch_gather(spatial_features_global, _indexing_tensor)  # [B,E,5,S]
     delta_space = sparse_conv_delta(gathered_space_1, spatial_features_global)  # [B,E,5,S]
 
-    spatial_features_local_gathered = tf.gather_nd(spatial_features_local, _indexing_tensor)
+    spatial_features_local_gathered = batch_gather(spatial_features_local, _indexing_tensor)
 
-    gathered_all = tf.gather_nd(all_features, _indexing_tensor)  # [B,E,5,F]
+    gathered_all = batch_gather(all_features, _indexing_tensor)  # [B,E,5,F]
 
     output = tf.layers.dense(gathered_all, output_all, activation=tf.nn.relu)
     output = tf.reduce_sum(output, axis=2)
@@ -147,7 +147,7 @@ def sparse_conv_jan(sparse_dict, num_neighbors=10, output_all=15):
                                                                                  sparse_dict['spatial_features_local'], \
                                                                                  sparse_dict['num_entries']
 
-    _indexing_tensor = indexing_tensor(spatial_features_global, num_neighbors)
+    _indexing_tensor = indexing_tensor(spatial_features_global, num_neighbors, compact=True)
 
     shape_space_features = spatial_features_global.get_shape().as_list()
     shape_space_features_local = spatial_features_local.get_shape().as_list()
@@ -162,21 +162,21 @@ def sparse_conv_jan(sparse_dict, num_neighbors=10, output_all=15):
 
     # All of these tensors should be 3-dimensional
     # TODO: Add assert for indexing_tensor shape
-    assert len(shape_space_features) == 3 and len(shape_all_features) == 3 and len(shape_indexing_tensor) == 4
+    assert len(shape_space_features) == 3 and len(shape_all_features) == 3 and len(shape_indexing_tensor) == 3
 
     # First dimension is batch, second is number of entries, hence these two should be same for all
     assert shape_space_features[0] == shape_all_features[0]
     assert shape_space_features[1] == shape_all_features[1]
 
     # Neighbor matrix should be int as it should be used for indexing
-    assert _indexing_tensor.dtype == tf.int64
+    assert _indexing_tensor.dtype == tf.int32
 
-    gathered_space_1 = tf.gather_nd(spatial_features_global, _indexing_tensor)  # [B,E,5,S]
+    gathered_space_1 = batch_gather(spatial_features_global, _indexing_tensor)  # [B,E,5,S]
     delta_space = sparse_conv_delta(gathered_space_1, spatial_features_global)  # [B,E,5,S]
 
-    spatial_features_local_gathered = tf.gather_nd(spatial_features_local, _indexing_tensor)
+    spatial_features_local_gathered = batch_gather(spatial_features_local, _indexing_tensor)
 
-    gathered_all = tf.gather_nd(all_features, _indexing_tensor)  # [B,E,5,F]
+    gathered_all = batch_gather(all_features, _indexing_tensor)  # [B,E,5,F]
 
     data_in = tf.concat((gathered_all, gathered_space_1), axis=3)
     gathered_flattenned_temporal = tf.reshape(data_in, (n_batch * n_max_entries, n_max_neighbors, -1))
@@ -213,7 +213,7 @@ def sparse_conv_jan_with_conv(sparse_dict, num_neighbors=10, output_all=15):
                                                                                  sparse_dict['spatial_features_local'], \
                                                                                  sparse_dict['num_entries']
 
-    _indexing_tensor = indexing_tensor(spatial_features_global, num_neighbors)
+    _indexing_tensor = indexing_tensor(spatial_features_global, num_neighbors, compact=True)
 
     shape_space_features = spatial_features_global.get_shape().as_list()
     shape_space_features_local = spatial_features_local.get_shape().as_list()
@@ -228,21 +228,21 @@ def sparse_conv_jan_with_conv(sparse_dict, num_neighbors=10, output_all=15):
 
     # All of these tensors should be 3-dimensional
     # TODO: Add assert for indexing_tensor shape
-    assert len(shape_space_features) == 3 and len(shape_all_features) == 3 and len(shape_indexing_tensor) == 4
+    assert len(shape_space_features) == 3 and len(shape_all_features) == 3 and len(shape_indexing_tensor) == 3
 
     # First dimension is batch, second is number of entries, hence these two should be same for all
     assert shape_space_features[0] == shape_all_features[0]
     assert shape_space_features[1] == shape_all_features[1]
 
     # Neighbor matrix should be int as it should be used for indexing
-    assert _indexing_tensor.dtype == tf.int64
+    assert _indexing_tensor.dtype == tf.int32
 
-    gathered_space_1 = tf.gather_nd(spatial_features_global, _indexing_tensor)  # [B,E,5,S]
+    gathered_space_1 = batch_gather(spatial_features_global, _indexing_tensor)  # [B,E,5,S]
     delta_space = sparse_conv_delta(gathered_space_1, spatial_features_global)  # [B,E,5,S]
 
-    spatial_features_local_gathered = tf.gather_nd(spatial_features_local, _indexing_tensor)
+    spatial_features_local_gathered = batch_gather(spatial_features_local, _indexing_tensor)
 
-    gathered_all = tf.gather_nd(all_features, _indexing_tensor)  # [B,E,5,F]
+    gathered_all = batch_gather(all_features, _indexing_tensor)  # [B,E,5,F]
 
     expanded_space = tf.reshape(gathered_space_1, shape=(n_batch, n_max_entries * num_neighbors, -1))
 
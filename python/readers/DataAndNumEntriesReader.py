@@ -1,8 +1,14 @@
 from readers.InputReader import InputReader
+from readers.pipeline import read_file_paths, shard_file_paths, make_records_dataset, prefetch, prune_hits
 import tensorflow as tf
 
 
 class DataAndNumEntriesReader:
+    # Whether the rows beyond num_entries are only padding, so events can be cut to shorter lengths
+    supports_bucketing = True
+    # Whether the rows of every event are the cells of a geometry in its fixed sensor order
+    sensor_order = False
+
     def __init__(self, files_list, num_max_entries, num_data_dims, num_batch, repeat=True, shuffle_size=None):
         self.files_list = files_list
         self.repeat = repeat
@@ -10,26 +16,255 @@ class DataAndNumEntriesReader:
         self.num_max_entries = num_max_entries
         self.num_data_dims = num_data_dims
         self.num_batch = num_batch
+        self.set_pipeline_options()
+        self.set_data_format()
+        self.set_bucketing()
+        self.set_hit_pruning()
+        self.set_sharding()
+        self.set_geometry()
 
-    def get_feeds(self, shuffle=True):
-        def _parse_function(example_proto):
-            keys_to_features = {
-                'data': tf.FixedLenFeature((self.num_max_entries, self.num_data_dims), tf.float32),
-                'num_entries': tf.FixedLenFeature(1, tf.int64)
-            }
-            parsed_features = tf.parse_single_example(example_proto, keys_to_features)
-            return parsed_features['data'], parsed_features['num_entries']
-
-        with open(self.files_list) as f:
-            content = f.readlines()
-        file_paths = [x.strip() for x in content]
-        dataset = tf.data.TFRecordDataset(file_paths, compression_type='GZIP')
-        dataset = dataset.map(_parse_function)
+    def set_pipeline_options(self, num_parallel_reads=1, num_parallel_calls=None, prefetch_size=None,
+                             batch_parse=False):
+        """
+        Sets how the input pipeline is parallelized. See readers.pipeline.get_pipeline_options for reading these
+        from a config.
+
+        :param num_parallel_reads: Number of files to decompress and read in parallel
+        :param num_parallel_calls: Number of threads to parse records
+        :param prefetch_size: Number of batches to prefetch, None for the reader default
+        :param batch_parse: Batch the serialized records first and parse every batch with one vectorized
+                            tf.parse_example call. Gives the same tensors as parsing record by record.
+        :return: self
+        """
+        self.num_parallel_reads = num_parallel_reads
+        self.num_parallel_calls = num_parallel_calls
+        self.prefetch_size = prefetch_size
+        self.batch_parse = batch_parse
+        return self
+
+    def set_data_format(self, column_groups=None, storage_dtype=tf.float32):
+        """
+        Sets which columns of data are returned and how data is stored in the tfrecords files.
+
+        :param column_groups: Tuple of column index tuples, e.g. (spatial, spatial local, others, targets). If set,
+                              the data feed is replaced by one feed per group.
+        :param storage_dtype: tf.float32 for float lists or tf.float16 for raw half precision bytes, see
+                              bin/conversion/convert_to_float16_records.py. Data is kept in the storage dtype through
+                              shuffling and batching and upcast to float32 after the column split.
+        :return: self
+        """
+        if storage_dtype not in (tf.float32, tf.float16):
+            raise ValueError("Unsupported storage dtype %s" % str(storage_dtype))
+        self.column_groups = column_groups
+        self.storage_dtype = storage_dtype
+        return self
+
+    def set_bucketing(self, bucket_lengths=None):
+        """
+        Groups events by num_entries and pads every batch only to the shortest bucket length which fits all of its
+        events, instead of to num_max_entries. The length of a batch is its shape[1].
+
+        :param bucket_lengths: List of padded lengths. num_max_entries is added if it's not there.
+        :return: self
+        """
+        if bucket_lengths is None:
+            self.bucket_lengths = None
+            return self
+        if not self.supports_bucketing:
+            raise ValueError("%s doesn't support bucketing" % type(self).__name__)
+        self.bucket_lengths = sorted(set([int(x) for x in bucket_lengths if int(x) < self.num_max_entries]
+                                         + [self.num_max_entries]))
+        return self
+
+    def set_hit_pruning(self, energy_threshold=None, time_threshold=None, energy_index=0, time_index=None,
+                        in_place=False):
+        """
+        Drops the hits with energy or time below a threshold from every batch, see readers.pipeline.prune_hits. The
+        seed hits are kept and the seed indices remapped. get_pruning_counts gives how many hits were dropped.
+
+        :param energy_threshold: Smallest energy of the kept hits, None for no energy threshold
+        :param time_threshold: Smallest time of the kept hits, None for no time threshold
+        :param energy_index: Column of data which holds the energy
+        :param time_index: Column of data which holds the time
+        :param in_place: Zero the dropped hits instead of removing them, for the models which depend on the fixed
+                         sensor order
+        :return: self
+        """
+        if time_threshold is not None and time_index is None:
+            raise ValueError("The time threshold needs the column of the time")
+        self.prune_energy_threshold = energy_threshold
+        self.prune_time_threshold = time_threshold
+        self.prune_energy_index = energy_index
+        self.prune_time_index = time_index
+        self.prune_in_place = in_place
+        self._pruning_counts = None
+        return self
+
+    def set_sharding(self, num_shards=1, shard_index=0):
+        """
+        Reads only a part of the files, so that workers which train on different data can share a files list, see
+        readers.pipeline.shard_file_paths
+
+        :param num_shards: Number of workers
+        :param shard_index: Index of this worker
+        :return: self
+        """
+        self.num_shards = num_shards
+        self.shard_index = shard_index
+        return self
+
+    def set_geometry(self, name=None, directory=None):
+        """
+        Sets the geometry of the events, for the readers which restore the cells without hits from the cell columns
+        of the geometry registry, see readers.geometry_registry.save_cell_columns
+
+        :param name: Name of the geometry, e.g. beta_calo
+        :param directory: Directory of the geometry registry, None for readers/geometry_tables
+        :return: self
+        """
+        self.geometry = name
+        self.geometry_directory = directory
+        return self
+
+    def _prune_hits(self, data, num_entries, seed_indices=None):
+        """
+        Applies the hit pruning of set_hit_pruning, if any, to a batch of data [B, V, num_data_dims]. Returns data,
+        num_entries and seed_indices.
+        """
+        keep = None
+        if self.prune_energy_threshold is not None:
+            keep = data[:, :, self.prune_energy_index] >= self.prune_energy_threshold
+        if self.prune_time_threshold is not None:
+            keep_time = data[:, :, self.prune_time_index] >= self.prune_time_threshold
+            keep = keep_time if keep is None else tf.logical_and(keep, keep_time)
+        if keep is None:
+            return data, num_entries, seed_indices
+
+        data, num_entries, seed_indices, self._pruning_counts = prune_hits(data, num_entries, keep, seed_indices,
+                                                                           self.prune_in_place)
+        return data, num_entries, seed_indices
+
+    def get_pruning_counts(self):
+        """
+        Returns the number of hits before and after the hit pruning (int64 tensor [2]) of the batch of the feeds
+        which were made last, or None without hit pruning
+        """
+        return self._pruning_counts
+
+    def _data_feature(self, shape):
+        if self.storage_dtype == tf.float16:
+            return tf.FixedLenFeature([], tf.string)
+        return tf.FixedLenFeature(shape, tf.float32)
+
+    def _decode_data(self, data, shape):
+        if self.storage_dtype == tf.float16:
+            raw = tf.decode_raw(data, tf.float16)
+            # Works for single records as well as for batches of records
+            data = tf.reshape(raw, tf.concat((tf.shape(raw)[0:-1], shape), axis=0))
+            data.set_shape(raw.shape[0:-1].concatenate(shape))
+        return data
+
+    def _format_data(self, data):
+        """
+        Splits batched data into the column groups, if set, and upcasts to float32
+
+        :param data: Data of shape [batch, entries, num_data_dims]
+        :return: Tuple of data feeds
+        """
+        if self.column_groups is None:
+            return tf.cast(data, tf.float32),
+        return tuple([tf.cast(tf.gather(data, list(columns), axis=2), tf.float32) for columns in self.column_groups])
+
+    def _get_features(self):
+        return {
+            'data': self._data_feature((self.num_max_entries, self.num_data_dims)),
+            'num_entries': tf.FixedLenFeature(1, tf.int64)
+        }
+
+    def _decode(self, parsed_features):
+        return self._decode_data(parsed_features['data'], (self.num_max_entries, self.num_data_dims)),\
+               parsed_features['num_entries']
+
+    def _parse_function(self, example_proto):
+        return self._decode(tf.parse_single_example(example_proto, self._get_features()))
+
+    def _parse_batch_function(self, examples_proto):
+        return self._decode(tf.parse_example(examples_proto, self._get_features()))
+
+    def _batch(self, dataset):
+        return dataset.batch(self.num_batch)
+
+    def _get_num_entries(self, *element):
+        return element[1][0]
+
+    def _batch_bucket(self, window, length):
+        return window.map(lambda data, num_entries: (data[0:length], num_entries)).batch(self.num_batch)
+
+    def _batch_by_buckets(self, dataset):
+        bucket_lengths = tf.constant(self.bucket_lengths, tf.int64)
+
+        def key_function(*element):
+            # Index of the first bucket which is long enough
+            return tf.reduce_sum(tf.cast(bucket_lengths < self._get_num_entries(*element), tf.int64))
+
+        def reduce_function(key, window):
+            return self._batch_bucket(window, tf.gather(bucket_lengths, key))
+
+        return dataset.apply(tf.contrib.data.group_by_window(key_function, reduce_function,
+                                                             window_size=self.num_batch))
+
+    def _get_batched_dataset(self, shuffle, shuffle_factor=3):
+        if self.batch_parse and self.bucket_lengths is not None:
+            raise ValueError("Batch parsing can't be combined with bucketing")
+        if self.bucket_lengths is not None and (self.prune_energy_threshold is not None or
+                                                self.prune_time_threshold is not None):
+            raise ValueError("Hit pruning works on batches of num_max_entries, it can't be combined with bucketing. "
+                             "Use the hit packing of the models instead.")
+        dataset = make_records_dataset(shard_file_paths(read_file_paths(self.files_list), self.num_shards,
+                                                        self.shard_index),
+                                       None if self.batch_parse else self._parse_function, shuffle=shuffle,
+                                       num_parallel_reads=self.num_parallel_reads,
+                                       num_parallel_calls=self.num_parallel_calls)
         if shuffle:
-            dataset = dataset.shuffle(buffer_size=self.num_batch * 3 if self.shuffle_size is None else self.shuffle_size)
+            dataset = dataset.shuffle(buffer_size=self.num_batch * shuffle_factor if self.shuffle_size is None else self.shuffle_size)
         dataset = dataset.repeat(None if self.repeat else 1)
-        dataset = dataset.batch(self.num_batch)
-        iterator = dataset.make_one_shot_iterator()
-        inputs = iterator.get_next()
+        if self.bucket_lengths is not None:
+            dataset = self._batch_by_buckets(dataset)
+        elif self.batch_parse:
+            dataset = dataset.batch(self.num_batch)
+            dataset = dataset.map(self._parse_batch_function, num_parallel_calls=self.num_parallel_calls)
+        else:
+            dataset = self._batch(dataset)
+        return dataset
+
+    def _prefetch(self, dataset, default_size=None):
+        return prefetch(dataset, default_size if self.prefetch_size is None else self.prefetch_size)
+
+    def get_dataset(self, shuffle=True):
+        """
+        Returns the batched dataset. Its elements are converted to feeds by _to_feeds.
+
+        :param shuffle: Whether to shuffle the events
+        :return:
+        """
+        return self._prefetch(self._get_batched_dataset(shuffle))
+
+    def _to_feeds(self, batch):
+        data, num_entries = batch
+        data, num_entries, _ = self._prune_hits(data, num_entries)
+        return self._format_data(data) + (num_entries,)
+
+    def get_feeds_from_iterator(self, iterator):
+        """
+        Returns the feeds from an iterator over get_dataset(), e.g. a feedable iterator which switches between
+        datasets of several readers of the same type
+
+        :param iterator: The iterator
+        :return:
+        """
+        return self._to_feeds(iterator.get_next())
+
+    def get_feeds(self, shuffle=True):
+        iterator = self.get_dataset(shuffle).make_one_shot_iterator()
 
-        return inputs
+        return self.get_feeds_from_iterator(iterator)
@@ -4,16 +4,20 @@ from readers.DataAndNumEntriesReader import DataAndNumEntriesReader
 import numpy as np
 
 class DenseToConvReader(DataAndNumEntriesReader):
+    # Every event has num_max_entries rows in the fixed sensor order
+    supports_bucketing = False
+
     def __init__(self, files_list, num_max_entries, num_data_dims, num_batch, repeat=True, shuffle_size=None):
         super(DenseToConvReader, self).__init__(files_list, num_max_entries, num_data_dims, num_batch, repeat, shuffle_size)
         self.construct_indexing_array()
 
-    def _parse_function(self, example_proto):
-        keys_to_features = {
-            'data': tf.FixedLenFeature((self.num_max_entries + 1, self.num_data_dims), tf.float32),
+    def _get_features(self):
+        return {
+            'data': self._data_feature((self.num_max_entries + 1, self.num_data_dims)),
         }
-        parsed_features = tf.parse_single_example(example_proto, keys_to_features)
-        return parsed_features['data']
+
+    def _decode(self, parsed_features):
+        return self._decode_data(parsed_features['data'], (self.num_max_entries + 1, self.num_data_dims))
 
     def construct_indexing_array(self):
         self.indices_x = np.zeros(shape=(2679,1))
@@ -27,29 +31,17 @@ class DenseToConvReader(DataAndNumEntriesReader):
         indexing_array = np.concatenate(b, np.tile(m, reps=[self.num_batch, 1, 1]), axis=2)
         self.indexing_array = indexing_array
 
-    def get_feeds(self):
+    def _to_feeds(self, data):
+        data = data[:, 0:-1, :]
+        num_entries = tf.ones(shape=(self.num_batch, 1) ,dtype=tf.int64) * self.num_max_entries
+
+        return self._format_data(data) + (num_entries,)
+
+    def get_feeds(self, shuffle=True):
         """
         Returns the feeds (data, num_entries)
 
-        :param files_list:
-        :param num_batch:
-        :param num_max_entries:
-        :param num_data_dims:
-        :param repeat:
-        :param shuffle_size:
+        :param shuffle: Whether to shuffle the events
         :return:
         """
-        with open(self.files_list) as f:
-            content = f.readlines()
-        file_paths = [x.strip() for x in content]
-        dataset = tf.data.TFRecordDataset(file_paths, compression_type='GZIP')
-        dataset = dataset.map(self._parse_function)
-        dataset = dataset.shuffle(buffer_size=self.num_batch * 3 if self.shuffle_size is None else self.shuffle_size)
-        dataset = dataset.repeat(None if self.repeat else 1)
-        dataset = dataset.batch(self.num_batch)
-        iterator = dataset.make_one_shot_iterator()
-        data = iterator.get_next()
-        data = data[:, 0:-1, :]
-        num_entries = tf.ones(shape=(self.num_batch, 1) ,dtype=tf.int64) * self.num_max_entries
-
-        return data, num_entries
+        return super(DenseToConvReader, self).get_feeds(shuffle)
@@ -5,47 +5,63 @@ import warnings
 
 
 class FixNumEntriesReader(DataAndNumEntriesReader):
+    # Every event has num_max_entries rows in the fixed sensor order
+    supports_bucketing = False
+    sensor_order = True
+
     def __init__(self, files_list, num_max_entries, num_data_dims, num_batch, repeat=True, shuffle_size=None):
         super(FixNumEntriesReader, self).__init__(files_list, num_max_entries, num_data_dims, num_batch, repeat, shuffle_size)
         self.return_seeds=False
 
-    def _parse_function(self, example_proto):
-        keys_to_features = {
-            'data': tf.FixedLenFeature((self.num_max_entries + 1, self.num_data_dims), tf.float32),
+    def _get_features(self):
+        features = {
+            'data': self._data_feature((self.num_max_entries + 1, self.num_data_dims)),
         }
-        parsed_features = tf.parse_single_example(example_proto, keys_to_features)
-        return parsed_features['data']
+        if self.storage_dtype == tf.float16:
+            # Seed indices above 2048 are not exact in half precision, so they are stored separately
+            features['seed_indices'] = tf.FixedLenFeature(2, tf.int64, default_value=[0, 0])
+        return features
+
+    def _decode(self, parsed_features):
+        data = self._decode_data(parsed_features['data'], (self.num_max_entries + 1, self.num_data_dims))
+        if self.storage_dtype == tf.float16:
+            return data, parsed_features['seed_indices']
+        return data
+
+    def _split_seeds(self, batch):
+        if self.storage_dtype == tf.float16:
+            data, seed_indices = batch
+        else:
+            data = batch
+            seed_indices = tf.cast(data[:, -1, 0:2], tf.int64)
+        return data[:, 0:-1, :], seed_indices
+
+    def _to_feeds(self, batch):
+        num_entries = tf.ones(shape=(self.num_batch, 1) ,dtype=tf.int64) * self.num_max_entries
+
+        if self.return_seeds:
+            if self.column_groups is not None or self.storage_dtype != tf.float32:
+                raise ValueError("Returning the seeds row is only supported for full float32 data")
+            data, seed_indices = self._split_seeds(batch)
+            data, num_entries, seed_indices = self._prune_hits(data, num_entries, seed_indices)
+            # The seeds row stays the last one, with the seed indices of the pruned data
+            seeds_row = tf.concat((tf.cast(seed_indices, batch.dtype)[:, tf.newaxis, :], batch[:, -1:, 2:]), axis=2)
+            return tf.concat((data, seeds_row), axis=1), num_entries
+        else:
+            data, seed_indices = self._split_seeds(batch)
+            data, num_entries, _ = self._prune_hits(data, num_entries, seed_indices)
+            return self._format_data(data) + (num_entries,)
 
     def get_feeds(self, shuffle=True):
         """
         Returns the feeds (data, num_entries)
 
-        :param files_list:
-        :param num_batch:
-        :param num_max_entries:
-        :param num_data_dims:
-        :param repeat:
-        :param shuffle_size:
+        :param shuffle: Whether to shuffle the events
         :return:
         """
-        with open(self.files_list) as f:
-            content = f.readlines()
-        file_paths = [x.strip() for x in content]
-        dataset = tf.data.TFRecordDataset(file_paths, compression_type='GZIP')
-        dataset = dataset.map(self._parse_function)
-        if shuffle:
-            dataset = dataset.shuffle(buffer_size=self.num_batch * 3 if self.shuffle_size is None else self.shuffle_size)
-        dataset = dataset.repeat(None if self.repeat else 1)
-        dataset = dataset.batch(self.num_batch)
-        iterator = dataset.make_one_shot_iterator()
-        data = iterator.get_next()
-        num_entries = tf.ones(shape=(self.num_batch, 1) ,dtype=tf.int64) * self.num_max_entries
-        
-        if self.return_seeds:
-            return data, num_entries
-        else:
-            return data[:, 0:-1, :], num_entries
-        
+        return super(FixNumEntriesReader, self).get_feeds(shuffle)
+
+
 class FixNumEntriesReaderSeeds(FixNumEntriesReader):
     def __init__(self, files_list, num_max_entries, num_data_dims, num_batch, repeat=True, shuffle_size=None,
                  return_seeds=True):
@@ -59,32 +75,22 @@ class FixNumEntriesReaderSeedsSeparate(FixNumEntriesReader):
         super(FixNumEntriesReaderSeedsSeparate, self).__init__(files_list, num_max_entries, num_data_dims, num_batch, repeat,
                                                        shuffle_size)
 
+    def get_dataset(self, shuffle=True):
+        return self._prefetch(self._get_batched_dataset(shuffle, shuffle_factor=50), default_size=100)
+
+    def _to_feeds(self, batch):
+        num_entries = tf.ones(shape=(self.num_batch, 1), dtype=tf.int64) * self.num_max_entries
+
+        data, seed_indices = self._split_seeds(batch)
+        data, num_entries, seed_indices = self._prune_hits(data, num_entries, seed_indices)
+
+        return self._format_data(data) + (num_entries, seed_indices)
+
     def get_feeds(self, shuffle=True):
         """
-        Returns the feeds (data, num_entries)
+        Returns the feeds (data, num_entries, seed_indices)
 
-        :param files_list:
-        :param num_batch:
-        :param num_max_entries:
-        :param num_data_dims:
-        :param repeat:
-        :param shuffle_size:
+        :param shuffle: Whether to shuffle the events
         :return:
         """
-        with open(self.files_list) as f:
-            content = f.readlines()
-        file_paths = [x.strip() for x in content]
-        dataset = tf.data.TFRecordDataset(file_paths, compression_type='GZIP')
-        dataset = dataset.map(self._parse_function)
-        if shuffle:
-            dataset = dataset.shuffle(buffer_size=self.num_batch * 50 if self.shuffle_size is None else self.shuffle_size)
-        dataset = dataset.repeat(None if self.repeat else 1)
-        dataset = dataset.batch(self.num_batch)
-        dataset = dataset.prefetch(buffer_size=100)
-        iterator = dataset.make_one_shot_iterator()
-        data = iterator.get_next()
-        num_entries = tf.ones(shape=(self.num_batch, 1), dtype=tf.int64) * self.num_max_entries
-
-        seed_indices = tf.cast(data[:, -1, 0:2], tf.int64)
-
-        return data[:, 0:-1, :], num_entries, seed_indices
+        return super(FixNumEntriesReaderSeedsSeparate, self).get_feeds(shuffle)
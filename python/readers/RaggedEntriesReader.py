@@ -0,0 +1,153 @@
+from readers.DataAndNumEntriesReader import DataAndNumEntriesReader
+from readers.geometry_registry import cell_columns_template
+import tensorflow as tf
+
+
+class RaggedEntriesReader(DataAndNumEntriesReader):
+    """
+    Reads the ragged format written by bin/conversion/convert_to_ragged_records.py. Only the num_entries active
+    rows of every event are stored on disk. They are padded to num_max_entries when batching, so the returned
+    feeds look like the ones of DataAndNumEntriesReader: (data, num_entries).
+    """
+    def __init__(self, files_list, num_max_entries, num_data_dims, num_batch, repeat=True, shuffle_size=None):
+        super(RaggedEntriesReader, self).__init__(files_list, num_max_entries, num_data_dims, num_batch, repeat,
+                                                  shuffle_size)
+
+    def _get_features(self):
+        return {
+            'data': tf.FixedLenFeature([], tf.string) if self.storage_dtype == tf.float16 else tf.VarLenFeature(
+                tf.float32),
+            'num_entries': tf.FixedLenFeature(1, tf.int64),
+            'cell_indices': tf.VarLenFeature(tf.int64),
+            'seed_indices': tf.FixedLenFeature(2, tf.int64, default_value=[0, 0]),
+        }
+
+    def _parse_function(self, example_proto):
+        parsed_features = tf.parse_single_example(example_proto, self._get_features())
+
+        if self.storage_dtype == tf.float16:
+            data = tf.reshape(tf.decode_raw(parsed_features['data'], tf.float16), [-1, self.num_data_dims])
+        else:
+            data = tf.reshape(tf.sparse_tensor_to_dense(parsed_features['data']), [-1, self.num_data_dims])
+        cell_indices = tf.sparse_tensor_to_dense(parsed_features['cell_indices'])
+
+        return data, parsed_features['num_entries'], cell_indices, parsed_features['seed_indices']
+
+    def _pad_to_max_entries(self, x, padding_value):
+        paddings = [[0, 0], [0, self.num_max_entries - tf.shape(x)[1]]] + [[0, 0]] * (len(x.shape) - 2)
+        return tf.pad(x, paddings, constant_values=padding_value)
+
+    def _parse_batch_function(self, examples_proto):
+        if self.storage_dtype == tf.float16:
+            raise ValueError("Batch parsing of ragged records is only supported for float32 storage")
+        parsed_features = tf.parse_example(examples_proto, self._get_features())
+        data_padding, _, cell_indices_padding, _ = self._padding_values()
+
+        # The sparse values of every event are densified up to the longest event in the batch and then padded
+        # to num_max_entries, same as padded_batch does
+        data = tf.sparse_tensor_to_dense(parsed_features['data'], default_value=data_padding)
+        data = tf.reshape(data, [tf.shape(data)[0], -1, self.num_data_dims])
+        data = self._pad_to_max_entries(data, data_padding)
+        data.set_shape([None, self.num_max_entries, self.num_data_dims])
+
+        cell_indices = tf.sparse_tensor_to_dense(parsed_features['cell_indices'], default_value=cell_indices_padding)
+        cell_indices = self._pad_to_max_entries(cell_indices, cell_indices_padding)
+        cell_indices.set_shape([None, self.num_max_entries])
+
+        return data, parsed_features['num_entries'], cell_indices, parsed_features['seed_indices']
+
+    def _padded_shapes(self):
+        return [self.num_max_entries, self.num_data_dims], [1], [self.num_max_entries], [2]
+
+    def _padding_values(self):
+        # Padded cell indices point to an extra dump row which is dropped after scattering
+        return tf.constant(0, self.storage_dtype), tf.constant(0, tf.int64), tf.constant(self.num_max_entries, tf.int64),\
+               tf.constant(0, tf.int64)
+
+    def _batch(self, dataset):
+        return dataset.padded_batch(self.num_batch, padded_shapes=self._padded_shapes(),
+                                    padding_values=self._padding_values())
+
+    def _batch_bucket(self, window, length):
+        padded_shapes = tf.stack((length, self.num_data_dims)), [1], tf.reshape(length, [1]), [2]
+        return window.padded_batch(self.num_batch, padded_shapes=padded_shapes, padding_values=self._padding_values())
+
+    def get_dataset(self, shuffle=True):
+        return self._prefetch(self._get_batched_dataset(shuffle))
+
+    def _to_feeds(self, batch):
+        data, num_entries, _, _ = batch
+        data, num_entries, _ = self._prune_hits(data, num_entries)
+        return self._format_data(data) + (num_entries,)
+
+    def get_feeds(self, shuffle=True):
+        """
+        Returns the feeds (data, num_entries)
+
+        :param shuffle: Whether to shuffle the events
+        :return:
+        """
+        return super(RaggedEntriesReader, self).get_feeds(shuffle)
+
+
+class RaggedEntriesReaderSeedsSeparate(RaggedEntriesReader):
+    """
+    Ragged counterpart of FixNumEntriesReaderSeedsSeparate. The active rows are scattered back to their cell
+    positions after batching, so the models which depend on the fixed sensor ordering (binning etc.) see the
+    same (data, num_entries, seed_indices) feeds as with the dense format. The cells without hits aren't stored, so
+    their rows are restored from the cell columns (layer, position etc.) of the geometry set with set_geometry.
+    """
+    supports_bucketing = False
+    sensor_order = True
+
+    def __init__(self, files_list, num_max_entries, num_data_dims, num_batch, repeat=True, shuffle_size=None):
+        super(RaggedEntriesReaderSeedsSeparate, self).__init__(files_list, num_max_entries, num_data_dims, num_batch,
+                                                               repeat, shuffle_size)
+
+    def _get_cells_template(self):
+        """
+        Returns the rows [num_max_entries, num_data_dims] of the cells without hits
+        """
+        if self.geometry is None:
+            raise ValueError("%s needs the geometry of the events to restore the cells without hits, see set_geometry"
+                             % type(self).__name__)
+        template = cell_columns_template(self.geometry, self.num_data_dims, self.geometry_directory)
+        if len(template) != self.num_max_entries:
+            raise ValueError("Geometry %s has %d cells but the reader reads %d entries" % (
+                self.geometry, len(template), self.num_max_entries))
+        return template
+
+    def _scatter_to_cells(self, data, cell_indices):
+        n_batch = tf.shape(data)[0]
+        batch_range = tf.tile(tf.range(n_batch, dtype=tf.int64)[:, tf.newaxis], [1, self.num_max_entries])
+        indices = tf.stack((batch_range, cell_indices), axis=-1)
+        shape = tf.cast(tf.stack((n_batch, self.num_max_entries + 1)), tf.int64)
+        cells = tf.scatter_nd(indices, data, shape=tf.concat((shape, [self.num_data_dims]), axis=0))[:, 0:-1, :]
+
+        # Every cell index is stored once per event, so the cells which got no row are the ones without hits
+        stored = tf.scatter_nd(indices, tf.ones_like(cell_indices, dtype=data.dtype), shape=shape)[:, 0:-1]
+        template = tf.constant(self._get_cells_template(), dtype=data.dtype)
+        return cells + (1 - stored)[:, :, tf.newaxis] * template[tf.newaxis, :, :]
+
+    def get_dataset(self, shuffle=True):
+        return self._prefetch(self._get_batched_dataset(shuffle, shuffle_factor=50), default_size=100)
+
+    def _to_feeds(self, batch):
+        data, _, cell_indices, seed_indices = batch
+        num_entries = tf.ones(shape=(self.num_batch, 1), dtype=tf.int64) * self.num_max_entries
+
+        # All the columns are scattered to the cells before the column split, since the restored cell columns are
+        # indexed in the full data. The seed indices are cell indices, so the hits are pruned after scattering too.
+        cells = self._scatter_to_cells(data, cell_indices)
+        cells.set_shape([None, self.num_max_entries, self.num_data_dims])
+        data, num_entries, seed_indices = self._prune_hits(cells, num_entries, seed_indices)
+        return self._format_data(data) + (num_entries, seed_indices)
+
+    def get_feeds(self, shuffle=True):
+        """
+        Returns the feeds (data, num_entries, seed_indices)
+
+        :param shuffle: Whether to shuffle the events
+        :return:
+        """
+        return super(RaggedEntriesReaderSeedsSeparate, self).get_feeds(shuffle)
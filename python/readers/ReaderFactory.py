@@ -1,5 +1,6 @@
 from readers.DataAndNumEntriesReader import DataAndNumEntriesReader
 from readers.FixedNumEntriesReader import FixNumEntriesReader,FixNumEntriesReaderSeeds, FixNumEntriesReaderSeedsSeparate
+from readers.RaggedEntriesReader import RaggedEntriesReader, RaggedEntriesReaderSeedsSeparate
 
 
 class ReaderFactory:
@@ -11,4 +12,8 @@ class ReaderFactory:
         elif reader_name == "data_and_num_entries_reader":
             return DataAndNumEntriesReader
         if reader_name == "fixed_num_entries_reader_seeds_separate":
-            return FixNumEntriesReaderSeedsSeparate
\ No newline at end of file
+            return FixNumEntriesReaderSeedsSeparate
+        if reader_name == "ragged_entries_reader":
+            return RaggedEntriesReader
+        if reader_name == "ragged_entries_reader_seeds_separate":
+            return RaggedEntriesReaderSeedsSeparate
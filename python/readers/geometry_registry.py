@@ -0,0 +1,321 @@
+import os
+import numpy as np
+
+
+# The binnings of the calorimeter geometries are stored in this directory as <name>.npz, see save_binning. Every file
+# holds a table [N, 4] with (x bin, y bin, layer, index in bin) of every cell in the sensor order of the input data
+# and the shape (x bins, y bins, layers, entries per bin) of the binned tensor.
+geometry_tables_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'geometry_tables')
+
+# Binnings which have been loaded already, by (directory, name)
+_loaded_binnings = dict()
+
+# The columns of the input data which only depend on the cell (position, layer, sensor size etc.) are stored as
+# <name>.cells.npz next to the binnings, see save_cell_columns. They're loaded once per process, by (directory, name).
+_loaded_cell_columns = dict()
+
+# The k nearest neighbours of every cell are stored as <name>.neighbors_k<k>.npz, see save_neighbor_table. They're
+# loaded once per process, by (directory, name, k).
+_loaded_neighbor_tables = dict()
+
+
+def list_binnings(directory=None):
+    """
+    Returns the names of the binnings which are available
+
+    :param directory: Directory of the binnings, None for geometry_tables_directory
+    :return: Sorted list of names
+    """
+    directory = geometry_tables_directory if directory is None else directory
+    if not os.path.isdir(directory):
+        return []
+    # The other tables of a geometry have a second extension, e.g. beta_calo.cells.npz
+    return sorted([file_name[0:-4] for file_name in os.listdir(directory) if file_name.endswith('.npz') and
+                   '.' not in file_name[0:-4]])
+
+
+def get_binning_path(name, directory=None):
+    """
+    Returns the path of the file of a binning
+
+    :param name: Name of the binning, e.g. small_calo or beta_calo_16
+    :param directory: Directory of the binnings, None for geometry_tables_directory
+    :return:
+    """
+    return os.path.join(geometry_tables_directory if directory is None else directory, '%s.npz' % name)
+
+
+def load_binning(name, directory=None):
+    """
+    Loads a binning. Binnings are only read from disk when they are first used and only once per process.
+
+    :param name: Name of the binning, see list_binnings
+    :param directory: Directory of the binnings, None for geometry_tables_directory
+    :return: Tuple of the table [N, 4] (int32 x bin, y bin, layer and index in bin of every cell) and the shape
+             of the binned tensor (x bins, y bins, layers, entries per bin)
+    """
+    directory = geometry_tables_directory if directory is None else directory
+    if (directory, name) in _loaded_binnings:
+        return _loaded_binnings[(directory, name)]
+
+    path = get_binning_path(name, directory)
+    if not os.path.exists(path):
+        raise IOError("No binning %s in %s, available are %s. Generate it with "
+                      "bin/scripts/generate_geometry_binning.py" % (name, directory, str(list_binnings(directory))))
+
+    with np.load(path) as data:
+        binning = data['table'].astype(np.int32), tuple([int(x) for x in data['shape']])
+    _loaded_binnings[(directory, name)] = binning
+    return binning
+
+
+def binning_indexing_array(name, batch_size, directory=None):
+    """
+    Returns the indices of every cell into the binned tensor [batch_size, x bins, y bins, layers, entries per bin, F]
+    for tf.scatter_nd and tf.gather_nd
+
+    :param name: Name of the binning
+    :param batch_size: Batch size
+    :param directory: Directory of the binnings, None for geometry_tables_directory
+    :return: Numpy array [batch_size, N, 5] of int64
+    """
+    table, _ = load_binning(name, directory)
+    num_cells = len(table)
+
+    batch_indices = np.tile(np.arange(batch_size)[:, np.newaxis, np.newaxis], reps=(1, num_cells, 1))
+    indexing_array = np.tile(table[np.newaxis, ...], reps=[batch_size, 1, 1])
+    return np.concatenate((batch_indices, indexing_array), axis=2).astype(np.int64)
+
+
+def compute_binning(cell_x, cell_y, cell_layer, shape, half_x, half_y, center_x=0., center_y=0.):
+    """
+    Bins the cells of a geometry. The x and y range [center - half, center + half] is divided into shape[0] and
+    shape[1] bins, the layer is the bin in z and the cells in every (x, y, layer) bin are numbered in sensor order.
+
+    :param cell_x: Numpy array [N] of the x positions of the cells in the sensor order of the input data
+    :param cell_y: Numpy array [N] of the y positions
+    :param cell_layer: Numpy array [N] of the layers
+    :param shape: Shape of the binned tensor (x bins, y bins, layers, entries per bin)
+    :param half_x: Half of the width of the binned range in x
+    :param half_y: Half of the width of the binned range in y
+    :param center_x: Center of the binned range in x
+    :param center_y: Center of the binned range in y
+    :return: Numpy array [N, 4] of int32, see load_binning
+    """
+    n_x, n_y, n_layers, n_per_bin = shape
+
+    x_bins = np.floor((np.asarray(cell_x) - (center_x - half_x)) / (2. * half_x / n_x)).astype(np.int32)
+    y_bins = np.floor((np.asarray(cell_y) - (center_y - half_y)) / (2. * half_y / n_y)).astype(np.int32)
+    l_bins = np.floor(np.asarray(cell_layer)).astype(np.int32)
+
+    outside = (x_bins < 0) | (x_bins >= n_x) | (y_bins < 0) | (y_bins >= n_y) | (l_bins < 0) | (l_bins >= n_layers)
+    if np.any(outside):
+        raise ValueError("%d cells are outside of the binned range" % np.sum(outside))
+
+    # Running number of every cell within its bin, in sensor order
+    bins = (x_bins * n_y + y_bins) * n_layers + l_bins
+    order = np.argsort(bins, kind='mergesort')
+    sorted_bins = bins[order]
+    bin_starts = np.searchsorted(sorted_bins, sorted_bins, side='left')
+    d_indices = np.zeros(len(bins), dtype=np.int32)
+    d_indices[order] = np.arange(len(bins)) - bin_starts
+
+    if np.max(d_indices) >= n_per_bin:
+        raise ValueError("Up to %d cells per bin but only %d entries per bin" % (np.max(d_indices) + 1, n_per_bin))
+
+    return np.stack((x_bins, y_bins, l_bins, d_indices), axis=1).astype(np.int32)
+
+
+def synthetic_geometry(n_x, n_y, n_layers, cell_size):
+    """
+    Makes a geometry of n_x * n_y square cells per layer centered at 0, e.g. for testing new binnings without
+    simulation. The cells are ordered by layer, x and y.
+
+    :param n_x: Number of cells in x
+    :param n_y: Number of cells in y
+    :param n_layers: Number of layers
+    :param cell_size: Width of the cells
+    :return: Numpy arrays [N] of the x positions, y positions and layers of the cells
+    """
+    layers, x, y = np.meshgrid(np.arange(n_layers), np.arange(n_x), np.arange(n_y), indexing='ij')
+    cell_x = (x.flatten() - (n_x - 1) / 2.) * cell_size
+    cell_y = (y.flatten() - (n_y - 1) / 2.) * cell_size
+    return cell_x, cell_y, layers.flatten().astype(np.float64)
+
+
+def save_binning(name, table, shape, directory=None):
+    """
+    Stores a binning computed by compute_binning
+
+    :param name: Name of the binning
+    :param table: Numpy array [N, 4]
+    :param shape: Shape of the binned tensor (x bins, y bins, layers, entries per bin)
+    :param directory: Directory of the binnings, None for geometry_tables_directory
+    :return: Path of the stored binning
+    """
+    path = get_binning_path(name, directory)
+    if not os.path.exists(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+    np.savez_compressed(path, table=np.asarray(table).astype(np.int16), shape=np.array(shape, dtype=np.int32))
+    _loaded_binnings.pop((os.path.dirname(path), name), None)
+    return path
+
+
+def get_cell_columns_path(name, directory=None):
+    """
+    Returns the path of the file of the cell columns of a geometry
+
+    :param name: Name of the geometry, e.g. beta_calo
+    :param directory: Directory of the geometries, None for geometry_tables_directory
+    :return:
+    """
+    return os.path.join(geometry_tables_directory if directory is None else directory, '%s.cells.npz' % name)
+
+
+def save_cell_columns(name, columns, values, directory=None):
+    """
+    Stores the values of the columns of the input data which only depend on the cell, e.g. its position, layer and
+    sensor size, so that readers of formats which only store the active hits can restore the other cells
+
+    :param name: Name of the geometry
+    :param columns: Indices of the columns in the input data
+    :param values: Numpy array [N, len(columns)] of the values of every cell in the sensor order of the input data
+    :param directory: Directory of the geometries, None for geometry_tables_directory
+    :return: Path of the stored file
+    """
+    values = np.asarray(values, dtype=np.float32)
+    assert values.ndim == 2 and values.shape[1] == len(columns)
+    path = get_cell_columns_path(name, directory)
+    if not os.path.exists(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+    np.savez_compressed(path, columns=np.array(columns, dtype=np.int32), values=values)
+    _loaded_cell_columns.pop((os.path.dirname(path), name), None)
+    return path
+
+
+def load_cell_columns(name, directory=None):
+    """
+    Loads the cell columns of a geometry, see save_cell_columns. They're only read from disk once per process.
+
+    :param name: Name of the geometry
+    :param directory: Directory of the geometries, None for geometry_tables_directory
+    :return: Tuple of the column indices and the numpy array [N, len(columns)] of float32 values
+    """
+    directory = geometry_tables_directory if directory is None else directory
+    if (directory, name) in _loaded_cell_columns:
+        return _loaded_cell_columns[(directory, name)]
+
+    path = get_cell_columns_path(name, directory)
+    if not os.path.exists(path):
+        raise IOError("No cell columns of %s in %s. They're written when converting records of the fixed sensor "
+                      "order with bin/conversion/convert_to_ragged_records.py --geometry %s" % (name, directory, name))
+
+    with np.load(path) as data:
+        cell_columns = tuple([int(x) for x in data['columns']]), data['values'].astype(np.float32)
+    _loaded_cell_columns[(directory, name)] = cell_columns
+    return cell_columns
+
+
+def cell_columns_template(name, num_data_dims, directory=None):
+    """
+    Returns rows of the input data of all the cells of a geometry with the cell columns filled and zero in all the
+    other columns, i.e. what the rows of the cells without hits look like
+
+    :param name: Name of the geometry
+    :param num_data_dims: Number of columns of the input data
+    :param directory: Directory of the geometries, None for geometry_tables_directory
+    :return: Numpy array [N, num_data_dims] of float32
+    """
+    columns, values = load_cell_columns(name, directory)
+    template = np.zeros((len(values), num_data_dims), dtype=np.float32)
+    template[:, list(columns)] = values
+    return template
+
+
+def compute_neighbor_table(cell_positions, k, block_size=256):
+    """
+    Computes the k nearest neighbours of every cell of a geometry, including the cell itself. The neighbours of every
+    cell are sorted by distance, so the table for a smaller k is the first columns of this one.
+
+    :param cell_positions: Numpy array [N, S] of the cell positions in the sensor order of the input data
+    :param k: Number of neighbours
+    :param block_size: Number of cells whose distances are computed at a time
+    :return: Numpy array [N, k] of int32 cell indices
+    """
+    cell_positions = np.asarray(cell_positions, dtype=np.float64)
+    num_cells = len(cell_positions)
+    assert k <= num_cells
+
+    table = np.zeros((num_cells, k), dtype=np.int32)
+    for start in range(0, num_cells, block_size):
+        queries = cell_positions[start:start + block_size]
+        distances = np.sum((queries[:, np.newaxis, :] - cell_positions[np.newaxis, :, :]) ** 2, axis=2)
+        table[start:start + block_size] = np.argsort(distances, axis=1, kind='mergesort')[:, 0:k]
+
+    return table
+
+
+def get_neighbor_table_path(name, k, directory=None):
+    """
+    Returns the path of the neighbour table of a geometry for k neighbours
+
+    :param name: Name of the geometry, e.g. beta_calo
+    :param k: Number of neighbours
+    :param directory: Directory of the geometries, None for geometry_tables_directory
+    :return:
+    """
+    return os.path.join(geometry_tables_directory if directory is None else directory,
+                        '%s.neighbors_k%d.npz' % (name, k))
+
+
+def save_neighbor_table(name, table, columns, directory=None):
+    """
+    Stores a table computed by compute_neighbor_table
+
+    :param name: Name of the geometry
+    :param table: Numpy array [N, k]
+    :param columns: Indices of the columns of the input data which the distances were computed in
+    :param directory: Directory of the geometries, None for geometry_tables_directory
+    :return: Path of the stored table
+    """
+    path = get_neighbor_table_path(name, table.shape[1], directory)
+    if not os.path.exists(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+    np.savez_compressed(path, table=table.astype(np.int32), columns=np.array(columns, dtype=np.int32))
+    for key in [key for key in _loaded_neighbor_tables if key[0:2] == (os.path.dirname(path), name)]:
+        del _loaded_neighbor_tables[key]
+    return path
+
+
+def load_neighbor_table(name, k, directory=None):
+    """
+    Loads the neighbour table of a geometry, see bin/scripts/generate_neighbor_tables.py. If there's no table for k
+    but one for more neighbours, its first k columns are returned. Tables are loaded only once per process.
+
+    :param name: Name of the geometry
+    :param k: Number of neighbours
+    :param directory: Directory of the geometries, None for geometry_tables_directory
+    :return: Tuple of the numpy array [N, k] of int32 cell indices and the column indices of the distances
+    """
+    directory = geometry_tables_directory if directory is None else directory
+    if (directory, name, k) in _loaded_neighbor_tables:
+        return _loaded_neighbor_tables[(directory, name, k)]
+
+    path = get_neighbor_table_path(name, k, directory)
+    if not os.path.exists(path):
+        prefix = '%s.neighbors_k' % name
+        larger = []
+        if os.path.isdir(directory):
+            for file_name in os.listdir(directory):
+                if file_name.startswith(prefix) and file_name.endswith('.npz') and file_name[len(prefix):-4].isdigit():
+                    if int(file_name[len(prefix):-4]) > k:
+                        larger.append(int(file_name[len(prefix):-4]))
+        if len(larger) == 0:
+            raise IOError("No neighbour table of %s with k=%d in %s, generate it with "
+                          "bin/scripts/generate_neighbor_tables.py" % (name, k, directory))
+        path = get_neighbor_table_path(name, min(larger), directory)
+
+    with np.load(path) as data:
+        neighbor_table = data['table'][:, 0:k].astype(np.int32), tuple([int(x) for x in data['columns']])
+    _loaded_neighbor_tables[(directory, name, k)] = neighbor_table
+    return neighbor_table
@@ -0,0 +1,136 @@
+import tensorflow as tf
+from ops.packing import hit_packing, pack_hits, pack_indices
+
+
+def read_file_paths(files_list):
+    """
+    Reads the text file which lists the full paths of the tfrecords files on separate lines
+
+    :param files_list: Path to the text file
+    :return: List of paths
+    """
+    with open(files_list) as f:
+        content = f.readlines()
+    return [x.strip() for x in content if len(x.strip()) != 0]
+
+
+def shard_file_paths(file_paths, num_shards, shard_index):
+    """
+    Splits the files between workers which read different parts of the data, e.g. for data parallel training
+
+    :param file_paths: List of paths
+    :param num_shards: Number of workers
+    :param shard_index: Index of the worker
+    :return: List of the paths of the worker, every num_shards-th path starting from shard_index
+    """
+    shard = file_paths[shard_index::num_shards]
+    if len(shard) == 0:
+        raise ValueError("%d files can't be split between %d workers" % (len(file_paths), num_shards))
+    return shard
+
+
+def _read_int_option(config, key):
+    # None for missing and empty keys
+    try:
+        value = config[key].strip()
+    except KeyError:
+        return None
+    return int(value) if len(value) != 0 else None
+
+
+def get_pipeline_options(config):
+    """
+    Reads the optional input pipeline keys from a config section. Missing or empty keys keep the old serial
+    behaviour.
+
+    num_parallel_reads: Number of files which are decompressed in parallel (interleaved)
+    num_parallel_calls: Number of threads which parse records
+    prefetch_size: Number of batches to prefetch (0 to disable, empty for reader default)
+    batch_parse: 1 to batch the serialized records first and parse every batch with one tf.parse_example call
+
+    :param config: Config section (dict like)
+    :return: dict which can be passed to DataAndNumEntriesReader.set_pipeline_options or make_records_dataset
+    """
+    options = dict()
+    num_parallel_reads = _read_int_option(config, 'num_parallel_reads')
+    options['num_parallel_reads'] = 1 if num_parallel_reads is None else num_parallel_reads
+    options['num_parallel_calls'] = _read_int_option(config, 'num_parallel_calls')
+    options['prefetch_size'] = _read_int_option(config, 'prefetch_size')
+    options['batch_parse'] = _read_int_option(config, 'batch_parse') == 1
+
+    return options
+
+
+def make_records_dataset(file_paths, parse_function, shuffle=True, num_parallel_reads=1, num_parallel_calls=None):
+    """
+    Makes a dataset of parsed records from gzip tfrecords files. With num_parallel_reads > 1, the files are
+    interleaved so that decompression happens on multiple threads. The order of files is shuffled as well
+    if shuffle is true.
+
+    :param file_paths: List of paths of tfrecords files
+    :param parse_function: Function to map over serialized records. If None, the serialized records are returned.
+    :param shuffle: Whether the events are going to be shuffled (allows non-deterministic interleaving)
+    :param num_parallel_reads: Number of files to read in parallel
+    :param num_parallel_calls: Number of parallel calls of parse_function
+    :return: The dataset
+    """
+    if num_parallel_reads is not None and num_parallel_reads > 1:
+        dataset = tf.data.Dataset.from_tensor_slices(file_paths)
+        if shuffle:
+            dataset = dataset.shuffle(buffer_size=len(file_paths))
+        dataset = dataset.apply(tf.contrib.data.parallel_interleave(
+            lambda file_path: tf.data.TFRecordDataset(file_path, compression_type='GZIP'),
+            cycle_length=num_parallel_reads, sloppy=shuffle))
+    else:
+        dataset = tf.data.TFRecordDataset(file_paths, compression_type='GZIP')
+
+    if parse_function is None:
+        return dataset
+    return dataset.map(parse_function, num_parallel_calls=num_parallel_calls)
+
+
+def prefetch(dataset, prefetch_size):
+    """
+    Adds prefetching at the end of the pipeline
+
+    :param dataset: The dataset
+    :param prefetch_size: Number of batches to prefetch. None or 0 disables prefetching.
+    :return: The dataset
+    """
+    if prefetch_size is None or prefetch_size == 0:
+        return dataset
+    return dataset.prefetch(buffer_size=prefetch_size)
+
+
+def prune_hits(data, num_entries, keep, seed_indices=None, in_place=False):
+    """
+    Drops hits from a batch, e.g. the ones below a noise threshold. The kept hits are moved to the front of every
+    event, in their order, and num_entries becomes the number of kept hits. The seed hits are always kept and the
+    seed indices are remapped to their new rows. With in_place, the dropped hits are set to zero instead, so the hits
+    keep their rows (for the fixed sensor order of the binning models) and num_entries and the seed indices don't
+    change.
+
+    :param data: Data [B, V, D]
+    :param num_entries: Number of entries [B, 1]
+    :param keep: Boolean tensor [B, V] of the hits to keep
+    :param seed_indices: Seed indices [B, 2] or None
+    :param in_place: Zero the dropped hits instead of removing them
+    :return: Tuple of data, num_entries, seed_indices (None if not given) and the number of hits before and after
+             pruning (int64 tensor [2]) summed over the batch
+    """
+    n_vertices = int(data.shape[1])
+    entries = tf.sequence_mask(num_entries[:, 0], maxlen=n_vertices)
+    keep = tf.logical_and(entries, keep)
+    if seed_indices is not None:
+        keep = tf.logical_or(keep, tf.reduce_sum(tf.one_hot(seed_indices, n_vertices, dtype=tf.int32), axis=1) > 0)
+    counts = tf.stack((tf.reduce_sum(tf.cast(entries, tf.int64)), tf.reduce_sum(tf.cast(keep, tf.int64))))
+
+    if in_place:
+        return data * tf.cast(keep, data.dtype)[:, :, tf.newaxis], num_entries, seed_indices, counts
+
+    hit_rows, positions, num_kept = hit_packing(keep, n_vertices)
+    data = pack_hits(data, hit_rows)
+    num_entries = tf.cast(num_kept[:, tf.newaxis], num_entries.dtype)
+    if seed_indices is not None:
+        seed_indices = pack_indices(seed_indices, positions)
+    return data, num_entries, seed_indices, counts
@@ -0,0 +1,73 @@
+import ops.allreduce as allreduce
+from readers.pipeline import shard_file_paths
+import tensorflow as tf
+import unittest
+import numpy as np
+
+
+class AllreduceTest(unittest.TestCase):
+    """
+    Two workers on two CPU devices of one session. Every worker builds its ops with the same instance keys, like the
+    worker processes which build the same graph.
+    """
+    def setUp(self):
+        tf.reset_default_graph()
+        np.random.seed(3)
+        self.n_workers = 2
+        self.session_config = tf.ConfigProto(device_count={'CPU': self.n_workers})
+
+    def _build_workers(self, build_function):
+        outputs = []
+        for i in range(self.n_workers):
+            allreduce._collective_instance_key = 0
+            with tf.device('/cpu:%d' % i):
+                outputs.append(build_function(i))
+        return outputs
+
+    def test_optimizer_averages_gradients(self):
+        inputs = np.random.normal(size=(self.n_workers, 5, 3)).astype(np.float32)
+
+        def build_function(i):
+            weights = tf.get_variable('weights_%d' % i, initializer=tf.ones([3]))
+            optimizer = allreduce.AllreduceOptimizer(tf.train.GradientDescentOptimizer(1.), self.n_workers)
+            grads_and_vars = optimizer.compute_gradients(tf.reduce_sum(tf.constant(inputs[i]) * weights),
+                                                         var_list=[weights])
+            return grads_and_vars[0][0]
+
+        gradients = self._build_workers(build_function)
+        with tf.Session(config=self.session_config) as sess:
+            sess.run(tf.global_variables_initializer())
+            gradients = sess.run(gradients)
+
+        expected = np.mean(np.sum(inputs, axis=1), axis=0)
+        for gradient in gradients:
+            assert np.allclose(gradient, expected, atol=1e-5)
+
+    def test_broadcast_variables(self):
+        values = np.random.normal(size=(self.n_workers, 4, 2)).astype(np.float32)
+
+        def build_function(i):
+            variable = tf.get_variable('variable_%d' % i, initializer=tf.constant(values[i]))
+            return variable, allreduce.broadcast_variables([variable], self.n_workers, i == 0)
+
+        variables, sync_ops = zip(*self._build_workers(build_function))
+        with tf.Session(config=self.session_config) as sess:
+            sess.run(tf.global_variables_initializer())
+            sess.run(sync_ops)
+            variables = sess.run(variables)
+
+        for variable in variables:
+            assert np.array_equal(variable, values[0])
+
+    def test_shard_file_paths(self):
+        file_paths = ['file_%d' % i for i in range(7)]
+        shards = [shard_file_paths(file_paths, 3, i) for i in range(3)]
+
+        assert sorted(sum(shards, [])) == sorted(file_paths)
+        assert [len(x) for x in shards] == [3, 2, 2]
+        with self.assertRaises(ValueError):
+            shard_file_paths(file_paths[0:2], 3, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+from ops.binning import *
+from readers.geometry_registry import load_binning, binning_indexing_array
+import unittest
+import numpy as np
+
+
+class BinningTest(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(7)
+        self.n_batch = 3
+
+    def _compare(self, name):
+        table, shape = load_binning(name)
+        indexing_array = binning_indexing_array(name, self.n_batch)
+        vertices = tf.constant(np.random.normal(size=(self.n_batch, len(table), 2)).astype(np.float32))
+
+        binned = bin_vertices(vertices, name)
+        binned_nd = tf.reshape(tf.scatter_nd(indexing_array, vertices, shape=(self.n_batch,) + shape + (2,)),
+                               [self.n_batch, shape[0], shape[1], shape[2], shape[3] * 2])
+
+        unbinned = unbin_vertices(binned * 2., name)
+        unbinned_nd = tf.gather_nd(tf.reshape(binned_nd * 2., (self.n_batch,) + shape + (2,)), indexing_array)
+
+        with tf.Session() as sess:
+            result = sess.run([binned, binned_nd, unbinned, unbinned_nd, vertices])
+
+        assert result[0].shape == result[1].shape
+        assert np.array_equal(result[0], result[1])
+        assert np.array_equal(result[2], result[3])
+        assert np.array_equal(result[2], result[4] * 2.)
+
+    def test_beta_calo_16(self):
+        self._compare('beta_calo_16')
+
+    def test_small_calo(self):
+        self._compare('small_calo')
+
+    def test_active_voxels(self):
+        name = 'small_calo'
+        table, shape = load_binning(name)
+        vertices = tf.constant(np.random.normal(size=(self.n_batch, len(table), 2)).astype(np.float32))
+
+        binned = bin_vertices(vertices, name)
+        voxels = bin_vertices(vertices, name, active_voxels_only=True)
+        unbinned = unbin_vertices(voxels, name, active_voxels_only=True)
+
+        with tf.Session() as sess:
+            result = sess.run([binned, voxels, unbinned, vertices])
+
+        active = active_voxels(name)
+        assert np.array_equal(result[0][:, active[:, 0], active[:, 1], active[:, 2]], result[1])
+        assert np.array_equal(result[2], result[3])
+
+    def test_submanifold_conv3d(self):
+        name = 'small_calo'
+        table, shape = load_binning(name)
+        active = active_voxels(name)
+        vertices = tf.constant(np.random.normal(size=(self.n_batch, len(table), 2)).astype(np.float32))
+
+        for kernel_size in [[1, 1, 1], [3, 3, 1], [1, 1, 5], [2, 2, 1]]:
+            voxels = bin_vertices(vertices, name, active_voxels_only=True)
+            with tf.variable_scope(None, default_name='test'):
+                sparse = submanifold_conv3d(voxels, name, 5, kernel_size, layer_name='conv')
+                tf.get_variable_scope().reuse_variables()
+                kernel = tf.get_variable('conv/kernel')
+                bias = tf.get_variable('conv/bias')
+            dense = tf.nn.conv3d(bin_vertices(vertices, name), kernel, [1, 1, 1, 1, 1], 'SAME') + bias
+
+            with tf.Session() as sess:
+                sess.run(tf.global_variables_initializer())
+                result = sess.run([sparse, dense])
+
+            dense_at_active = result[1][:, active[:, 0], active[:, 1], active[:, 2]]
+            assert np.allclose(result[0], dense_at_active, atol=1e-5), kernel_size
+
+
+if __name__ == '__main__':
+    unittest.main()
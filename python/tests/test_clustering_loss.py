@@ -0,0 +1,55 @@
+from models.clustering_loss import *
+import unittest
+import numpy as np
+
+
+class ClusteringLossTest(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(3)
+        self.n_batch = 5
+        self.n_vertices = 40
+
+    def _make_event(self, num_showers):
+        targets = np.random.dirichlet(np.ones(num_showers), size=(self.n_batch, self.n_vertices))
+        prediction = np.random.dirichlet(np.ones(num_showers), size=(self.n_batch, self.n_vertices))
+        energy = np.random.exponential(size=(self.n_batch, self.n_vertices))
+        return prediction.astype(np.float32), targets.astype(np.float32), energy.astype(np.float32)
+
+    def test_same_as_numpy(self):
+        prediction, targets, energy = self._make_event(3)
+        losses = permutation_losses(tf.constant(prediction), tf.constant(targets), tf.constant(energy),
+                                    target_weights=tf.constant(targets), per_shower_normalisation=True)
+        losses_min, sorted_targets = permutation_invariant_loss(tf.constant(prediction), tf.constant(targets),
+                                                                tf.constant(energy))
+
+        with tf.Session() as sess:
+            result = sess.run([losses, losses_min, sorted_targets])
+
+        losses_numpy = permutation_losses_numpy(prediction, targets, energy, targets, per_shower_normalisation=True)
+        assert np.allclose(result[0], losses_numpy, rtol=1e-4)
+
+        losses_numpy = permutation_losses_numpy(prediction, targets, energy)
+        best = shower_permutations(3)[np.argmin(losses_numpy, axis=1)]
+        assert np.allclose(result[1], np.min(losses_numpy, axis=1), rtol=1e-4)
+        for i in range(self.n_batch):
+            assert np.array_equal(result[2][i], targets[i][:, best[i]])
+
+    def test_two_showers_swap(self):
+        # With two showers whose fractions add up to one, the swapped assignment is 1 - targets
+        prediction, targets, energy = self._make_event(2)
+        num_entries = np.array([self.n_vertices, 30, 12, self.n_vertices, 1], dtype=np.int32)
+        losses = masked_permutation_losses(tf.constant(prediction), tf.constant(targets), tf.constant(energy),
+                                           tf.constant(num_entries))
+
+        with tf.Session() as sess:
+            result = sess.run(losses)
+
+        mask = (np.arange(self.n_vertices)[np.newaxis, :] < num_entries[:, np.newaxis])[:, :, np.newaxis]
+        for i, swapped_targets in enumerate([targets, 1 - targets]):
+            loss = np.sum((prediction - swapped_targets) ** 2 * mask * energy[:, :, np.newaxis], axis=(1, 2))
+            loss = loss / np.sum(energy, axis=1) / num_entries
+            assert np.allclose(result[:, i], loss, rtol=1e-4)
+
+
+if __name__ == '__main__':
+    unittest.main()
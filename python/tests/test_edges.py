@@ -0,0 +1,125 @@
+from ops.sparse_conv_2 import *
+import unittest
+import numpy as np
+
+
+class EdgesTest(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(5)
+        self.n_batch = 3
+        self.n_seeds = 4
+        self.n_vertices = 230
+        self.block_size = 64
+        self.vertex_positions = np.random.uniform(-1, 1, size=(self.n_batch, self.n_vertices, 3)).astype(np.float32)
+        # Lots of zeros, so there are ties in the maximum
+        self.vertices = np.maximum(np.random.normal(size=(self.n_batch, self.n_vertices, 5)), 0).astype(np.float32)
+
+    def _compare(self, aggregation_function):
+        vertex_positions = tf.constant(self.vertex_positions)
+        vertices = tf.constant(self.vertices)
+        edges = create_edges(vertex_positions, vertex_positions[:, 0:self.n_seeds])
+
+        dense = apply_edges(vertices, edges, aggregation_function=aggregation_function, block_size=None)
+        blocked = apply_edges(vertices, edges, aggregation_function=aggregation_function,
+                              block_size=self.block_size)
+
+        loss_weights = tf.constant(np.random.normal(size=dense.shape.as_list()).astype(np.float32))
+        gradients_dense = tf.gradients(tf.reduce_sum(dense * loss_weights), [vertex_positions, vertices])
+        gradients_blocked = tf.gradients(tf.reduce_sum(blocked * loss_weights), [vertex_positions, vertices])
+
+        with tf.Session() as sess:
+            result = sess.run([dense, blocked] + gradients_dense + gradients_blocked)
+
+        assert result[0].shape == result[1].shape
+        assert np.allclose(result[0], result[1], atol=1e-5)
+        assert np.allclose(result[2], result[4], atol=1e-5)
+        assert np.allclose(result[3], result[5], atol=1e-5)
+
+    def test_blocked_max(self):
+        self._compare(tf.reduce_max)
+
+    def test_blocked_sum(self):
+        self._compare(tf.reduce_sum)
+
+    def test_blocked_mean(self):
+        self._compare(tf.reduce_mean)
+
+    def test_multi_same_as_separate(self):
+        vertex_positions = tf.constant(self.vertex_positions)
+        vertices = tf.constant(self.vertices)
+        edges = create_edges(vertex_positions, vertex_positions[:, 0:self.n_seeds])
+        aggregation_functions = [tf.reduce_max, tf.reduce_mean, tf.reduce_sum]
+
+        separate = [apply_edges(vertices, edges, aggregation_function=x, block_size=None)
+                    for x in aggregation_functions]
+        loss = tf.add_n([tf.reduce_sum(x * (i + 1.)) for i, x in enumerate(separate)])
+        outputs = separate + tf.gradients(loss, [vertex_positions, vertices])
+        for block_size in [None, self.block_size]:
+            fused = apply_edges_multi(vertices, edges, aggregation_functions, block_size=block_size)
+            loss = tf.add_n([tf.reduce_sum(x * (i + 1.)) for i, x in enumerate(fused)])
+            outputs += fused + tf.gradients(loss, [vertex_positions, vertices])
+
+        with tf.Session() as sess:
+            result = sess.run(outputs)
+
+        for i in range(5):
+            assert np.allclose(result[i], result[i + 5], atol=1e-5)
+            assert np.allclose(result[i], result[i + 10], atol=1e-5)
+
+    def _compare_seed_edges(self, edge_function, parameters=()):
+        vertex_positions = tf.constant(self.vertex_positions)
+        vertices = tf.constant(self.vertices)
+        seed_positions = tf.constant(self.vertex_positions[:, 0:self.n_seeds] * 0.5)
+        inputs = [vertex_positions, vertices, seed_positions] + list(parameters)
+
+        outputs = []
+        for block_size in [None, self.block_size]:
+            edges = SeedEdges(edge_function, vertex_positions, [seed_positions] + list(parameters), block_size)
+            collapsed = edges.collapse(vertices, [tf.reduce_max, tf.reduce_mean])
+            expanded = edges.expand(tf.concat(collapsed, axis=-1))
+            loss_weights = tf.constant(np.random.RandomState(2).normal(size=expanded.shape.as_list()).astype(
+                np.float32))
+            outputs += collapsed + [expanded] + tf.gradients(tf.reduce_sum(expanded * loss_weights), inputs)
+
+        with tf.Session() as sess:
+            sess.run(tf.global_variables_initializer())
+            result = sess.run(outputs)
+
+        n_outputs = len(outputs) // 2
+        for i in range(n_outputs):
+            assert result[i].shape == result[i + n_outputs].shape
+            assert np.allclose(result[i], result[i + n_outputs], atol=1e-4)
+
+    def test_blocked_edges(self):
+        self._compare_seed_edges(lambda positions, seeds: create_edges(positions, seeds))
+
+    def test_blocked_active_edges(self):
+        vertex_positions = tf.constant(self.vertex_positions)
+        seed_positions = tf.constant(self.vertex_positions[:, 0:self.n_seeds])
+        parameters = create_active_edges_parameters(vertex_positions, seed_positions, 'test_blocked_active_edges')
+        self._compare_seed_edges(lambda positions, seeds, rec_field_scaler, frequency_scaler:
+                                 apply_active_edges(positions, seeds, rec_field_scaler, frequency_scaler), parameters)
+
+    def test_multipl_dense_blocked(self):
+        x = tf.constant(self.vertices[:, 0:40].reshape((self.n_batch, 10, 4, 5)))
+        weights = tf.constant(np.random.normal(scale=0.5, size=(10, 5)).astype(np.float32))
+
+        dense = tf.reduce_prod(tf.expand_dims(x, axis=-2) * weights + 1., axis=-1)
+        # 10 filters in blocks of 3, so the last block is padded
+        blocked = multipl_dense_blocked(x, weights, 3)
+
+        loss_weights = tf.constant(np.random.normal(size=dense.shape.as_list()).astype(np.float32))
+        gradients_dense = tf.gradients(tf.reduce_sum(dense * loss_weights), [x, weights])
+        gradients_blocked = tf.gradients(tf.reduce_sum(blocked * loss_weights), [x, weights])
+
+        with tf.Session() as sess:
+            result = sess.run([dense, blocked] + gradients_dense + gradients_blocked)
+
+        assert result[0].shape == result[1].shape
+        assert np.allclose(result[0], result[1], atol=1e-5)
+        assert np.allclose(result[2], result[4], atol=1e-4)
+        assert np.allclose(result[3], result[5], atol=1e-4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+from readers.geometry_registry import *
+import unittest
+import tempfile
+import shutil
+import numpy as np
+
+
+class GeometryRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_stored_binnings(self):
+        for name in ['small_calo', 'small_calo_homog', 'beta_calo', 'beta_calo_16', 'beta_calo_20']:
+            table, shape = load_binning(name)
+            assert table.shape[1] == 4
+            assert np.all(table >= 0) and np.all(table < np.array(shape))
+            # Every bin entry is used by one cell only
+            assert len(np.unique(table, axis=0)) == len(table)
+
+    def test_synthetic_round_trip(self):
+        cell_x, cell_y, cell_layer = synthetic_geometry(6, 6, 4, 10.)
+        table = compute_binning(cell_x, cell_y, cell_layer, (3, 3, 4, 4), 30., 30.)
+        save_binning('synthetic', table, (3, 3, 4, 4), self.directory)
+
+        loaded, shape = load_binning('synthetic', self.directory)
+        assert shape == (3, 3, 4, 4)
+        assert np.array_equal(loaded, table)
+        assert len(np.unique(table, axis=0)) == len(table)
+        assert list_binnings(self.directory) == ['synthetic']
+
+        indexing_array = binning_indexing_array('synthetic', 2, self.directory)
+        assert indexing_array.shape == (2, len(table), 5)
+        assert np.array_equal(indexing_array[1, :, 1:], table)
+
+    def test_cell_columns_round_trip(self):
+        cell_x, cell_y, cell_layer = synthetic_geometry(6, 6, 4, 10.)
+        values = np.stack((cell_layer, cell_x, cell_y), axis=-1)
+        save_binning('synthetic', np.zeros((len(values), 4), dtype=np.int16), (1, 1, 1, 1), self.directory)
+        save_cell_columns('synthetic', [1, 2, 3], values, self.directory)
+
+        columns, loaded = load_cell_columns('synthetic', self.directory)
+        assert columns == (1, 2, 3)
+        assert np.allclose(loaded, values)
+        assert list_binnings(self.directory) == ['synthetic']
+
+        template = cell_columns_template('synthetic', 5, self.directory)
+        assert template.shape == (len(values), 5)
+        assert np.allclose(template[:, 1:4], values)
+        assert np.all(template[:, 0] == 0) and np.all(template[:, 4] == 0)
+
+        with self.assertRaises(IOError):
+            load_cell_columns('missing', self.directory)
+
+    def test_neighbor_table_round_trip(self):
+        cell_x, cell_y, cell_layer = synthetic_geometry(6, 6, 4, 10.)
+        cell_positions = np.stack((cell_x, cell_y, cell_layer * 10.), axis=-1)
+        table = compute_neighbor_table(cell_positions, 8)
+        assert np.array_equal(table[:, 0], np.arange(len(table)))
+        save_neighbor_table('synthetic', table, [2, 3, 4], self.directory)
+
+        loaded, columns = load_neighbor_table('synthetic', 8, self.directory)
+        assert columns == (2, 3, 4)
+        assert np.array_equal(loaded, table)
+        # Smaller k are the first columns of the larger table
+        loaded, _ = load_neighbor_table('synthetic', 5, self.directory)
+        assert np.array_equal(loaded, compute_neighbor_table(cell_positions, 5))
+        assert list_binnings(self.directory) == []
+
+        with self.assertRaises(IOError):
+            load_neighbor_table('synthetic', 10, self.directory)
+
+    def test_too_few_entries_per_bin(self):
+        cell_x, cell_y, cell_layer = synthetic_geometry(6, 6, 4, 10.)
+        with self.assertRaises(ValueError):
+            compute_binning(cell_x, cell_y, cell_layer, (3, 3, 4, 3), 30., 30.)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+from readers.pipeline import prune_hits
+import tensorflow as tf
+import unittest
+import numpy as np
+
+
+class HitPruningTest(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(11)
+        self.n_batch = 4
+        self.n_vertices = 25
+        self.threshold = 0.5
+
+    def _make_batch(self):
+        data = np.random.exponential(size=(self.n_batch, self.n_vertices, 3)).astype(np.float32)
+        num_entries = np.random.randint(5, self.n_vertices + 1, size=(self.n_batch, 1)).astype(np.int64)
+        seed_indices = np.zeros((self.n_batch, 2), dtype=np.int64)
+        for i in range(self.n_batch):
+            seed_indices[i] = np.random.choice(num_entries[i, 0], size=2, replace=False)
+        return data, num_entries, seed_indices
+
+    def _prune(self, in_place):
+        data, num_entries, seed_indices = self._make_batch()
+        keep = tf.constant(data[:, :, 0] >= self.threshold)
+        result = prune_hits(tf.constant(data), tf.constant(num_entries), keep, tf.constant(seed_indices), in_place)
+        with tf.Session() as sess:
+            return (data, num_entries, seed_indices), sess.run(result)
+
+    def test_prune(self):
+        (data, num_entries, seed_indices), (pruned, pruned_num_entries, pruned_seeds, counts) = self._prune(False)
+
+        assert counts[0] == np.sum(num_entries)
+        assert counts[1] == np.sum(pruned_num_entries)
+        for i in range(self.n_batch):
+            kept = np.arange(self.n_vertices) < num_entries[i, 0]
+            kept[kept] = data[i, kept, 0] >= self.threshold
+            kept[seed_indices[i]] = True
+
+            assert pruned_num_entries[i, 0] == np.sum(kept)
+            assert np.array_equal(pruned[i, 0:np.sum(kept)], data[i, kept])
+            assert np.all(pruned[i, np.sum(kept):] == 0)
+            assert np.array_equal(pruned[i, pruned_seeds[i]], data[i, seed_indices[i]])
+
+    def test_prune_in_place(self):
+        (data, num_entries, seed_indices), (pruned, pruned_num_entries, pruned_seeds, _) = self._prune(True)
+
+        assert np.array_equal(pruned_num_entries, num_entries)
+        assert np.array_equal(pruned_seeds, seed_indices)
+        for i in range(self.n_batch):
+            kept = np.arange(self.n_vertices) < num_entries[i, 0]
+            kept[kept] = data[i, kept, 0] >= self.threshold
+            kept[seed_indices[i]] = True
+            assert np.array_equal(pruned[i], data[i] * kept[:, np.newaxis])
+
+
+if __name__ == '__main__':
+    unittest.main()
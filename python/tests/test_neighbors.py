@@ -0,0 +1,196 @@
+from ops.neighbors import *
+from ops.neighbors import _build_n_range_tensor
+import unittest
+import numpy as np
+
+
+class NeighborsTest(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(3)
+        self.n_batch = 4
+        self.n_vertices = 300
+        self.k = 12
+        self.spatial_features = np.random.uniform(-1, 1, size=(self.n_batch, self.n_vertices, 3)).astype(np.float32)
+
+    def test_blocked_same_as_full(self):
+        spatial_features = tf.constant(self.spatial_features)
+        neighbors_full, distances_full = nearest_neighbor_matrix_2(spatial_features, self.k)
+        neighbors_blocked, distances_blocked = nearest_neighbor_matrix_blocked(spatial_features, self.k, block_size=64)
+
+        with tf.Session() as sess:
+            result = sess.run([neighbors_full, distances_full, neighbors_blocked, distances_blocked])
+
+        assert np.array_equal(np.sort(result[0], axis=2), np.sort(result[2], axis=2))
+        assert np.allclose(result[1], result[3], atol=1e-5)
+
+    def test_indexing_tensor_2_blocked(self):
+        spatial_features = tf.constant(self.spatial_features)
+        # Otherwise the blocked search reuses the full one
+        set_knn_memoization(False)
+        try:
+            indexing_full, _ = indexing_tensor_2(spatial_features, self.k, block_size=None)
+            indexing_blocked, _ = indexing_tensor_2(spatial_features, self.k, block_size=100)
+        finally:
+            set_knn_memoization(True)
+
+        with tf.Session() as sess:
+            result_full, result_blocked = sess.run([indexing_full, indexing_blocked])
+
+        assert result_full.shape == result_blocked.shape
+        assert np.array_equal(np.sort(result_full[..., 1], axis=2), np.sort(result_blocked[..., 1], axis=2))
+
+    def test_blocked_gradient(self):
+        spatial_features = tf.constant(self.spatial_features)
+        _, distances_full = nearest_neighbor_matrix_2(spatial_features, self.k)
+        _, distances_blocked = nearest_neighbor_matrix_blocked(spatial_features, self.k, block_size=64)
+
+        gradient_full = tf.gradients(tf.reduce_sum(distances_full), spatial_features)[0]
+        gradient_blocked = tf.gradients(tf.reduce_sum(distances_blocked), spatial_features)[0]
+
+        with tf.Session() as sess:
+            result_full, result_blocked = sess.run([gradient_full, gradient_blocked])
+
+        assert np.allclose(result_full, result_blocked, atol=1e-3)
+
+    def test_grid_same_as_full(self):
+        spatial_features = tf.constant(self.spatial_features)
+        neighbors_full, distances_full = nearest_neighbor_matrix_2(spatial_features, self.k)
+        neighbors_grid, distances_grid = nearest_neighbor_matrix_grid(spatial_features, self.k, cell_capacity=32)
+
+        with tf.Session() as sess:
+            result = sess.run([neighbors_full, distances_full, neighbors_grid, distances_grid])
+
+        assert np.array_equal(np.sort(result[0], axis=2), np.sort(result[2], axis=2))
+        assert np.allclose(np.sort(result[1], axis=2), np.sort(result[3], axis=2), atol=1e-5)
+
+    def test_grid_fallback(self):
+        # Half of the vertices in a tight cluster, so its cells are cut to the capacity
+        clustered = np.copy(self.spatial_features)
+        clustered[:, 0:150, :] *= 0.01
+        spatial_features = tf.constant(clustered)
+        neighbors_full, _ = nearest_neighbor_matrix_2(spatial_features, self.k)
+        neighbors_grid, _ = nearest_neighbor_matrix_grid(spatial_features, self.k, cell_capacity=16,
+                                                         n_cells_per_dim=8)
+
+        with tf.Session() as sess:
+            result_full, result_grid = sess.run([neighbors_full, neighbors_grid])
+
+        assert np.array_equal(np.sort(result_full, axis=2), np.sort(result_grid, axis=2))
+
+    def test_indexing_tensor_grid(self):
+        spatial_features = tf.constant(self.spatial_features)
+        indexing_full = indexing_tensor(spatial_features, self.k, cell_capacity=None)
+        indexing_grid = indexing_tensor(spatial_features, self.k, cell_capacity=32)
+
+        with tf.Session() as sess:
+            result_full, result_grid = sess.run([indexing_full, indexing_grid])
+
+        assert result_full.shape == result_grid.shape and result_grid.dtype == np.int64
+        assert np.array_equal(result_full[..., 0], result_grid[..., 0])
+        assert np.array_equal(np.sort(result_full[..., 1], axis=2), np.sort(result_grid[..., 1], axis=2))
+
+    def test_static_table_same_as_computed(self):
+        from readers.geometry_registry import compute_neighbor_table
+        cell_positions = self.spatial_features[0]
+        spatial_features = tf.constant(np.tile(cell_positions[np.newaxis, ...], [self.n_batch, 1, 1]))
+        indexing_computed = indexing_tensor(spatial_features, self.k, cell_capacity=None)
+        indexing_static = indexing_tensor(spatial_features, self.k,
+                                          neighbor_table=compute_neighbor_table(cell_positions, self.k + 4))
+
+        with tf.Session() as sess:
+            result_computed, result_static = sess.run([indexing_computed, indexing_static])
+
+        assert result_computed.shape == result_static.shape
+        assert np.array_equal(result_computed[..., 0], result_static[..., 0])
+        assert np.array_equal(np.sort(result_computed[..., 1], axis=2), np.sort(result_static[..., 1], axis=2))
+
+    def test_approximate_full_window_is_exact(self):
+        spatial_features = tf.constant(np.random.uniform(-1, 1, size=(self.n_batch, self.n_vertices, 16)).astype(np.float32))
+        neighbors_full, _ = nearest_neighbor_matrix_2(spatial_features, self.k)
+        neighbors_approximate, _ = nearest_neighbor_matrix_approximate(spatial_features, self.k, n_projections=2,
+                                                                       window=self.n_vertices)
+        recall = neighbor_recall(neighbors_approximate, neighbors_full)
+
+        with tf.Session() as sess:
+            result_full, result_approximate, result_recall = sess.run([neighbors_full, neighbors_approximate, recall])
+
+        assert np.array_equal(np.sort(result_full, axis=2), np.sort(result_approximate, axis=2))
+        assert result_recall == 1.
+
+    def test_approximate_recall(self):
+        spatial_features = tf.constant(np.random.uniform(-1, 1, size=(self.n_batch, self.n_vertices, 4)).astype(np.float32))
+        neighbors_full, _ = nearest_neighbor_matrix_2(spatial_features, self.k)
+        neighbors_approximate, _ = nearest_neighbor_matrix_approximate(spatial_features, self.k, n_projections=8,
+                                                                       window=100)
+        recall = neighbor_recall(neighbors_approximate, neighbors_full)
+
+        with tf.Session() as sess:
+            result_approximate, result_recall = sess.run([neighbors_approximate, recall])
+
+        # Every vertex finds itself and no neighbour twice
+        assert np.all(result_approximate[:, :, 0] == np.arange(self.n_vertices)[np.newaxis, :])
+        assert np.all(np.diff(np.sort(result_approximate, axis=2), axis=2) != 0)
+        assert result_recall > 0.5
+
+    def test_batch_gather_same_as_gather_nd(self):
+        spatial_features = tf.constant(self.spatial_features)
+        features = tf.constant(np.random.uniform(size=(self.n_batch, self.n_vertices, 5)).astype(np.float32))
+        gathered_nd = tf.gather_nd(features, indexing_tensor(spatial_features, self.k, cell_capacity=None))
+        gathered = batch_gather(features, indexing_tensor(spatial_features, self.k, cell_capacity=None, compact=True))
+
+        gradient_nd = tf.gradients(tf.reduce_sum(gathered_nd ** 2), features)[0]
+        gradient = tf.gradients(tf.reduce_sum(gathered ** 2), features)[0]
+
+        with tf.Session() as sess:
+            result = sess.run([gathered_nd, gathered, tf.convert_to_tensor(gradient_nd), tf.convert_to_tensor(gradient)])
+
+        assert result[0].shape == result[1].shape
+        assert np.array_equal(result[0], result[1])
+        assert np.allclose(result[2], result[3])
+
+    def test_memoized_search(self):
+        spatial_features = tf.constant(self.spatial_features)
+        indexing_large, distances_large = indexing_tensor_2(spatial_features, self.k, compact=True)
+        indexing_small, distances_small = indexing_tensor_2(spatial_features, self.k - 4, compact=True)
+        indexing_same, _ = indexing_tensor_2(spatial_features, self.k, compact=True)
+        indexing_small_2 = indexing_tensor(spatial_features, self.k - 4, cell_capacity=None, compact=True)
+
+        assert indexing_same is indexing_large
+        assert indexing_small.op.type == 'StridedSlice'
+        assert indexing_small_2.op.type == 'StridedSlice'
+
+        # Other spatial features and other searches aren't reused
+        assert indexing_tensor_2(spatial_features * 1., self.k, compact=True)[0] is not indexing_large
+        assert indexing_tensor_2(spatial_features, self.k, cell_capacity=16, compact=True)[0] is not indexing_large
+
+        set_knn_memoization(False)
+        try:
+            indexing_direct, distances_direct = indexing_tensor_2(spatial_features, self.k - 4, compact=True)
+        finally:
+            set_knn_memoization(True)
+
+        with tf.Session() as sess:
+            result = sess.run([indexing_small, distances_small, indexing_small_2, indexing_direct, distances_direct])
+
+        assert np.array_equal(result[0], result[3])
+        assert np.array_equal(result[2], result[3])
+        assert np.allclose(result[1], result[4])
+
+    def test_n_range_tensor_cached(self):
+        with tf.name_scope('first'):
+            first = n_range_tensor([self.n_batch, self.n_vertices, self.k])
+        with tf.name_scope('second'):
+            second = n_range_tensor([self.n_batch, self.n_vertices, self.k])
+        built = _build_n_range_tensor([self.n_batch, self.n_vertices, self.k])
+
+        assert first is second
+        assert first is not n_range_tensor([self.n_batch, self.n_vertices, self.k + 1])
+
+        with tf.Session() as sess:
+            result = sess.run([first, built])
+
+        assert np.array_equal(result[0], result[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
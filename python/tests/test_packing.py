@@ -0,0 +1,75 @@
+from ops.packing import *
+import unittest
+import numpy as np
+
+
+class PackingTest(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(5)
+        self.n_batch = 4
+        self.n_vertices = 30
+
+    def _make_batch(self):
+        energy = np.random.exponential(size=(self.n_batch, self.n_vertices)).astype(np.float32)
+        energy[np.random.uniform(size=energy.shape) < 0.6] = 0
+        num_entries = np.random.randint(0, self.n_vertices + 1, size=(self.n_batch, 1)).astype(np.int64)
+        features = np.random.normal(size=(self.n_batch, self.n_vertices, 3)).astype(np.float32)
+        return energy, num_entries, features
+
+    def _pack(self, length):
+        energy, num_entries, features = self._make_batch()
+        mask = active_hits_mask(tf.constant(num_entries), self.n_vertices, tf.constant(energy))
+        hit_rows, positions, num_packed = hit_packing(mask, length)
+        packed = pack_hits(tf.constant(features), hit_rows)
+        unpacked = unpack_hits(packed, positions)
+
+        with tf.Session() as sess:
+            result = sess.run([mask, packed, unpacked, num_packed])
+        return energy, num_entries, features, result
+
+    def test_pack_and_unpack(self):
+        energy, num_entries, features, (mask, packed, unpacked, num_packed) = self._pack(self.n_vertices)
+
+        assert np.array_equal(num_packed, num_active_hits_numpy(num_entries, energy))
+        for i in range(self.n_batch):
+            active = np.logical_and(np.arange(self.n_vertices) < num_entries[i, 0], energy[i] != 0)
+            assert np.array_equal(mask[i], active)
+            assert np.array_equal(packed[i, 0:num_packed[i]], features[i, active])
+            assert np.all(packed[i, num_packed[i]:] == 0)
+        assert np.array_equal(unpacked, features * mask[:, :, np.newaxis])
+
+    def test_short_length(self):
+        length = 5
+        energy, num_entries, features, (mask, packed, unpacked, num_packed) = self._pack(length)
+
+        assert packed.shape == (self.n_batch, length, 3)
+        for i in range(self.n_batch):
+            active = np.where(mask[i])[0][0:length]
+            assert num_packed[i] == len(active)
+            assert np.array_equal(packed[i, 0:len(active)], features[i, active])
+            kept = np.zeros(self.n_vertices, dtype=bool)
+            kept[active] = True
+            assert np.array_equal(unpacked[i], features[i] * kept[:, np.newaxis])
+
+    def test_pack_indices(self):
+        energy, num_entries, _ = self._make_batch()
+        energy[:, 0:2] = 1.
+        num_entries[:] = self.n_vertices
+        seed_indices = np.zeros((self.n_batch, 2), dtype=np.int64)
+        for i in range(self.n_batch):
+            seed_indices[i] = np.random.choice(np.where(energy[i] != 0)[0], size=2, replace=False)
+
+        mask = active_hits_mask(tf.constant(num_entries), self.n_vertices, tf.constant(energy))
+        hit_rows, positions, _ = hit_packing(mask, self.n_vertices)
+        packed_seeds = pack_indices(tf.constant(seed_indices), positions)
+
+        with tf.Session() as sess:
+            hit_rows, packed_seeds = sess.run([hit_rows, packed_seeds])
+
+        assert packed_seeds.dtype == np.int64
+        for i in range(self.n_batch):
+            assert np.array_equal(hit_rows[i, packed_seeds[i]], seed_indices[i])
+
+
+if __name__ == '__main__':
+    unittest.main()
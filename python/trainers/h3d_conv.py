@@ -3,6 +3,7 @@ import numpy as np
 import os
 import configparser as cp
 from libs.helpers import get_num_parameters
+from readers.pipeline import read_file_paths, make_records_dataset, prefetch, get_pipeline_options
 from experiment.classification_model_test_result import ClassificationModelTestResult
 
 
@@ -35,6 +36,7 @@ class H3dConvTrainer:
         self.validation_files = self.config['validation_files_list']
         self.test_files = self.config['test_files_list']
         self.validate_after = int(self.config['validate_after'])
+        self.pipeline_options = get_pipeline_options(self.config)
 
     def initialize(self):
         model_type = self.config['model_type']
@@ -70,14 +72,13 @@ class H3dConvTrainer:
             parsed_features = tf.parse_single_example(example_proto, keys_to_features)
             return parsed_features['x'], parsed_features['labels_one_hot']
 
-        with open(files_list) as f:
-            content = f.readlines()
-        file_paths = [x.strip() for x in content]
-        dataset = tf.data.TFRecordDataset(file_paths, compression_type='GZIP')
-        dataset = dataset.map(_parse_function)
+        dataset = make_records_dataset(read_file_paths(files_list), _parse_function,
+                                       num_parallel_reads=self.pipeline_options['num_parallel_reads'],
+                                       num_parallel_calls=self.pipeline_options['num_parallel_calls'])
         dataset = dataset.shuffle(buffer_size=self.num_batch * 3 if shuffle_size is None else shuffle_size)
         dataset = dataset.repeat(None if repeat else 1)
         dataset = dataset.batch(self.num_batch)
+        dataset = prefetch(dataset, self.pipeline_options['prefetch_size'])
         iterator = dataset.make_one_shot_iterator()
         inputs = iterator.get_next()
 
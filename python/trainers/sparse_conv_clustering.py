@@ -12,22 +12,43 @@ from tensorflow.python.profiler.model_analyzer import Profiler
 from tensorflow.python.profiler import option_builder
 import time
 import sys
+import re
+import contextlib
+import multiprocessing
 
 from readers import ReaderFactory
+from readers.pipeline import get_pipeline_options
+from ops.neighbors import set_knn_block_size, set_knn_grid_cell_capacity, set_knn_approximate, set_knn_memoization
+from ops.sparse_conv_2 import set_edge_block_size, set_multipl_dense_block_size
+from ops.binning import set_sparse_voxels
+from ops.packing import num_active_hits_numpy
+from ops.allreduce import broadcast_variables
 from inference import InferenceOutputStreamer
 
 
 bb=10
 
+
+def _train_worker(config_file, config_name, worker_index):
+    SparseConvClusteringTrainer(config_file, config_name, worker_index).train()
+
+
 class SparseConvClusteringTrainer:
     def read_config(self, config_file_path, config_name):
         config_file = cp.ConfigParser()
         config_file.read(config_file_path)
         self.config = config_file[config_name]
 
-    def __init__(self, config_file, config_name):
+    def __init__(self, config_file, config_name, worker_index=None):
+        """
+        :param worker_index: Index of the worker process in data parallel training (see num_workers), None to train
+                             alone or to start the workers
+        """
         self.read_config(config_file, config_name)
+        self.config_file = config_file
         self.config_name = config_name
+        self.worker_index = worker_index
+        self.is_chief = worker_index is None or worker_index == 0
 
         self.from_scratch = int(self.config['from_scratch'])==1
         self.model_path = self.config['model_path']
@@ -63,6 +84,114 @@ class SparseConvClusteringTrainer:
                 raise RuntimeError("Setting plot after but haven't set the plotting input path")
         else:
             self.plot_after = -1
+        try:
+            self.in_graph_input = int(self.config['in_graph_input'])==1
+        except KeyError:
+            self.in_graph_input = False
+        try:
+            self.column_projection = int(self.config['reader_column_projection'])==1
+        except KeyError:
+            self.column_projection = False
+        try:
+            self.storage_dtype = tf.as_dtype(self.config['reader_storage_dtype'])
+        except KeyError:
+            self.storage_dtype = tf.float32
+        try:
+            self.bucket_lengths = [int(x) for x in self.config['bucket_lengths'].split(',')]
+        except KeyError:
+            self.bucket_lengths = None
+        if self.bucket_lengths is not None and self.in_graph_input:
+            raise RuntimeError("Bucketing needs a graph per bucket length, it can't be used with in_graph_input")
+        try:
+            self.pack_hits = int(self.config['pack_hits']) == 1
+        except KeyError:
+            self.pack_hits = False
+        try:
+            self.prune_energy_threshold = float(self.config['prune_energy_threshold'])
+        except KeyError:
+            self.prune_energy_threshold = None
+        try:
+            self.prune_time_threshold = float(self.config['prune_time_threshold'])
+            self.prune_time_index = int(self.config['prune_time_index'])
+        except KeyError:
+            self.prune_time_threshold = None
+            self.prune_time_index = None
+        try:
+            self.prune_in_place = int(self.config['prune_in_place']) == 1
+        except KeyError:
+            self.prune_in_place = False
+        try:
+            self.geometry = self.config['geometry']
+        except KeyError:
+            self.geometry = None
+        try:
+            set_knn_block_size(int(self.config['knn_block_size']))
+        except KeyError:
+            pass
+        try:
+            set_knn_grid_cell_capacity(int(self.config['knn_grid_cell_capacity']))
+        except KeyError:
+            pass
+        try:
+            try:
+                knn_approximate_window = int(self.config['knn_approximate_window'])
+            except KeyError:
+                knn_approximate_window = None
+            try:
+                knn_measure_recall = int(self.config['knn_measure_recall']) == 1
+            except KeyError:
+                knn_measure_recall = False
+            set_knn_approximate(int(self.config['knn_approximate_projections']), knn_approximate_window,
+                                knn_measure_recall)
+        except KeyError:
+            pass
+        try:
+            set_knn_memoization(int(self.config['knn_memoization']) == 1)
+        except KeyError:
+            pass
+        try:
+            set_edge_block_size(int(self.config['edge_block_size']))
+        except KeyError:
+            pass
+        try:
+            set_multipl_dense_block_size(int(self.config['multipl_dense_block_size']))
+        except KeyError:
+            pass
+        try:
+            set_sparse_voxels(int(self.config['binning_sparse_voxels']) == 1)
+        except KeyError:
+            pass
+        try:
+            self.xla_jit = int(self.config['xla_jit']) == 1
+        except KeyError:
+            self.xla_jit = False
+        try:
+            self.xla_jit_excluded_op_types = [x.strip() for x in self.config['xla_jit_exclude_ops'].split(',')
+                                              if len(x.strip()) != 0]
+        except KeyError:
+            self.xla_jit_excluded_op_types = []
+        try:
+            self.num_workers = int(self.config['num_workers'])
+        except KeyError:
+            self.num_workers = 1
+        try:
+            self.data_parallel_port = int(self.config['data_parallel_port'])
+        except KeyError:
+            self.data_parallel_port = 2222
+        try:
+            self.worker_threads = int(self.config['worker_threads'])
+        except KeyError:
+            self.worker_threads = max(1, multiprocessing.cpu_count() // self.num_workers)
+        if self.num_workers > 1:
+            if self.bucket_lengths is not None:
+                raise RuntimeError("The workers have to run the same graph in every step, bucketing can't be used "
+                                   "with num_workers")
+            if self.num_batch % self.num_workers != 0:
+                raise RuntimeError("The batch size has to be a multiple of num_workers")
+        if self.worker_index is not None:
+            # Every worker trains on its part of the batch, the models read the batch size from the config
+            self.num_batch = self.num_batch // self.num_workers
+            self.config['batch_size'] = str(self.num_batch)
 
 
 
@@ -73,44 +202,256 @@ class SparseConvClusteringTrainer:
         self.reader_type = self.config['reader_type'] if len(self.config['reader_type']) != 0 else "data_and_num_entries_reader"
 
         self.reader_factory = ReaderFactory()
+        self.pipeline_options = get_pipeline_options(self.config)
         self.model = None
 
-    def initialize(self):
+    def _set_model_input_feeds(self, input_feeds, split=False):
+        if input_feeds is None:
+            return
+        if split:
+            self.model.set_input_feeds_split(input_feeds[0:4], input_feeds[4],
+                                             input_feeds[5] if len(input_feeds) > 5 else None)
+        else:
+            self.model.set_input_feeds(input_feeds, self.spatial_features_indices, self.spatial_features_local_indices,
+                                       self.other_features_indices, self.target_indices)
+
+    def _set_model_hit_packing(self):
+        if self.pack_hits:
+            self.model.set_hit_packing(True)
+        # Pruning moves the kept hits to the front like hit packing, unless it's in place
+        pruning = self.prune_energy_threshold is not None or self.prune_time_threshold is not None
+        if pruning and not self.prune_in_place and not getattr(self.model, 'supports_hit_packing', True):
+            raise ValueError("%s depends on the order of the hits, it needs prune_in_place to prune them" %
+                             type(self.model).__name__)
+
+    def _set_model_geometry(self):
+        # The precomputed neighbours of the geometry are only valid for the raw cell positions of all the cells in
+        # the fixed sensor order, which packing and pruning change
+        pruning = self.prune_energy_threshold is not None or self.prune_time_threshold is not None
+        if self.geometry is None or self.pack_hits or pruning or \
+                not self.reader_factory.get_class(self.reader_type).sensor_order:
+            return
+        try:
+            self.model.set_geometry(self.geometry, self.spatial_features_indices)
+        except AttributeError:
+            pass
+
+    def _get_packed_lengths(self):
+        # With hit packing the buckets are the packed lengths of the model and the reader doesn't bucket
+        if self.bucket_lengths is None:
+            return None
+        return sorted(set(self.bucket_lengths + [self.num_max_entries]))
+
+    def _select_bucket(self, inputs):
+        """
+        Selects the graph of the model for a numpy batch of the reader: by the padded length of the batch, or by its
+        largest number of active hits with hit packing
+        """
+        if not self.pack_hits:
+            self.model.select_bucket(inputs[0].shape[1])
+            return
+        if self.column_projection:
+            energy, num_entries = inputs[2][:, :, 0], inputs[4]
+        else:
+            energy, num_entries = inputs[0][:, :, self.other_features_indices[0]], inputs[1]
+        self.model.select_packed_bucket(np.max(num_active_hits_numpy(num_entries, energy)))
+
+    def _set_model_data_parallel(self):
+        if self.worker_index is not None:
+            self.model.set_data_parallel(self.num_workers)
+
+    def _worker_device(self):
+        # In data parallel training every worker builds its graph on its own device
+        if self.worker_index is None:
+            return contextlib.suppress()
+        return tf.device('/job:worker/replica:0/task:%d/device:CPU:0' % self.worker_index)
+
+    def _make_session(self):
+        """
+        Makes the training session. A data parallel worker starts the server of its task in the local cluster of the
+        workers first, the allreduce of the gradients goes through it.
+        """
+        if self.worker_index is None:
+            return tf.Session()
+        session_config = tf.ConfigProto(intra_op_parallelism_threads=self.worker_threads,
+                                        inter_op_parallelism_threads=self.worker_threads)
+        session_config.experimental.collective_group_leader = '/job:worker/replica:0/task:0'
+        session_config.device_filters.append('/job:worker/task:%d' % self.worker_index)
+        cluster = tf.train.ClusterSpec({'worker': ['localhost:%d' % (self.data_parallel_port + i)
+                                                   for i in range(self.num_workers)]})
+        self._server = tf.train.Server(cluster, job_name='worker', task_index=self.worker_index,
+                                       config=session_config)
+        return tf.Session(self._server.target, config=session_config)
+
+    def _train_data_parallel(self):
+        """
+        Trains with num_workers worker processes. Every worker reads its shard of the training files, they average
+        their gradients in every step and only the first one (the chief) writes the summaries and the model.
+        """
+        context = multiprocessing.get_context('spawn')
+        workers = [context.Process(target=_train_worker, args=(self.config_file, self.config_name, i))
+                   for i in range(self.num_workers)]
+        for worker in workers:
+            worker.start()
+
+        # The other workers would wait forever in the allreduce of a worker which failed
+        failed = []
+        while len(failed) == 0 and any([worker.is_alive() for worker in workers]):
+            time.sleep(1)
+            failed = [i for i, worker in enumerate(workers) if worker.exitcode not in (None, 0)]
+        for worker in workers:
+            worker.terminate()
+            worker.join()
+        if len(failed) != 0:
+            raise RuntimeError("Data parallel worker %d failed with exit code %d" % (failed[0],
+                                                                                     workers[failed[0]].exitcode))
+
+    def _set_model_xla_jit(self):
+        if self.xla_jit:
+            self.model.set_xla_jit(True, self.xla_jit_excluded_op_types)
+
+    def _xla_jit_fallback(self, error):
+        """
+        Finds the op type for which the XLA compilation failed, from the nodes named in the error, and excludes it
+        from the compilation. If it can't be found, XLA is disabled.
+
+        :param error: The tf.errors.OpError of the first step
+        :return:
+        """
+        graph = tf.get_default_graph()
+        for node_name in re.findall(r'\{\{node ([^\s}]+)\}\}', error.message):
+            try:
+                op_type = graph.get_operation_by_name(node_name).type
+            except KeyError:
+                continue
+            if not op_type.startswith('_Xla') and op_type not in self.xla_jit_excluded_op_types:
+                print("XLA - compilation failed at %s (%s), running the %s ops without XLA" % (node_name, op_type,
+                                                                                               op_type))
+                self.xla_jit_excluded_op_types.append(op_type)
+                return
+        print("XLA - compilation failed, running the model without XLA:", error.message)
+        self.xla_jit = False
+
+    def initialize(self, input_feeds=None, bucket_lengths=None):
         self.model = ModelBuilder(self.config).get_model()
         self.model.config_name = self.config_name
+        self._set_model_input_feeds(input_feeds, split=self.column_projection)
+        if bucket_lengths is not None:
+            self.model.set_bucket_lengths(bucket_lengths)
         try:
             self.model.set_training(True)
         except AttributeError:
             pass
+        self._set_model_hit_packing()
+        self._set_model_geometry()
+        self._set_model_xla_jit()
+        self._set_model_data_parallel()
         self.model.initialize()
         self.saver_sparse = tf.train.Saver(tf.get_collection(tf.GraphKeys.GLOBAL_VARIABLES, self.model.get_variable_scope()))
 
-    def initialize_test(self):
+    def initialize_test(self, input_feeds=None):
         self.model = ModelBuilder(self.config).get_model()
         self.model.config_name = self.config_name
+        self._set_model_input_feeds(input_feeds)
         try:
             self.model.set_training(False)
         except AttributeError:
             pass
+        self._set_model_hit_packing()
+        self._set_model_geometry()
+        self._set_model_xla_jit()
 
         self.model.initialize()
         self.saver_sparse = tf.train.Saver(tf.get_collection(tf.GraphKeys.GLOBAL_VARIABLES, self.model.get_variable_scope()))
 
-    def initialize_profile(self):
+    def initialize_profile(self, input_feeds=None):
         self.config['batch_size'] = str(bb)
         self.model = ModelBuilder(self.config).get_model()
         self.config['batch_size'] = str(self.num_batch)
 
         self.model.config_name = self.config_name
+        self._set_model_input_feeds(input_feeds, split=self.column_projection)
         try:
             self.model.set_training(False)
         except AttributeError:
             pass
+        self._set_model_hit_packing()
+        self._set_model_geometry()
+        self._set_model_xla_jit()
 
         self.model.initialize()
         self.saver_sparse = tf.train.Saver(tf.get_collection(tf.GraphKeys.GLOBAL_VARIABLES, self.model.get_variable_scope()))
 
 
+    def _make_reader(self, files_list, num_batch=None, project_columns=False, bucketing=False, sharding=False):
+        """
+        :param project_columns: Let the reader split data into the input column groups if reader_column_projection
+                                is set. Testing keeps the full data since it is written to the output.
+        :param bucketing: Let the reader batch by bucket_lengths if they are set
+        :param sharding: Let the reader read only the files of this worker in data parallel training
+        """
+        reader = self.reader_factory.get_class(self.reader_type)(files_list, self.num_max_entries, self.num_data_dims,
+                                                                 self.num_batch if num_batch is None else num_batch)
+        reader.set_pipeline_options(**self.pipeline_options)
+        column_groups = None
+        if project_columns and self.column_projection:
+            column_groups = (self.spatial_features_indices, self.spatial_features_local_indices,
+                             self.other_features_indices, self.target_indices)
+        reader.set_data_format(column_groups=column_groups, storage_dtype=self.storage_dtype)
+        reader.set_hit_pruning(self.prune_energy_threshold, self.prune_time_threshold, self.other_features_indices[0],
+                               self.prune_time_index, self.prune_in_place)
+        reader.set_geometry(self.geometry)
+        if bucketing:
+            reader.set_bucketing(self.bucket_lengths)
+        if sharding and self.worker_index is not None:
+            reader.set_sharding(self.num_workers, self.worker_index)
+        return reader
+
+    def _get_train_graphs(self):
+        return self.model.get_placeholders(), self.model.get_losses(), self.model.get_optimizer(), \
+               self.model.get_summary(), self.model.get_summary_validation(), self.model.get_compute_graphs(), \
+               self.model.get_temp()
+
+    def _make_in_graph_input(self, readers_and_shuffle):
+        """
+        Makes one feedable iterator over the datasets of the given readers, so the model can be built directly on
+        the reader output and switch between e.g. training and validation data without copying batches to numpy.
+
+        :param readers_and_shuffle: List of (reader, shuffle) tuples. The readers must be of the same type.
+        :return: The input feeds and the string handle ops of the datasets in the same order
+        """
+        datasets = [reader.get_dataset(shuffle) for reader, shuffle in readers_and_shuffle]
+        self._input_handle = tf.placeholder(tf.string, shape=[], name='input_handle')
+        iterator = tf.data.Iterator.from_string_handle(self._input_handle, datasets[0].output_types,
+                                                       datasets[0].output_shapes)
+        handles = [dataset.make_one_shot_iterator().string_handle() for dataset in datasets]
+
+        return readers_and_shuffle[0][0].get_feeds_from_iterator(iterator), handles
+
+    def _get_feed_dict(self, placeholders, inputs, is_train, learning_rate, input_handle=None, split=False):
+        if inputs is None:
+            feed_dict = {self._input_handle: input_handle}
+        else:
+            if split:
+                column_groups, inputs_rest = inputs[0:4], inputs[4:]
+            else:
+                column_groups = [inputs[0][:, :, columns] for columns in
+                                 (self.spatial_features_indices, self.spatial_features_local_indices,
+                                  self.other_features_indices, self.target_indices)]
+                inputs_rest = inputs[1:]
+            feed_dict = {
+                placeholders[0]: column_groups[0],
+                placeholders[1]: column_groups[1],
+                placeholders[2]: column_groups[2],
+                placeholders[3]: column_groups[3],
+                placeholders[4]: inputs_rest[0],
+            }
+            if len(placeholders) != 5:
+                feed_dict[placeholders[5]] = inputs_rest[1]
+        feed_dict[self.model.is_train] = is_train
+        feed_dict[self.model.learning_rate] = learning_rate
+        return feed_dict
+
     def clean_summary_dir(self):
         print("Cleaning summary dir")
         for the_file in os.listdir(self.summary_path):
@@ -124,7 +465,13 @@ class SparseConvClusteringTrainer:
     def profile(self):
         global bb
         tf.reset_default_graph()
-        self.initialize_profile()
+        if self.in_graph_input:
+            inputs_feed, input_handles = self._make_in_graph_input(
+                [(self._make_reader(self.training_files, num_batch=bb, project_columns=True), True)])
+            self.initialize_profile(input_feeds=inputs_feed)
+        else:
+            self.initialize_profile()
+            inputs_feed = self._make_reader(self.training_files, num_batch=bb, project_columns=True).get_feeds()
         print("Beginning to profile network with parameters", get_num_parameters(self.model.get_variable_scope()))
         placeholders = self.model.get_placeholders()
 
@@ -132,9 +479,6 @@ class SparseConvClusteringTrainer:
 
         graph_output = self.model.get_compute_graphs()
 
-        inputs_feed = self.reader_factory.get_class(self.reader_type)(self.training_files, self.num_max_entries,
-                                                                      self.num_data_dims, bb).get_feeds()
-
         init = [tf.global_variables_initializer(), tf.local_variables_initializer()]
 
         session_conf = tf.ConfigProto(
@@ -151,34 +495,20 @@ class SparseConvClusteringTrainer:
             threads = tf.train.start_queue_runners(sess=sess, coord=coord)
 
 
+            if self.in_graph_input:
+                input_handle_train = sess.run(input_handles[0])
+
             iteration_number = 0
 
             print("Starting iterations")
             while iteration_number < 20:
 
-                inputs_train = sess.run(list(inputs_feed))
-
-                if len(placeholders) == 5:
-                    inputs_train_dict = {
-                        placeholders[0]: inputs_train[0][:, :, self.spatial_features_indices],
-                        placeholders[1]: inputs_train[0][:, :, self.spatial_features_local_indices],
-                        placeholders[2]: inputs_train[0][:, :, self.other_features_indices],
-                        placeholders[3]: inputs_train[0][:, :, self.target_indices],
-                        placeholders[4]: inputs_train[1],
-                        self.model.is_train: True,
-                        self.model.learning_rate: 1
-                    }
+                if self.in_graph_input:
+                    inputs_train_dict = self._get_feed_dict(placeholders, None, True, 1, input_handle_train)
                 else:
-                    inputs_train_dict = {
-                        placeholders[0]: inputs_train[0][:, :, self.spatial_features_indices],
-                        placeholders[1]: inputs_train[0][:, :, self.spatial_features_local_indices],
-                        placeholders[2]: inputs_train[0][:, :, self.other_features_indices],
-                        placeholders[3]: inputs_train[0][:, :, self.target_indices],
-                        placeholders[4]: inputs_train[1],
-                        placeholders[5]: inputs_train[2],
-                        self.model.is_train: True,
-                        self.model.learning_rate: 1
-                    }
+                    inputs_train = sess.run(list(inputs_feed))
+                    inputs_train_dict = self._get_feed_dict(placeholders, inputs_train, True, 1,
+                                                            split=self.column_projection)
                 run_meta = tf.RunMetadata()
                 start_time = time.time()
                 eval_output = sess.run(
@@ -217,11 +547,32 @@ class SparseConvClusteringTrainer:
             coord.join(threads)
 
     def train(self):
-        self.initialize()
+        if self.num_workers > 1 and self.worker_index is None:
+            self._train_data_parallel()
+            return
+
+        with self._worker_device():
+            if self.in_graph_input:
+                train_reader = self._make_reader(self.training_files, project_columns=True, sharding=True)
+                inputs_feed, input_handles = self._make_in_graph_input(
+                    [(train_reader, True), (self._make_reader(self.validation_files, project_columns=True), False)])
+                self.initialize(input_feeds=inputs_feed)
+            else:
+                train_reader = self._make_reader(self.training_files, project_columns=True,
+                                                 bucketing=not self.pack_hits, sharding=True)
+                inputs_feed = train_reader.get_feeds()
+                inputs_validation_feed = self._make_reader(self.validation_files, project_columns=True,
+                                                           bucketing=not self.pack_hits).get_feeds(shuffle=False)
+                if self.pack_hits:
+                    self.initialize(bucket_lengths=self._get_packed_lengths())
+                else:
+                    self.initialize(bucket_lengths=train_reader.bucket_lengths)
+            # The workers start from the variables of the chief
+            sync_variables = broadcast_variables(tf.global_variables(), self.num_workers, self.is_chief) \
+                if self.worker_index is not None else None
         print("Beginning to train network with parameters", get_num_parameters(self.model.get_variable_scope()))
-        placeholders = self. model.get_placeholders()
 
-        if self.from_scratch:
+        if self.from_scratch and self.is_chief:
             subprocess.call("mkdir -p %s"%(self.summary_path), shell=True)
             subprocess.call("mkdir -p %s"%(self.test_out_path), shell=True)
             subprocess.call("mkdir -p %s"%(os.path.join(self.test_out_path, 'ops')), shell=True)
@@ -234,31 +585,25 @@ class SparseConvClusteringTrainer:
                     continue
                 shutil.copy(os.path.join(ops_parent, ops_file), os.path.join(self.test_out_path, 'ops'))
 
-        graph_loss = self.model.get_losses()
-        graph_optmiser = self.model.get_optimizer()
-        graph_summary = self.model.get_summary()
-        graph_summary_validation = self.model.get_summary_validation()
-        graph_output = self.model.get_compute_graphs()
-        graph_temp = self.model.get_temp()
+        placeholders, graph_loss, graph_optmiser, graph_summary, graph_summary_validation, graph_output, graph_temp = \
+            self._get_train_graphs()
 
         if self.plot_after!=-1:
             data_plotting = None # TODO: Load
 
-        if self.from_scratch:
+        if self.from_scratch and self.is_chief:
             self.clean_summary_dir()
 
-        inputs_feed = self.reader_factory.get_class(self.reader_type)(self.training_files, self.num_max_entries, self.num_data_dims, self.num_batch).get_feeds()
-        inputs_validation_feed = self.reader_factory.get_class(self.reader_type)(self.validation_files, self.num_max_entries, self.num_data_dims, self.num_batch).get_feeds(shuffle=False)
-
-        init = [tf.global_variables_initializer(), tf.local_variables_initializer()]
+        with self._worker_device():
+            init = [tf.global_variables_initializer(), tf.local_variables_initializer()]
 
-        with tf.Session() as sess:
+        with self._make_session() as sess:
             sess.run(init)
 
             coord = tf.train.Coordinator()
             threads = tf.train.start_queue_runners(sess=sess, coord=coord)
 
-            summary_writer = tf.summary.FileWriter(self.summary_path, sess.graph)
+            summary_writer = tf.summary.FileWriter(self.summary_path, sess.graph) if self.is_chief else None
 
             if not self.from_scratch:
                 self.saver_sparse.restore(sess, self.model_path)
@@ -267,10 +612,22 @@ class SparseConvClusteringTrainer:
                     iteration_number = int(f.read())
             else:
                 iteration_number = 0
+            if sync_variables is not None:
+                sess.run(sync_variables)
+
+            if self.in_graph_input:
+                input_handle_train, input_handle_validation = sess.run(input_handles)
 
             print("Starting iterations")
+            # With XLA the first step of every graph (one per bucket) includes its compilation
+            xla_fallback = False
+            xla_compiled_graphs = set()
+            xla_first_steps_time = 0.
+            step_times = []
+            # Number of hits before and after the hit pruning of the reader, fetched with the training batches
+            graph_pruning_counts = train_reader.get_pruning_counts()
+            pruning_counts = np.zeros(2, dtype=np.int64)
             while iteration_number < self.train_for_iterations:
-                inputs_train = sess.run(list(inputs_feed))
                 learning_rate=1
                 if hasattr(self.model, "learningrate_scheduler"):
                     learning_rate = self.model.learningrate_scheduler.get_lr(iteration_number)
@@ -278,70 +635,94 @@ class SparseConvClusteringTrainer:
                     learning_rate=self.model.learning_rate
                 if iteration_number==0:
                     print('learning rate ', learning_rate)
- 
-                if len(placeholders)==5:
-                    inputs_train_dict = {
-                        placeholders[0]: inputs_train[0][:, :, self.spatial_features_indices],
-                        placeholders[1]: inputs_train[0][:, :, self.spatial_features_local_indices],
-                        placeholders[2]: inputs_train[0][:, :, self.other_features_indices],
-                        placeholders[3]: inputs_train[0][:, :, self.target_indices],
-                        placeholders[4]: inputs_train[1],
-                        self.model.is_train: True,
-                        self.model.learning_rate : learning_rate
-                    }
+
+                if self.in_graph_input:
+                    inputs_train_dict = self._get_feed_dict(placeholders, None, True, learning_rate, input_handle_train)
                 else:
-                    inputs_train_dict = {
-                        placeholders[0]: inputs_train[0][:, :, self.spatial_features_indices],
-                        placeholders[1]: inputs_train[0][:, :, self.spatial_features_local_indices],
-                        placeholders[2]: inputs_train[0][:, :, self.other_features_indices],
-                        placeholders[3]: inputs_train[0][:, :, self.target_indices],
-                        placeholders[4]: inputs_train[1],
-                        placeholders[5]: inputs_train[2],
-                        self.model.is_train: True,
-                        self.model.learning_rate : learning_rate
-                    }
-
-                t, eval_loss, _, eval_summary, eval_output = sess.run([graph_temp, graph_loss, graph_optmiser, graph_summary, graph_output], feed_dict=inputs_train_dict)
+                    inputs_train = sess.run(list(inputs_feed) + (
+                        [graph_pruning_counts] if graph_pruning_counts is not None else []))
+                    if graph_pruning_counts is not None:
+                        pruning_counts += inputs_train.pop()
+                    if self.bucket_lengths is not None:
+                        self._select_bucket(inputs_train)
+                        placeholders, graph_loss, graph_optmiser, graph_summary, graph_summary_validation, \
+                        graph_output, graph_temp = self._get_train_graphs()
+                    inputs_train_dict = self._get_feed_dict(placeholders, inputs_train, True, learning_rate,
+                                                            split=self.column_projection)
+
+                step_start = time.time()
+                try:
+                    eval_step = sess.run([graph_temp, graph_loss, graph_optmiser, graph_summary, graph_output] + (
+                        [graph_pruning_counts] if self.in_graph_input and graph_pruning_counts is not None else []),
+                                         feed_dict=inputs_train_dict)
+                except tf.errors.OpError as error:
+                    # Only the first step of every graph (bucket) is retried, with a new graph without the failing
+                    # op type in XLA. The data parallel workers can't restart on their own.
+                    if not self.xla_jit or graph_loss in xla_compiled_graphs or self.worker_index is not None:
+                        raise
+                    self._xla_jit_fallback(error)
+                    xla_fallback = True
+                    if iteration_number != 0:
+                        # The new graph continues from here
+                        self.saver_sparse.save(sess, self.model_path)
+                        with open(self.model_path + '.txt', 'w') as f:
+                            f.write(str(iteration_number))
+                        self.from_scratch = False
+                    break
+                step_time = time.time() - step_start
+                t, eval_loss, _, eval_summary, eval_output = eval_step[0:5]
+                if len(eval_step) > 5:
+                    pruning_counts += eval_step[5]
+
+                if self.xla_jit:
+                    if graph_loss in xla_compiled_graphs:
+                        step_times.append(step_time)
+                    else:
+                        xla_compiled_graphs.add(graph_loss)
+                        xla_first_steps_time += step_time
 
                 if self.plot_after != -1:
                     if iteration_number % self.plot_after == 0:
                         pass
 
-                if iteration_number % self.validate_after == 0:
-                    inputs_validation = sess.run(list(inputs_validation_feed))
-                    self.inputs_plot=inputs_validation
-
-                    if len(placeholders) == 5:
-                        inputs_validation_dict = {
-                            placeholders[0]: inputs_validation[0][:, :, self.spatial_features_indices],
-                            placeholders[1]: inputs_validation[0][:, :, self.spatial_features_local_indices],
-                            placeholders[2]: inputs_validation[0][:, :, self.other_features_indices],
-                            placeholders[3]: inputs_validation[0][:, :, self.target_indices],
-                            placeholders[4]: inputs_validation[1],
-                            self.model.is_train: False,
-                            self.model.learning_rate : learning_rate
-                        }
+                if iteration_number % self.validate_after == 0 and self.is_chief:
+                    if self.in_graph_input:
+                        inputs_validation_dict = self._get_feed_dict(placeholders, None, False, learning_rate,
+                                                                     input_handle_validation)
+                    else:
+                        inputs_validation = sess.run(list(inputs_validation_feed))
+                        self.inputs_plot=inputs_validation
+                        if self.bucket_lengths is not None:
+                            self._select_bucket(inputs_validation)
+                            placeholders, graph_loss, graph_optmiser, graph_summary, graph_summary_validation, \
+                            graph_output, graph_temp = self._get_train_graphs()
+                        inputs_validation_dict = self._get_feed_dict(placeholders, inputs_validation, False,
+                                                                     learning_rate, split=self.column_projection)
+
+                    graph_knn_recall = self.model.get_knn_recall()
+                    if graph_knn_recall is None:
+                        eval_loss_validation, eval_summary_validation= sess.run([graph_loss, graph_summary_validation], feed_dict=inputs_validation_dict)
                     else:
-                        inputs_validation_dict = {
-                            placeholders[0]: inputs_validation[0][:, :, self.spatial_features_indices],
-                            placeholders[1]: inputs_validation[0][:, :, self.spatial_features_local_indices],
-                            placeholders[2]: inputs_validation[0][:, :, self.other_features_indices],
-                            placeholders[3]: inputs_validation[0][:, :, self.target_indices],
-                            placeholders[4]: inputs_validation[1],
-                            placeholders[5]: inputs_validation[2],
-                            self.model.is_train: False,
-                            self.model.learning_rate : learning_rate
-                        }
-
-                    eval_loss_validation, eval_summary_validation= sess.run([graph_loss, graph_summary_validation], feed_dict=inputs_validation_dict)
+                        eval_loss_validation, eval_summary_validation, eval_knn_recall = sess.run(
+                            [graph_loss, graph_summary_validation, graph_knn_recall], feed_dict=inputs_validation_dict)
+                        print("Validation - Iteration %4d: knn recall %.4f" % (iteration_number, eval_knn_recall))
                     summary_writer.add_summary(eval_summary_validation, iteration_number)
                     print("Validation - Iteration %4d: loss %.6E" % (iteration_number, eval_loss_validation))
-
-                print("Training   - Iteration %4d: loss %0.6E" % (iteration_number, eval_loss))
-                print(t[0])
+                    if graph_pruning_counts is not None:
+                        print("Hit pruning - kept %d of %d hits (%.1f%%)" % (
+                            pruning_counts[1], pruning_counts[0], 100. * pruning_counts[1] / max(pruning_counts[0], 1)))
+                    if self.xla_jit and len(step_times) != 0:
+                        print("XLA - compilation %.3f s (first steps of %d graphs less the mean step), mean step "
+                              "%.5f s" % (xla_first_steps_time - len(xla_compiled_graphs) * np.mean(step_times),
+                                          len(xla_compiled_graphs), np.mean(step_times)))
+
+                if self.is_chief:
+                    print("Training   - Iteration %4d: loss %0.6E" % (iteration_number, eval_loss))
+                    print(t[0])
                 iteration_number += 1
-                summary_writer.add_summary(eval_summary, iteration_number)
-                if iteration_number % self.save_after_iterations == 0:
+                if self.is_chief:
+                    summary_writer.add_summary(eval_summary, iteration_number)
+                if iteration_number % self.save_after_iterations == 0 and self.is_chief:
                     print("\n\nINFO: Saving model\n\n")
                     self.saver_sparse.save(sess, self.model_path)
                     with open(self.model_path + '.txt', 'w') as f:
@@ -353,8 +734,34 @@ class SparseConvClusteringTrainer:
             # Wait for threads to stop
             coord.join(threads)
 
+        if xla_fallback:
+            tf.reset_default_graph()
+            self.train()
+
+    def _make_test_input(self):
+        if self.in_graph_input:
+            inputs_feed, input_handles = self._make_in_graph_input([(self._make_reader(self.test_files), False)])
+            self.initialize_test(input_feeds=inputs_feed)
+        else:
+            self.initialize_test()
+            inputs_feed, input_handles = self._make_reader(self.test_files).get_feeds(shuffle=False), None
+        return inputs_feed, input_handles
+
+    def _run_test_step(self, sess, graphs, placeholders, inputs_feed, input_handle):
+        """
+        Runs graphs on the next test batch. Returns the numpy inputs of the batch and the graph outputs.
+        """
+        if self.in_graph_input:
+            inputs_test_dict = self._get_feed_dict(placeholders, None, False, 0, input_handle)
+            eval_out = sess.run(list(inputs_feed) + graphs, feed_dict=inputs_test_dict)
+            return eval_out[0:len(inputs_feed)], eval_out[len(inputs_feed):]
+        else:
+            inputs_test = sess.run(list(inputs_feed))
+            inputs_test_dict = self._get_feed_dict(placeholders, inputs_test, False, 0)
+            return inputs_test, sess.run(graphs, feed_dict=inputs_test_dict)
+
     def visualize(self):
-        self.initialize_test()
+        inputs_feed, input_handles = self._make_test_input()
         print("Beginning to visualize network with parameters", get_num_parameters(self.model.get_variable_scope()))
         placeholders = self. model.get_placeholders()
         graph_loss = self.model.get_losses()
@@ -362,8 +769,6 @@ class SparseConvClusteringTrainer:
         graph_temp = self.model.get_temp()
         layer_feats = self.model.temp_feat_visualize
 
-        inputs_feed = self.reader_factory.get_class(self.reader_type)(self.test_files, self.num_max_entries, self.num_data_dims, self.num_batch).get_feeds(shuffle=False)
-
         init = [tf.global_variables_initializer(), tf.local_variables_initializer()]
         with tf.Session() as sess:
             sess.run(init)
@@ -374,34 +779,14 @@ class SparseConvClusteringTrainer:
             self.saver_sparse.restore(sess, self.model_path)
             print("\n\nINFO: Loading model", self.model_path,"\n\n")
 
+            input_handle = sess.run(input_handles[0]) if self.in_graph_input else None
+
             print("Starting visualizing")
             iteration_number = 0
             while iteration_number < int(np.ceil(self.num_testing_samples / self.num_batch)):
-                inputs_test = sess.run(list(inputs_feed))
                 print("Run")
-
-                if len(placeholders)==5:
-                    inputs_train_dict = {
-                        placeholders[0]: inputs_test[0][:, :, self.spatial_features_indices],
-                        placeholders[1]: inputs_test[0][:, :, self.spatial_features_local_indices],
-                        placeholders[2]: inputs_test[0][:, :, self.other_features_indices],
-                        placeholders[3]: inputs_test[0][:, :, self.target_indices],
-                        placeholders[4]: inputs_test[1],
-                        self.model.is_train: False,
-                        self.model.learning_rate : 0
-                    }
-                else:
-                    inputs_train_dict = {
-                        placeholders[0]: inputs_test[0][:, :, self.spatial_features_indices],
-                        placeholders[1]: inputs_test[0][:, :, self.spatial_features_local_indices],
-                        placeholders[2]: inputs_test[0][:, :, self.other_features_indices],
-                        placeholders[3]: inputs_test[0][:, :, self.target_indices],
-                        placeholders[4]: inputs_test[1],
-                        placeholders[5]: inputs_test[2],
-                        self.model.is_train: False,
-                        self.model.learning_rate : 0
-                    }
-                eval_out = sess.run([graph_temp, graph_loss, graph_output]+layer_feats, feed_dict=inputs_train_dict)
+                inputs_test, eval_out = self._run_test_step(sess, [graph_temp, graph_loss, graph_output]+layer_feats,
+                                                            placeholders, inputs_feed, input_handle)
                 layer_outs = eval_out[3:]
                 prediction = eval_out[2]
 
@@ -435,7 +820,7 @@ class SparseConvClusteringTrainer:
             coord.join(threads)
 
     def test(self):
-        self.initialize_test()
+        inputs_feed, input_handles = self._make_test_input()
         print("Beginning to test network with parameters", get_num_parameters(self.model.get_variable_scope()))
         placeholders = self. model.get_placeholders()
         graph_loss = self.model.get_losses()
@@ -445,8 +830,6 @@ class SparseConvClusteringTrainer:
         graph_output = self.model.get_compute_graphs()
         graph_temp = self.model.get_temp()
 
-        inputs_feed = self.reader_factory.get_class(self.reader_type)(self.test_files, self.num_max_entries, self.num_data_dims, self.num_batch).get_feeds(shuffle=False)
-
         inference_streamer = InferenceOutputStreamer(output_path=self.test_out_path, cache_size=100)
         inference_streamer.start_thread()
 
@@ -460,33 +843,13 @@ class SparseConvClusteringTrainer:
             self.saver_sparse.restore(sess, self.model_path)
             print("\n\nINFO: Loading model", self.model_path,"\n\n")
 
+            input_handle = sess.run(input_handles[0]) if self.in_graph_input else None
+
             print("Starting testing")
             iteration_number = 0
             while iteration_number < int(np.ceil(self.num_testing_samples / self.num_batch)):
-                inputs_test = sess.run(list(inputs_feed))
-
-                if len(placeholders)==5:
-                    inputs_train_dict = {
-                        placeholders[0]: inputs_test[0][:, :, self.spatial_features_indices],
-                        placeholders[1]: inputs_test[0][:, :, self.spatial_features_local_indices],
-                        placeholders[2]: inputs_test[0][:, :, self.other_features_indices],
-                        placeholders[3]: inputs_test[0][:, :, self.target_indices],
-                        placeholders[4]: inputs_test[1],
-                        self.model.is_train: False,
-                        self.model.learning_rate : 0
-                    }
-                else:
-                    inputs_train_dict = {
-                        placeholders[0]: inputs_test[0][:, :, self.spatial_features_indices],
-                        placeholders[1]: inputs_test[0][:, :, self.spatial_features_local_indices],
-                        placeholders[2]: inputs_test[0][:, :, self.other_features_indices],
-                        placeholders[3]: inputs_test[0][:, :, self.target_indices],
-                        placeholders[4]: inputs_test[1],
-                        placeholders[5]: inputs_test[2],
-                        self.model.is_train: False,
-                        self.model.learning_rate : 0
-                    }
-                t, eval_loss, eval_output = sess.run([graph_temp, graph_loss, graph_output], feed_dict=inputs_train_dict)
+                inputs_test, (t, eval_loss, eval_output) = self._run_test_step(
+                    sess, [graph_temp, graph_loss, graph_output], placeholders, inputs_feed, input_handle)
 
                 print("Adding", len(inputs_test[0]), "test results")
                 for i in range(len(inputs_test[0])):